@@ -0,0 +1,78 @@
+"""
+Regression benchmark for the cached day metrics (max_fields, total_events, ...).
+
+Writes the data sheet of tournaments with a growing number of teams and counts how often
+the metrics of an EventBlock had to be computed. With caching, this number only depends on
+the number of blocks, not on teams x days.
+
+Run from the repository root:
+    python benchmarks/bench_export_metrics.py
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src/')))
+
+import xlsxwriter
+
+from core import Category, Team, EventBlock
+from model.model import Model
+from utils.scheduler.scheduler import create_schedule
+from utils.tourn_to_excel.data_sheets_writer import DataSheetsWriter
+
+
+def create_model(num_teams: int, teams_per_cat: int = 10, num_days: int = 4) -> Model:
+    model = Model()
+    model.set_days([{"Title": f"Day {i + 1}", "Date": "", "Location": "", "Start time": "08:00"} for i in range(num_days)])
+    cats = []
+    for cat_idx in range(num_teams // teams_per_cat):
+        teams = [Team(f"cat{cat_idx}_team{i}", "#FFFFFF", None) for i in range(teams_per_cat)]
+        cats.append(Category(f"Cat {cat_idx}", str(cat_idx % 2 + 1), num_days, teams))
+    model.set_categories(cats)
+    model.set_group_info({group: {"match_dur": 12, "num_fields": 4, "double_missions": "empty_field"} for group in ["1", "2"]})
+    with contextlib.redirect_stdout(io.StringIO()):
+        model.set_tournament_generated(create_schedule(model))
+    return model
+
+
+def count_metric_computations(func) -> int:
+    counter = [0]
+    original = EventBlock._compute_metrics
+
+    def counting(block):
+        counter[0] += 1
+        return original(block)
+
+    EventBlock._compute_metrics = counting
+    try:
+        func()
+    finally:
+        EventBlock._compute_metrics = original
+    return counter[0]
+
+
+def run():
+    print(f"{'teams':>6} {'days':>5} {'events':>7} {'blocks':>7} {'computations':>13} {'time [s]':>9}")
+    for num_teams in [20, 40, 80, 160]:
+        model = create_model(num_teams)
+        days = model.get_tournament_generated()
+        for day in days:
+            for block in day.blocks:
+                block.touch()   # Start without cached metrics
+
+        wb = xlsxwriter.Workbook(io.BytesIO(), {"in_memory": True})
+        writer = DataSheetsWriter(wb, model)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            computations = count_metric_computations(writer.write_data_sheet_to_excel)
+        duration = time.perf_counter() - start
+
+        num_events = sum(day.total_events() for day in days)
+        num_blocks = sum(len(day.blocks) for day in days)
+        print(f"{num_teams:>6} {len(days):>5} {num_events:>7} {num_blocks:>7} {computations:>13} {duration:>9.3f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,91 @@
+"""
+Memory benchmark for scheduling and loading a large tournament (500 teams, 6 days).
+
+Reports the peak memory traced by tracemalloc while scheduling, while loading the saved
+tournament and the memory retained by the loaded tournament, together with the number of
+distinct Team instances referenced by its matches. Only the public API is used, so the
+script can be run against older revisions as well to compare the numbers.
+
+Run from the repository root:
+    python benchmarks/bench_memory.py
+"""
+import contextlib
+import gc
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src/')))
+
+from core import Category, MatchEvent, Team
+from model.model import Model
+from utils.scheduler.scheduler import create_schedule
+
+NUM_TEAMS = 500
+TEAMS_PER_CAT = 10
+NUM_DAYS = 6
+NUM_GROUPS = 5
+
+
+def create_model() -> Model:
+    model = Model()
+    model.set_days([{"Title": f"Day {i + 1}", "Date": "", "Location": "", "Start time": "08:00"} for i in range(NUM_DAYS)])
+    cats = []
+    for cat_idx in range(NUM_TEAMS // TEAMS_PER_CAT):
+        teams = [Team(f"cat{cat_idx}_team{i}", "#FFFFFF", None) for i in range(TEAMS_PER_CAT)]
+        cats.append(Category(f"Cat {cat_idx}", str(cat_idx % NUM_GROUPS + 1), 2, teams))
+    model.set_categories(cats)
+    model.set_group_info({str(group + 1): {"match_dur": 12, "num_fields": 6, "double_missions": "empty_field"}
+                          for group in range(NUM_GROUPS)})
+    return model
+
+
+def count_team_instances(days) -> int:
+    instances = set()
+    for day in days:
+        for ev in day.get_all_valid_events():
+            if isinstance(ev, MatchEvent):
+                for match in ev.matches:
+                    instances.add(id(match.team1))
+                    instances.add(id(match.team2))
+    return len(instances)
+
+
+def traced(func):
+    """Returns (result, peak MiB, retained MiB, seconds) of func."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak / 2**20, current / 2**20, seconds
+
+
+def run():
+    model = create_model()
+    with contextlib.redirect_stdout(io.StringIO()):
+        days, schedule_peak, _, schedule_time = traced(lambda: create_schedule(model))
+    model.set_tournament_generated(days)
+    saved = json.dumps(model.to_serializable_dict())
+
+    def load():
+        loaded = Model()
+        loaded.set_data(json.loads(saved))
+        return loaded
+
+    loaded, load_peak, load_retained, load_time = traced(load)
+    num_matches = sum(day.total_matches() for day in loaded.get_tournament_generated())
+
+    print(f"teams: {NUM_TEAMS}, days: {NUM_DAYS}, matches: {num_matches}, saved file: {len(saved) / 2**20:.1f} MiB")
+    print(f"{'step':<10} {'peak [MiB]':>11} {'retained [MiB]':>15} {'time [s]':>9}")
+    print(f"{'schedule':<10} {schedule_peak:>11.1f} {'':>15} {schedule_time:>9.2f}")
+    print(f"{'load':<10} {load_peak:>11.1f} {load_retained:>15.1f} {load_time:>9.2f}")
+    print(f"distinct Team instances in loaded matches: {count_team_instances(loaded.get_tournament_generated())}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,234 @@
+"""
+Benchmark suite for create_schedule on synthetic models (see synthetic.py).
+
+For every scenario the wall time and the peak memory (tracemalloc) of create_schedule are
+recorded, together with the time, number of calls and peak memory of create_n_rr_runs and of
+each double-mission pass. Timings are the best of --repeat runs without tracemalloc, memory
+is measured in a separate run. Passes which do not exist in the scheduler under test are
+skipped, so the same script can be run against older versions.
+
+Run from the repository root:
+    python benchmarks/bench_scheduler.py --output results.json
+    python benchmarks/bench_scheduler.py --compare old.json new.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, replace
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src/')))
+
+from synthetic import SyntheticSpec, create_model
+from utils.scheduler import scheduler
+
+# Functions of the scheduler module which are timed separately
+PASSES = [
+    "create_n_rr_runs",
+    "has_double_missions",
+    "remove_double_missions_with_empty_field",
+    "resolve_parallel_double_missions",
+    "insert_pauses_for_sequential_double_missions",
+    "resolve_double_missions_with_pauses",
+    "optimize_block",
+    "pack_matches",
+    "enforce_min_rest",
+    "balance_fields",
+]
+
+BASE = SyntheticSpec("base", num_categories=6, teams_per_category=8, runs=2, num_groups=2, num_days=2, num_fields=3)
+
+SCENARIOS = [
+    BASE,
+    replace(BASE, name="teams_per_category_16", teams_per_category=16),
+    replace(BASE, name="teams_per_category_32", teams_per_category=32),
+    replace(BASE, name="categories_24", num_categories=24),
+    replace(BASE, name="runs_6", runs=6),
+    replace(BASE, name="groups_6", num_categories=12, num_groups=6),
+    replace(BASE, name="days_6", runs=6, num_days=6),
+    replace(BASE, name="fields_8", num_fields=8),
+    replace(BASE, name="other_events_6", other_events_per_group=6),
+    replace(BASE, name="shuffled", shuffle_seed="42"),
+    replace(BASE, name="empty_field", double_missions="empty_field"),
+    replace(BASE, name="pause", double_missions="pause"),
+    SyntheticSpec("large_empty_field", num_categories=48, teams_per_category=10, runs=4, num_groups=6, num_days=4,
+                  num_fields=6, other_events_per_group=3, double_missions="empty_field"),
+    SyntheticSpec("large_pause", num_categories=48, teams_per_category=10, runs=4, num_groups=6, num_days=4,
+                  num_fields=6, other_events_per_group=3, double_missions="pause"),
+    # One group of 64 teams on 6 fields: the double mission passes dominate
+    SyntheticSpec("teams_64_fields_6_empty_field", num_categories=1, teams_per_category=64, runs=2, num_groups=1,
+                  num_days=2, num_fields=6, double_missions="empty_field"),
+    SyntheticSpec("teams_64_fields_6_pause", num_categories=1, teams_per_category=64, runs=2, num_groups=1,
+                  num_days=2, num_fields=6, double_missions="pause"),
+    # Few teams per group: many double missions, where reordering the matches pays off
+    SyntheticSpec("tight_pause", num_categories=6, teams_per_category=8, runs=4, num_groups=6, num_days=2,
+                  num_fields=2, double_missions="pause"),
+    SyntheticSpec("tight_pause_optimized", num_categories=6, teams_per_category=8, runs=4, num_groups=6, num_days=2,
+                  num_fields=2, double_missions="pause", optimize=True),
+    SyntheticSpec("tight_pack", num_categories=6, teams_per_category=8, runs=4, num_groups=6, num_days=2,
+                  num_fields=2, double_missions="pack"),
+    SyntheticSpec("tight_min_rest_2", num_categories=6, teams_per_category=8, runs=4, num_groups=6, num_days=2,
+                  num_fields=2, double_missions="empty_field", min_rest=2),
+    SyntheticSpec("large_min_rest_2", num_categories=48, teams_per_category=10, runs=4, num_groups=6, num_days=4,
+                  num_fields=6, other_events_per_group=3, double_missions="pause", min_rest=2),
+    SyntheticSpec("large_balance_fields", num_categories=48, teams_per_category=10, runs=4, num_groups=6, num_days=4,
+                  num_fields=6, other_events_per_group=3, double_missions="pause", balance_fields=True),
+    # Open categories, too large for a round robin
+    SyntheticSpec("swiss_100_teams", num_categories=2, teams_per_category=100, runs=7, num_groups=1, num_days=1,
+                  num_fields=6, double_missions="empty_field", mode="swiss"),
+]
+
+
+class PassRecorder:
+    """Wraps the functions of the scheduler module to record calls, time and peak memory."""
+
+    def __init__(self, trace_memory: bool):
+        self.trace_memory = trace_memory
+        self.stats = {}
+        self.max_peak = 0
+
+    def wrap(self, name, func):
+        def wrapper(*args, **kwargs):
+            if self.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                self.max_peak = max(self.max_peak, peak)
+                tracemalloc.reset_peak()
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            seconds = time.perf_counter() - start
+            entry = self.stats.setdefault(name, {"calls": 0, "time_s": 0.0, "peak_mib": 0.0})
+            entry["calls"] += 1
+            entry["time_s"] += seconds
+            if self.trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                self.max_peak = max(self.max_peak, peak)
+                entry["peak_mib"] = max(entry["peak_mib"], (peak - current) / 2**20)
+            return result
+        return wrapper
+
+
+def run_schedule(spec: SyntheticSpec, trace_memory: bool):
+    """Returns (seconds, peak MiB or None, pass stats, number of events, minutes of all days) of one
+    create_schedule run."""
+    model = create_model(spec)
+    recorder = PassRecorder(trace_memory)
+    originals = {name: getattr(scheduler, name) for name in PASSES if hasattr(scheduler, name)}
+    for name, func in originals.items():
+        setattr(scheduler, name, recorder.wrap(name, func))
+    try:
+        if trace_memory:
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            tournament = scheduler.create_schedule(model)
+        seconds = time.perf_counter() - start
+        peak_mib = None
+        if trace_memory:
+            recorder.max_peak = max(recorder.max_peak, tracemalloc.get_traced_memory()[1])
+            peak_mib = (recorder.max_peak - baseline) / 2**20
+            tracemalloc.stop()
+    finally:
+        for name, func in originals.items():
+            setattr(scheduler, name, func)
+    num_events = sum(day.total_events() for day in tournament)
+    minutes = sum(day.total_duration() for day in tournament)
+    return seconds, peak_mib, recorder.stats, num_events, minutes
+
+
+def run_scenario(spec: SyntheticSpec, repeat: int) -> dict:
+    best = None
+    for _ in range(repeat):
+        seconds, _, stats, num_events, minutes = run_schedule(spec, trace_memory=False)
+        if best is None or seconds < best[0]:
+            best = (seconds, stats, num_events, minutes)
+    seconds, stats, num_events, minutes = best
+    _, peak_mib, memory_stats, _, _ = run_schedule(spec, trace_memory=True)
+
+    passes = {}
+    for name, entry in stats.items():
+        passes[name] = {
+            "calls": entry["calls"],
+            "time_s": round(entry["time_s"], 6),
+            "peak_mib": round(memory_stats.get(name, {}).get("peak_mib", 0.0), 4)
+        }
+    return {
+        "name": spec.name,
+        "spec": asdict(spec),
+        "num_events": num_events,
+        "minutes": minutes,
+        "create_schedule": {"time_s": round(seconds, 6), "peak_mib": round(peak_mib, 4)},
+        "passes": passes
+    }
+
+
+def get_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return ""
+
+
+def print_results(results: list) -> None:
+    print(f"{'scenario':<30} {'events':>7} {'minutes':>8} {'time [s]':>9} {'peak [MiB]':>11}  slowest pass")
+    for r in results:
+        slowest = max(r["passes"].items(), key=lambda item: item[1]["time_s"], default=None)
+        slowest_str = f"{slowest[0]} ({slowest[1]['time_s']:.4f} s)" if slowest else ""
+        print(f"{r['name']:<30} {r['num_events']:>7} {r.get('minutes', ''):>8} {r['create_schedule']['time_s']:>9.4f} "
+              f"{r['create_schedule']['peak_mib']:>11.2f}  {slowest_str}")
+
+
+def compare(old_path: str, new_path: str) -> None:
+    with open(old_path, encoding="utf-8") as f:
+        old = {r["name"]: r for r in json.load(f)["results"]}
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)["results"]
+    print(f"{'scenario':<30} {'old [s]':>9} {'new [s]':>9} {'speedup':>8} {'old [MiB]':>10} {'new [MiB]':>10}")
+    for r in new:
+        if r["name"] not in old:
+            continue
+        o = old[r["name"]]["create_schedule"]
+        n = r["create_schedule"]
+        speedup = o["time_s"] / n["time_s"] if n["time_s"] > 0 else float("inf")
+        print(f"{r['name']:<30} {o['time_s']:>9.4f} {n['time_s']:>9.4f} {speedup:>7.2f}x "
+              f"{o['peak_mib']:>10.2f} {n['peak_mib']:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs per scenario (best is kept)")
+    parser.add_argument("--filter", default="", help="Only run scenarios whose name contains this string")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two result files")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    results = [run_scenario(spec, args.repeat) for spec in SCENARIOS if args.filter in spec.name]
+    print_results(results)
+    if args.output:
+        data = {
+            "meta": {
+                "revision": get_revision(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "repeat": args.repeat
+            },
+            "results": results
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Parametric generator of synthetic tournament models for the benchmarks.
+
+Only the public Model API is used, so the generator works across versions of the scheduler.
+"""
+import os
+import sys
+from dataclasses import dataclass
+from typing import Optional
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src/')))
+
+from core import Category, OtherEvent, Team
+from model.model import Model
+
+
+@dataclass
+class SyntheticSpec:
+    name: str
+    num_categories: int = 6
+    teams_per_category: int = 8
+    runs: int = 2
+    num_groups: int = 2
+    num_days: int = 2
+    num_fields: int = 3
+    match_dur: int = 12
+    other_events_per_group: int = 0    # Cycles through before, during and after events
+    double_missions: Optional[str] = None   # None, "empty_field", "pause" or "pack"
+    pause_dur: int = 6
+    optimize: bool = False              # Reorder the matches of every block (block_optimizer)
+    min_rest: int = 0                   # Minimum rest in slots between two matches of a team (0: off)
+    balance_fields: bool = False        # Spread the matches of every team across the fields (field_balancing)
+    mode: str = "round_robin"           # Mode of all categories ("swiss": runs is the number of rounds)
+    shuffle_seed: Optional[str] = None
+
+
+def create_model(spec: SyntheticSpec) -> Model:
+    model = Model()
+    model.set_days([{"Title": f"Day {i + 1}", "Date": "", "Location": "", "Start time": "08:00"}
+                    for i in range(spec.num_days)])
+
+    # Categories are assigned to the groups in turns
+    cats = []
+    for cat_idx in range(spec.num_categories):
+        teams = [Team(f"cat{cat_idx}_team{i}", "#FFFFFF", None) for i in range(spec.teams_per_category)]
+        cats.append(Category(f"Cat {cat_idx}", str(cat_idx % spec.num_groups + 1), spec.runs, teams, mode=spec.mode))
+    model.set_categories(cats)
+
+    group_info = {}
+    other_events = {}
+    for group_idx in range(spec.num_groups):
+        group = str(group_idx + 1)
+        info = {"match_dur": spec.match_dur, "num_fields": spec.num_fields, "pause_dur": spec.pause_dur}
+        if spec.double_missions is not None:
+            info["double_missions"] = spec.double_missions
+        if spec.optimize:
+            info["optimize"] = True
+        if spec.min_rest > 0:
+            info["min_rest"] = spec.min_rest
+        if spec.balance_fields:
+            info["balance_fields"] = True
+        group_info[group] = info
+
+        events = []
+        for ev_idx in range(spec.other_events_per_group):
+            bef_dur_aft = ["before", "during", "after"][ev_idx % 3]
+            dur_index = 2 * (ev_idx + 1) if bef_dur_aft == "during" else None
+            events.append(OtherEvent(10, f"Event {ev_idx}", False, None, 0, bef_dur_aft, dur_index))
+        other_events[group] = events
+    model.set_group_info(group_info)
+    model.set_other_events(other_events)
+
+    shuffle = spec.shuffle_seed is not None
+    model.set_tournament_info({"shuffle": shuffle, "shuffle_seed": spec.shuffle_seed or "",
+                               "prevent_identical_cat_days": False})
+    return model
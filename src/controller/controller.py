@@ -1,15 +1,22 @@
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from utils.tourn_ref_card_creator.ref_card_creator import RefCardCreator
 from view.main_view import MainView
 from model.model import Model
 from utils.scheduler.scheduler import create_schedule
+from utils.scheduler.group_cache import GroupScheduleCache
+from utils.scheduler.disk_cache import DiskScheduleCache
+from utils.scheduler.seed_search import find_best_seed
 from utils.tourn_to_excel.excel_tournament_writer import ExcelTournamentWriter
 from utils.tourn_stats.stats_excel_creator import StatsExcelCreator
 
 class Controller:
     def __init__(self):
         self.model = Model()
+        self.schedule_cache = GroupScheduleCache()  # Scheduled blocks per group, reused by "Regenerate"
+        self.disk_cache = DiskScheduleCache()   # Generated tournaments, kept across sessions
+        self.executor = None    # Process pool for parallel scheduling, started on first use
         self.view = MainView(self)
         self.view.show()
 
@@ -33,6 +40,8 @@ class Controller:
     def update_categories_from_view(self):
         categories = self.view.categories_tab.collect_input_fields()
         self.model.set_categories(categories)
+        if self.model.get_groupings_changed():  # Group blocks have moved: cached blocks are of no use anymore
+            self.schedule_cache.clear()
 
     def update_days_from_view(self):
         days = self.view.days_tab.collect_input_fields()
@@ -42,8 +51,39 @@ class Controller:
         group_info = self.view.group_info_tab.collect_input_fields()
         self.model.set_group_info(group_info)
     
-    def generate_tournament_from_model(self):
-        self.model.set_tournament_generated(create_schedule(self.model))
+    def get_executor(self) -> ProcessPoolExecutor:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor()
+        return self.executor
+
+    def close(self):
+        """Stops the worker processes of the process pool (called when the main window is closed)."""
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    def generate_tournament_from_model(self) -> bool:
+        """Generates the tournament, or loads it from the disk cache if the model did not change since it was
+        generated. Returns True if it was loaded from the cache."""
+        cached = self.disk_cache.lookup(self.model)
+        if cached is not None:
+            self.model.set_tournament_generated(cached)
+            return True
+
+        executor = None
+        if self.model.get_tournament_info().get("parallel_scheduling", False):
+            executor = self.get_executor()
+        self.model.set_tournament_generated(create_schedule(self.model, self.schedule_cache, executor))
+        self.disk_cache.store(self.model, self.model.get_tournament_generated())
+        return False
+
+    def search_best_seed(self, num_seeds: int):
+        """Schedules the tournament with num_seeds shuffle seeds on the process pool, keeps the best
+        seed in the tournament info and generates the tournament with it. Returns the seed and its score."""
+        best_seed, best_score = find_best_seed(self.model, num_seeds, self.get_executor())
+        self.view.home_tab.populate_from_model(self.model)
+        self.generate_tournament_from_model()
+        return best_seed, best_score
     
     def export_to_excel(self):
         base_name = "output"
@@ -78,4 +118,5 @@ class Controller:
     
     def reset_model(self):
         self.model = Model()
+        self.schedule_cache.clear()
         self.view.populate_from_model(self.model)
\ No newline at end of file
@@ -3,6 +3,9 @@ from .category import Category
 from .match import Match
 from .event import Event, MatchEvent, OtherEvent
 from .event_block import EventBlock
+from .event_day_columns import EventDayColumns
+from .timetable import Timetable
 from .event_day import EventDay
+from .team_registry import TeamRegistry
 
-__all__ = ["Team", "Category", "Match", "Event", "MatchEvent", "OtherEvent", "EventBlock", "EventDay"]
+__all__ = ["Team", "Category", "Match", "Event", "MatchEvent", "OtherEvent", "EventBlock", "EventDay", "EventDayColumns", "Timetable", "TeamRegistry"]
@@ -10,6 +10,7 @@ class Category:
     runs: str
     teams: List[Team]
     bg_color: str = field(default="#FFFFFF")
+    mode: str = field(default="round_robin")   # "round_robin" or "swiss" (runs is the number of Swiss rounds)
 
     def to_dict(self):
         return {
@@ -17,7 +18,8 @@ class Category:
             "group": self.group,
             "runs": self.runs,
             "teams": [team.to_dict() for team in self.teams],
-            "bg_color": self.bg_color
+            "bg_color": self.bg_color,
+            "mode": self.mode
         }
 
     @classmethod
@@ -27,5 +29,6 @@ class Category:
             group=data["group"],
             runs=data["runs"],
             teams=[Team.from_dict(t) for t in data.get("teams", [])],
-            bg_color=data.get("bg_color", "#FFFFFF")
+            bg_color=data.get("bg_color", "#FFFFFF"),
+            mode=data.get("mode", "round_robin")
         )
\ No newline at end of file
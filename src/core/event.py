@@ -1,9 +1,12 @@
 from dataclasses import dataclass, field
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 from .match import Match
 
+if TYPE_CHECKING:
+    from .team_registry import TeamRegistry
 
-@dataclass
+
+@dataclass(slots=True)
 class Event:
     duration: int
 
@@ -21,12 +24,12 @@ class Event:
         return cls(duration=data["duration"])
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchEvent(Event):
     matches: List[Match] = field(default_factory=list)
 
     def __post_init__(self):
-        super().__post_init__()
+        Event.__post_init__(self)   # No zero-argument super() in slotted dataclasses
         if not all(isinstance(m, Match) for m in self.matches):
             raise TypeError("All matches must be instances of Match.")
 
@@ -36,6 +39,13 @@ class MatchEvent(Event):
         teams.update(match.team2 for match in self.matches)
         return teams
 
+    def get_team_mask(self) -> int:
+        """Returns the registry ids of all teams from all matches as bitmask (bit i stands for team id i)."""
+        mask = 0
+        for match in self.matches:
+            mask |= (1 << match.team1.id) | (1 << match.team2.id)
+        return mask
+
     def to_dict(self):
         return {
             "duration": self.duration,
@@ -43,13 +53,13 @@ class MatchEvent(Event):
         }
 
     @classmethod
-    def from_dict(cls, data):
+    def from_dict(cls, data, registry: Optional["TeamRegistry"] = None):
         return cls(
             duration=data["duration"],
-            matches=[Match.from_dict(m) for m in data["matches"]]
+            matches=[Match.from_dict(m, registry) for m in data["matches"]]
         )
 
-@dataclass
+@dataclass(slots=True)
 class OtherEvent(Event):
     label: str
     bold: bool = False
@@ -59,7 +69,7 @@ class OtherEvent(Event):
     dur_index: Optional[int] = None     # indicates after how many match events it takes place.
 
     def __post_init__(self):
-        super().__post_init__()
+        Event.__post_init__(self)
         if not isinstance(self.label, str):
             raise TypeError("Label must be a string.")
 
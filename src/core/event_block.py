@@ -1,21 +1,76 @@
+import itertools
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Union
 from core.event import MatchEvent, OtherEvent
+from core.free_slot_tree import FreeSlotTree
+
+if TYPE_CHECKING:
+    from core.team_registry import TeamRegistry
 
 EventType = Union[MatchEvent, OtherEvent]
 
-@dataclass
+# Source of revision stamps. Stamps are unique across all blocks, so a tuple of stamps identifies
+# the state of a whole EventDay (even if one of its blocks gets replaced by a new block).
+_revision_counter = itertools.count(1)
+
+class BlockMetrics(NamedTuple):
+    total_duration: int
+    number_of_events: int
+    number_of_matches: int
+    max_fields: int
+
+@dataclass(slots=True)
 class EventBlock:
     events: List[Optional[EventType]] = field(default_factory=list)
+    revision: int = field(default=0, init=False, repr=False, compare=False)
+    _metrics: Optional[BlockMetrics] = field(default=None, init=False, repr=False, compare=False)
+    _metrics_revision: int = field(default=0, init=False, repr=False, compare=False)
+    _slots: Optional[FreeSlotTree] = field(default=None, init=False, repr=False, compare=False)
+    _slots_revision: int = field(default=0, init=False, repr=False, compare=False)
+    # Set if the optimizer stopped at its time limit: the order depends on the machine load, so the
+    # block must not be cached
+    time_limited: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.touch()
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name == "events":    # Replacing the events list is a mutation as well
+            self.touch()
+
+    def touch(self) -> None:
+        """Marks the block as changed. Must be called after mutating the events list in place
+        (all methods of EventBlock do this on their own), such that cached data gets rebuilt."""
+        object.__setattr__(self, "revision", next(_revision_counter))
+
+    def _get_slots(self) -> FreeSlotTree:
+        """Returns the tree of free (None) slots. It is rebuilt if the block was changed without
+        keeping the tree up to date (e.g. an insert in the middle or an external touch)."""
+        if self._slots is None or self._slots_revision != self.revision or len(self._slots) != len(self.events):
+            self._slots = FreeSlotTree(event is None for event in self.events)
+            self._slots_revision = self.revision
+        return self._slots
+
+    def _touch_slots_in_sync(self) -> None:
+        """Like touch, for mutations which updated the tree of free slots as well."""
+        self.touch()
+        self._slots_revision = self.revision
+
+    def _append_slot(self, slots: FreeSlotTree, event: Optional[EventType]) -> None:
+        self.events.append(event)
+        slots.append(event is None)
 
     def add_event(self, event: EventType) -> None:
         if not isinstance(event, (MatchEvent, OtherEvent)):
             raise TypeError("Only MatchEvent or OtherEvent instances are allowed.")
-        self.events.append(event)
+        self._append_slot(self._get_slots(), event)
+        self._touch_slots_in_sync()
 
     def remove_event(self, index: int) -> None:
         if 0 <= index < len(self.events):
             del self.events[index]
+            self.touch()
         else:
             raise IndexError("Event index out of range.")
 
@@ -30,9 +85,12 @@ class EventBlock:
             raise TypeError("Only MatchEvent or OtherEvent instances are allowed.")
         if position < 0:
             raise IndexError("Negative position is not allowed.")
+        slots = self._get_slots()
         while len(self.events) <= position:
-            self.events.append(None)
+            self._append_slot(slots, None)
         self.events[position] = event
+        slots.set_free(position, False)
+        self._touch_slots_in_sync()
 
     def insert_event_at_position(self, event: EventType, position: int) -> None:
         if not isinstance(event, (MatchEvent, OtherEvent)):
@@ -41,11 +99,21 @@ class EventBlock:
             raise IndexError("Negative position is not allowed.")
 
         # Make sure the list is long enough
+        slots = self._get_slots()
         while len(self.events) < position:
-            self.events.append(None)
+            self._append_slot(slots, None)
 
-        # Insert event without overwriting
-        self.events.insert(position, event)
+        self._insert(slots, position, event)
+
+    def _insert(self, slots: FreeSlotTree, position: int, event: EventType) -> None:
+        """Inserts an event without overwriting. Appending keeps the tree of free slots up to date,
+        an insert in the middle shifts the list and the tree gets rebuilt on its next use."""
+        if position == len(self.events):
+            self._append_slot(slots, event)
+            self._touch_slots_in_sync()
+        else:
+            self.events.insert(position, event)
+            self.touch()
 
     def add_event_after_n_nones(self, n: int, event: EventType) -> None:
         """Inserts an event after a total of n None entries,
@@ -57,61 +125,73 @@ class EventBlock:
         if n < 0:
             raise ValueError("n must be non-negative.")
 
-        # Count the existing None entries
-        current_none_count = sum(1 for e in self.events if e is None)
+        slots = self._get_slots()
 
         # Add missing nones at the end
-        if current_none_count < n:
-            self.events.extend([None] * (n - current_none_count))
-
-        # Find the position after the nth None
-        none_seen = 0
-        idx = 0
-        while idx < len(self.events):
-            if self.events[idx] is None:
-                none_seen += 1
-                if none_seen == n:
-                    idx += 1
-                    break
-            idx += 1
+        while slots.count_free() < n:
+            self._append_slot(slots, None)
 
-        # Skip all the following real events
-        while idx < len(self.events) and self.events[idx] is not None:
-            idx += 1
+        # Find the position after the nth None (n == 0 never matches a None, hence the end of the list)
+        idx = slots.find_nth_free(n) + 1 if n > 0 else len(self.events)
 
-        # Make sure the list is long enough
-        while len(self.events) < idx:
-            self.events.append(None)
+        # Skip all the following real events
+        next_free = slots.next_free(idx)
+        idx = next_free if next_free is not None else len(self.events)
 
-        # Add the event
-        if idx == len(self.events):
-            self.events.append(event)
-        else:
-            self.events.insert(idx, event)
+        self._insert(slots, idx, event)
 
     def add_event_to_next_available_slot(self, event: EventType) -> None:
         if not isinstance(event, (MatchEvent, OtherEvent)):
             raise TypeError("Only MatchEvent or OtherEvent instances are allowed.")
-        
-        try:
-            # Find first None-Slot
-            index = self.events.index(None)
-            self.events[index] = event
-        except ValueError:
+
+        slots = self._get_slots()
+        index = slots.first_free()
+        if index is None:
             # If no Nones: Append at the end
-            self.events.append(event)
+            self._append_slot(slots, event)
+        else:
+            self.events[index] = event
+            slots.set_free(index, False)
+        self._touch_slots_in_sync()
 
     def get_valid_events(self) -> List[EventType]:
         return [event for event in self.events if event is not None]
 
+    def remove_nones(self) -> None:
+        """Compacts the block by removing all empty (None) slots."""
+        self.events = self.get_valid_events()
+
+    def get_metrics(self) -> BlockMetrics:
+        """Returns the aggregates of the block. They are computed once per revision."""
+        if self._metrics_revision != self.revision:
+            self._metrics = self._compute_metrics()
+            self._metrics_revision = self.revision
+        return self._metrics
+
+    def _compute_metrics(self) -> BlockMetrics:
+        total_duration = number_of_events = number_of_matches = max_fields = 0
+        for event in self.events:
+            if event is None:
+                continue
+            total_duration += event.duration
+            number_of_events += 1
+            if isinstance(event, MatchEvent):
+                number_of_matches += len(event.matches)
+                max_fields = max(max_fields, len(event.matches))
+        return BlockMetrics(total_duration, number_of_events, number_of_matches, max_fields)
+
     def total_duration(self) -> int:
-        return sum(event.duration for event in self.events if event is not None)
+        return self.get_metrics().total_duration
     
     def number_of_events(self) -> int:
-        return sum(1 for event in self.events if event is not None)
+        return self.get_metrics().number_of_events
     
     def number_of_matches(self) -> int:
-        return sum(len(event.matches) for event in self.events if isinstance(event, MatchEvent))
+        return self.get_metrics().number_of_matches
+
+    def max_fields(self) -> int:
+        """Returns the maximum number of matches in one MatchEvent."""
+        return self.get_metrics().max_fields
 
     def to_dict(self) -> Dict[str, Any]:
         """Serializes EventBlock into a dict."""
@@ -134,8 +214,8 @@ class EventBlock:
         return {"events": serialized_events}
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "EventBlock":
-        """Creates an EventBlock from a dict."""
+    def from_dict(cls, data: Dict[str, Any], registry: Optional["TeamRegistry"] = None) -> "EventBlock":
+        """Creates an EventBlock from a dict. With a registry, the registered Team instances are reused."""
         events: List[Optional[EventType]] = []
         for e in data.get("events", []):
             if e is None:
@@ -144,7 +224,7 @@ class EventBlock:
                 etype = e.get("type")
                 edata = e.get("data", {})
                 if etype == "match":
-                    events.append(MatchEvent.from_dict(edata))
+                    events.append(MatchEvent.from_dict(edata, registry))
                 elif etype == "other":
                     events.append(OtherEvent.from_dict(edata))
                 else:
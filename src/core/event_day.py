@@ -1,91 +1,205 @@
+import bisect
 from dataclasses import dataclass, field
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
 from core.event import MatchEvent, OtherEvent
-from .event_block import EventBlock
+from .event_block import BlockMetrics, EventBlock
+from .event_day_columns import EventDayColumns
+from .timetable import Timetable
+from .team_occurrences import TeamOccurrenceIndex, TeamOccurrences
+
+if TYPE_CHECKING:
+    from .team_registry import TeamRegistry
 
 EventType = Union[MatchEvent, OtherEvent]
 
-@dataclass
+@dataclass(slots=True)
 class EventDay:
     blocks: List[EventBlock] = field(default_factory=list)
+    registry: Optional["TeamRegistry"] = field(default=None, repr=False, compare=False)   # Assigns the team ids
+    _cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _cache_key: tuple = field(default=(), init=False, repr=False, compare=False)
 
     def add_block(self, block: EventBlock) -> None:
+        cache = self._get_cache()
         self.blocks.append(block)
+        # New events are appended at the end of the day: extend the indices instead of rebuilding them
+        if "event_index" in cache:
+            offsets, positions = cache["event_index"]
+            block_positions = [i for i, event in enumerate(block.events) if event is not None]
+            positions.append(block_positions)
+            offsets.append(offsets[-1] + len(block_positions))
+            if "team_index" in cache:
+                for global_idx, pos in enumerate(block_positions, start=offsets[-2]):
+                    cache["team_index"].add_event(global_idx, block.events[pos])
+        self._keep_cache_entries("event_index", "team_index")
+
+    def _get_cache(self) -> dict:
+        """Returns the cache for derived data. It is cleared as soon as a block was changed,
+        added or replaced (detected by the revision stamps of the blocks) or the registry gave a team another id."""
+        key = self._current_cache_key()
+        if key != self._cache_key:
+            self._cache = {}
+            self._cache_key = key
+        return self._cache
+
+    def _keep_cache_entries(self, *names: str) -> None:
+        """Called right after a mutation which does not affect the given cache entries:
+        Drops all other entries and accepts the new state of the blocks."""
+        self._cache = {name: self._cache[name] for name in names if name in self._cache}
+        self._cache_key = self._current_cache_key()
+
+    def _current_cache_key(self) -> tuple:
+        id_generation = self.registry.id_generation if self.registry is not None else 0
+        return (id_generation, *(block.revision for block in self.blocks))
+
+    def _get_event_index(self) -> Tuple[List[int], List[List[int]]]:
+        """Returns the prefix-count index over the non-None events:
+        positions[b] holds the list indices of the events in block b and
+        offsets[b] is the global index of the first of them (offsets[-1] is the total)."""
+        cache = self._get_cache()
+        if "event_index" not in cache:
+            offsets = []
+            positions = []
+            count = 0
+            for block in self.blocks:
+                offsets.append(count)
+                block_positions = [i for i, event in enumerate(block.events) if event is not None]
+                positions.append(block_positions)
+                count += len(block_positions)
+            offsets.append(count)
+            cache["event_index"] = (offsets, positions)
+        return cache["event_index"]
+
+    def _locate_event(self, global_index: int) -> Tuple[int, int]:
+        """Returns (block index, list index in block) of the event at global_index in O(log n)."""
+        offsets, positions = self._get_event_index()
+        if not 0 <= global_index < offsets[-1]:
+            raise IndexError("Global event index out of range.")
+        block_idx = bisect.bisect_right(offsets, global_index) - 1
+        return block_idx, positions[block_idx][global_index - offsets[block_idx]]
+
+    def get_columns(self) -> EventDayColumns:
+        """Returns the columnar form (EventDayColumns) of the day. It is built once and
+        rebuilt only after the day has changed."""
+        cache = self._get_cache()
+        if "columns" not in cache:
+            cache["columns"] = EventDayColumns.from_day(self)
+        return cache["columns"]
+
+    def get_timetable(self, start_time: str) -> Timetable:
+        """Returns the Timetable of the day for a start time ("HH:MM"). It is built once and rebuilt
+        only after the day or the start time has changed (which drops all delays)."""
+        cache = self._get_cache()
+        timetable = cache.get("timetable")
+        if timetable is None or timetable.start_time != start_time:
+            timetable = Timetable.from_day(self, start_time)
+            cache["timetable"] = timetable
+        return timetable
 
     def get_block(self, index: int) -> EventBlock:
         return self.blocks[index]
 
+    def _get_metrics(self) -> BlockMetrics:
+        """Returns the aggregates over all blocks. Only blocks changed since the last call are recomputed."""
+        cache = self._get_cache()
+        if "metrics" not in cache:
+            block_metrics = [block.get_metrics() for block in self.blocks]
+            cache["metrics"] = BlockMetrics(
+                total_duration=sum(m.total_duration for m in block_metrics),
+                number_of_events=sum(m.number_of_events for m in block_metrics),
+                number_of_matches=sum(m.number_of_matches for m in block_metrics),
+                max_fields=max((m.max_fields for m in block_metrics), default=0)
+            )
+        return cache["metrics"]
+
     def total_events(self) -> int:
-        return sum(block.number_of_events() for block in self.blocks)
+        return self._get_metrics().number_of_events
 
     def total_duration(self) -> int:
-        return sum(block.total_duration() for block in self.blocks)
+        return self._get_metrics().total_duration
 
     def total_matches(self) -> int:
-        return sum(block.number_of_matches() for block in self.blocks)
+        return self._get_metrics().number_of_matches
 
     def max_fields(self) -> int:
         """Returns the maximum of fields across all blocks"""
-        max_fields = 0
-        for block in self.blocks:
-            for ev in block.events:
-                if isinstance(ev, MatchEvent):
-                    if len(ev.matches) > max_fields:
-                        max_fields = len(ev.matches)
-        return max_fields
+        return self._get_metrics().max_fields
 
     def get_event(self, index: int) -> Optional[EventType]:
         """Returns the event at index across all blocks."""
-        count = 0
-        for block in self.blocks:
-            for event in block.events:
-                if event is not None:
-                    if count == index:
-                        return event
-                    count += 1
-        raise IndexError("Global event index out of range.")
+        block_idx, pos = self._locate_event(index)
+        return self.blocks[block_idx].events[pos]
 
     def set_event(self, global_index: int, new_event: EventType) -> None:
         """Sets the event at index across all blocks."""
-        count = 0
-        for block in self.blocks:
-            for i, event in enumerate(block.events):
-                if event is not None:
-                    if count == global_index:
-                        block.events[i] = new_event
-                        return
-                    count += 1
-        raise IndexError("Global event index out of range.")
+        block_idx, pos = self._locate_event(global_index)
+        block = self.blocks[block_idx]
+        old_event = block.events[pos]
+        block.events[pos] = new_event
+        block.touch()
+        if new_event is not None:   # Positions of the events did not change
+            team_index = self._cache.get("team_index")
+            if team_index is not None:
+                team_index.remove_event(global_index, old_event)
+                team_index.add_event(global_index, new_event)
+            self._keep_cache_entries("event_index", "team_index")
+
+    def iter_events(self, start: int = 0) -> Iterator[Tuple[int, EventType]]:
+        """Yields (global index, event) for all events across all blocks, beginning at start."""
+        offsets, positions = self._get_event_index()
+        global_idx = max(start, 0)
+        if global_idx >= offsets[-1]:
+            return
+        block_idx, _ = self._locate_event(global_idx)
+        local_idx = global_idx - offsets[block_idx]
+        for b_idx in range(block_idx, len(self.blocks)):
+            events = self.blocks[b_idx].events
+            for pos in positions[b_idx][local_idx:]:
+                yield global_idx, events[pos]
+                global_idx += 1
+            local_idx = 0
 
     def get_all_valid_events(self) -> List[EventType]:
         """Returns all valid events from all blocks."""
         return [event for block in self.blocks for event in block.get_valid_events()]
 
+    def _get_team_index(self) -> TeamOccurrenceIndex:
+        cache = self._get_cache()
+        if "team_index" not in cache:
+            cache["team_index"] = TeamOccurrenceIndex.from_events(self.iter_events())
+        return cache["team_index"]
+
+    def get_team_occurrences(self, team) -> TeamOccurrences:
+        """Returns home/away counts, slots (global event indices) and fields of all matches of the team.
+        The returned object belongs to the index of the day and must not be modified."""
+        if team.id is None:
+            return self._scan_team_occurrences(team)
+        return self._get_team_index().get(team.id)
+
+    def _scan_team_occurrences(self, team) -> TeamOccurrences:
+        """Compares the teams of all matches with the team. Used for unregistered teams,
+        which all share the id None in the index."""
+        occurrences = TeamOccurrences()
+        for global_idx, event in self.iter_events():
+            if isinstance(event, MatchEvent):
+                for field_idx, match in enumerate(event.matches):
+                    if match.team1 == team:
+                        occurrences.add(global_idx, field_idx, True)
+                    if match.team2 == team:
+                        occurrences.add(global_idx, field_idx, False)
+        return occurrences
+
     def count_team_home(self, team) -> int:
         """Counts how many times the team appears as home (team1) in all matches of the day."""
-        count = 0
-        for block in self.blocks:
-            for ev in block.events:
-                if isinstance(ev, MatchEvent):
-                    for match in ev.matches:
-                        if match.team1 == team:
-                            count += 1
-        return count
+        return self.get_team_occurrences(team).home
 
     def count_team_away(self, team) -> int:
         """Counts how many times the team appears as away (team2) in all matches of the day."""
-        count = 0
-        for block in self.blocks:
-            for ev in block.events:
-                if isinstance(ev, MatchEvent):
-                    for match in ev.matches:
-                        if match.team2 == team:
-                            count += 1
-        return count
+        return self.get_team_occurrences(team).away
 
     def count_team_total(self, team) -> int:
         """Counts how many times the team appears in total (home or away) in all matches of the day."""
-        return self.count_team_home(team) + self.count_team_away(team)
+        return self.get_team_occurrences(team).total
 
     def to_dict(self) -> dict:
         return {
@@ -93,7 +207,8 @@ class EventDay:
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> "EventDay":
+    def from_dict(cls, data: dict, registry: Optional["TeamRegistry"] = None) -> "EventDay":
+        """Creates an EventDay from a dict. With a registry, the registered Team instances are reused."""
         blocks_data = data.get("blocks", [])
-        blocks = [EventBlock.from_dict(b) for b in blocks_data]
-        return cls(blocks=blocks)
\ No newline at end of file
+        blocks = [EventBlock.from_dict(b, registry) for b in blocks_data]
+        return cls(blocks=blocks, registry=registry)
\ No newline at end of file
@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+from core.event import MatchEvent, OtherEvent
+
+
+@dataclass
+class EventDayColumns:
+    """Compact columnar form of a generated EventDay.
+
+    Every match is one row of the flat match arrays. A slot is the global index of an event
+    (as used by EventDay.get_event) and start minutes are relative to the start of the day.
+    OtherEvents are kept in a small side table."""
+    # Per slot
+    slot_duration: np.ndarray
+    slot_start: np.ndarray
+    # Per match
+    slot: np.ndarray
+    field: np.ndarray       # 0 stands for 'Feld 1'
+    home: np.ndarray        # team id of team1 (-1 if not registered)
+    away: np.ndarray        # team id of team2 (-1 if not registered)
+    duration: np.ndarray
+    start: np.ndarray
+    # Side table for OtherEvents
+    other_slot: np.ndarray
+    other_start: np.ndarray
+    other_events: List[OtherEvent]
+
+    def __len__(self) -> int:
+        return len(self.slot)
+
+    @property
+    def num_slots(self) -> int:
+        return len(self.slot_duration)
+
+    @property
+    def end(self) -> int:
+        """Returns the minute at which the day ends (relative to its start)."""
+        return int(self.slot_start[-1] + self.slot_duration[-1]) if self.num_slots > 0 else 0
+
+    def rows_of_field(self, field_idx: int) -> np.ndarray:
+        """Returns the row indices of all matches on a field (ordered by slot)."""
+        return np.flatnonzero(self.field == field_idx)
+
+    def rows_of_team(self, team_id: int) -> np.ndarray:
+        """Returns the row indices of all matches of a team (ordered by slot)."""
+        return np.flatnonzero((self.home == team_id) | (self.away == team_id))
+
+    @classmethod
+    def from_day(cls, day) -> "EventDayColumns":
+        slot_duration = []
+        slot, field, home, away = [], [], [], []
+        other_slot, other_events = [], []
+
+        for ev in day.get_all_valid_events():
+            slot_idx = len(slot_duration)
+            slot_duration.append(ev.duration)
+            if isinstance(ev, MatchEvent):
+                for field_idx, match in enumerate(ev.matches):
+                    slot.append(slot_idx)
+                    field.append(field_idx)
+                    home.append(-1 if match.team1.id is None else match.team1.id)
+                    away.append(-1 if match.team2.id is None else match.team2.id)
+            elif isinstance(ev, OtherEvent):
+                other_slot.append(slot_idx)
+                other_events.append(ev)
+
+        slot_duration = np.array(slot_duration, dtype=np.int32)
+        # Start of a slot: sum of all previous durations
+        slot_start = np.zeros(len(slot_duration), dtype=np.int32)
+        if len(slot_duration) > 1:
+            np.cumsum(slot_duration[:-1], out=slot_start[1:])
+
+        slot = np.array(slot, dtype=np.int32)
+        other_slot = np.array(other_slot, dtype=np.int32)
+        return cls(
+            slot_duration=slot_duration,
+            slot_start=slot_start,
+            slot=slot,
+            field=np.array(field, dtype=np.int32),
+            home=np.array(home, dtype=np.int32),
+            away=np.array(away, dtype=np.int32),
+            duration=slot_duration[slot],
+            start=slot_start[slot],
+            other_slot=other_slot,
+            other_start=slot_start[other_slot],
+            other_events=other_events
+        )
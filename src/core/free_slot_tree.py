@@ -0,0 +1,80 @@
+from typing import Iterable, List, Optional
+
+
+class FreeSlotTree:
+    """Binary indexed (Fenwick) tree over the slots of an EventBlock which counts the free (None) slots.
+
+    Finding the n-th free slot, the first free slot, updating a slot and appending a slot
+    take O(log n). Inserting in the middle is not supported: build a new tree instead."""
+
+    def __init__(self, free_flags: Iterable[bool] = ()):
+        self._flags: List[int] = [1 if is_free else 0 for is_free in free_flags]
+        size = len(self._flags)
+        self._tree: List[int] = [0] * (size + 1)
+        # Linear time construction: every node passes its sum on to its parent
+        for i in range(1, size + 1):
+            self._tree[i] += self._flags[i - 1]
+            parent = i + (i & -i)
+            if parent <= size:
+                self._tree[parent] += self._tree[i]
+        self._num_free = sum(self._flags)
+
+    def __len__(self) -> int:
+        return len(self._flags)
+
+    def is_free(self, index: int) -> bool:
+        return self._flags[index] == 1
+
+    def count_free(self) -> int:
+        return self._num_free
+
+    def count_free_before(self, index: int) -> int:
+        """Returns the number of free slots in [0, index)."""
+        total = 0
+        i = min(index, len(self._flags))
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def set_free(self, index: int, is_free: bool) -> None:
+        value = 1 if is_free else 0
+        delta = value - self._flags[index]
+        if delta == 0:
+            return
+        self._flags[index] = value
+        self._num_free += delta
+        i = index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def append(self, is_free: bool) -> None:
+        value = 1 if is_free else 0
+        self._flags.append(value)
+        self._num_free += value
+        # The new node covers the slots (i - lowbit(i), i]
+        i = len(self._flags)
+        self._tree.append(value + self.count_free_before(i - 1) - self.count_free_before(i - (i & -i)))
+
+    def find_nth_free(self, n: int) -> int:
+        """Returns the index of the n-th free slot (n starts at 1)."""
+        if not 1 <= n <= self._num_free:
+            raise IndexError("There are less than n free slots.")
+        pos = 0
+        step = 1 << (len(self._flags).bit_length() - 1)
+        while step > 0:
+            nxt = pos + step
+            if nxt < len(self._tree) and self._tree[nxt] < n:
+                pos = nxt
+                n -= self._tree[nxt]
+            step >>= 1
+        return pos
+
+    def first_free(self) -> Optional[int]:
+        return self.find_nth_free(1) if self._num_free > 0 else None
+
+    def next_free(self, start: int) -> Optional[int]:
+        """Returns the index of the first free slot at or after start."""
+        n = self.count_free_before(start) + 1
+        return self.find_nth_free(n) if n <= self._num_free else None
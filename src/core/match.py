@@ -1,24 +1,55 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
 from .team import Team
 
+if TYPE_CHECKING:
+    from .team_registry import TeamRegistry
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Match:
     team1: Team
     team2: Team
+    referee: Optional[Team] = field(default=None, compare=False)   # Team refereeing the match (see referee_assignment)
 
     def __str__(self):
         return f"{self.team1} vs {self.team2}"
 
+    def __reduce__(self):
+        # Much faster than the generic state of frozen slotted dataclasses (pickle, deepcopy)
+        return (Match, (self.team1, self.team2, self.referee))
+
+    @property
+    def team1_id(self) -> int:
+        return self.team1.id
+
+    @property
+    def team2_id(self) -> int:
+        return self.team2.id
+
+    @property
+    def team_mask(self) -> int:
+        """Returns the registry ids of both teams as bitmask (bit i stands for team id i)."""
+        return (1 << self.team1.id) | (1 << self.team2.id)
+
     def to_dict(self):
-        return {
+        data = {
             "team1": self.team1.to_dict(),
             "team2": self.team2.to_dict()
         }
+        if self.referee is not None:
+            data["referee"] = self.referee.to_dict()
+        return data
 
     @classmethod
-    def from_dict(cls, data):
-        return cls(
-            team1=Team.from_dict(data["team1"]),
-            team2=Team.from_dict(data["team2"])
-        )
+    def from_dict(cls, data, registry: Optional["TeamRegistry"] = None):
+        """Creates a Match from a dict. With a registry, the registered Team instances are reused."""
+        team1 = Team.from_dict(data["team1"])
+        team2 = Team.from_dict(data["team2"])
+        referee = Team.from_dict(data["referee"]) if data.get("referee") is not None else None
+        if registry is not None:
+            team1 = registry.intern(team1)
+            team2 = registry.intern(team2)
+            if referee is not None:
+                referee = registry.intern(referee)
+        return cls(team1=team1, team2=team2, referee=referee)
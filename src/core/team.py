@@ -1,12 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Team:
     name: str
     color: str = "#FFFFFF"
     font_color: Optional[str] = None
+    id: Optional[int] = field(default=None, compare=False, repr=False)   # Assigned by TeamRegistry
 
     def __str__(self):
         return self.name
@@ -24,4 +25,4 @@ class Team:
             name=data["name"],
             color=data["color"],
             font_color=data.get("font_color")
-        )
\ No newline at end of file
+        )
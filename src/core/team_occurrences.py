@@ -0,0 +1,81 @@
+import bisect
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from core.event import MatchEvent
+
+
+@dataclass
+class TeamOccurrences:
+    """Where and how often a team plays on one day."""
+    home: int = 0
+    away: int = 0
+    slots: List[int] = field(default_factory=list)     # Global event indices (sorted)
+    fields: List[int] = field(default_factory=list)    # Field index for each entry of slots
+
+    @property
+    def total(self) -> int:
+        return self.home + self.away
+
+    def add(self, slot: int, field_idx: int, is_home: bool) -> None:
+        pos = bisect.bisect_right(self.slots, slot)
+        self.slots.insert(pos, slot)
+        self.fields.insert(pos, field_idx)
+        if is_home:
+            self.home += 1
+        else:
+            self.away += 1
+
+    def remove(self, slot: int, field_idx: int, is_home: bool) -> None:
+        pos = bisect.bisect_left(self.slots, slot)
+        while self.fields[pos] != field_idx:
+            pos += 1
+        del self.slots[pos]
+        del self.fields[pos]
+        if is_home:
+            self.home -= 1
+        else:
+            self.away -= 1
+
+
+class TeamOccurrenceIndex:
+    """Maps team ids to their TeamOccurrences on one day. Built in a single pass over the
+    events and updated incrementally when single events are added or replaced."""
+
+    def __init__(self):
+        self._occurrences: Dict[int, TeamOccurrences] = {}
+
+    @classmethod
+    def from_events(cls, indexed_events) -> "TeamOccurrenceIndex":
+        """Builds the index from (global index, event) pairs."""
+        index = cls()
+        for global_idx, event in indexed_events:
+            index.add_event(global_idx, event)
+        return index
+
+    def get(self, team_id: Optional[int]) -> TeamOccurrences:
+        """Returns the occurrences of a team. Unknown teams do not play at all."""
+        occurrences = self._occurrences.get(team_id)
+        return occurrences if occurrences is not None else TeamOccurrences()
+
+    def team_ids(self) -> List[int]:
+        return list(self._occurrences)
+
+    def add_event(self, global_idx: int, event) -> None:
+        if isinstance(event, MatchEvent):
+            for field_idx, match in enumerate(event.matches):
+                self._get_or_create(match.team1.id).add(global_idx, field_idx, True)
+                self._get_or_create(match.team2.id).add(global_idx, field_idx, False)
+
+    def remove_event(self, global_idx: int, event) -> None:
+        if isinstance(event, MatchEvent):
+            for field_idx, match in enumerate(event.matches):
+                self._occurrences[match.team1.id].remove(global_idx, field_idx, True)
+                self._occurrences[match.team2.id].remove(global_idx, field_idx, False)
+
+    def _get_or_create(self, team_id: Optional[int]) -> TeamOccurrences:
+        occurrences = self._occurrences.get(team_id)
+        if occurrences is None:
+            occurrences = TeamOccurrences()
+            self._occurrences[team_id] = occurrences
+        return occurrences
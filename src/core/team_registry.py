@@ -0,0 +1,72 @@
+from typing import Dict, Iterable, Iterator, List, Optional
+from .team import Team
+from .category import Category
+from .event import MatchEvent
+
+class TeamRegistry:
+    """Tournament-wide registry which assigns every team a dense integer id (0, 1, 2, ...).
+
+    Teams are looked up by value, so equal teams share the same id. The id is stored
+    in Team.id such that the scheduler and the stats code can compare and hash plain
+    integers instead of the three strings of a team. Ids are never reassigned: a team
+    keeps its id until the registry is cleared, even if it is not used anymore.
+
+    id_generation counts how often this registry gave a team an id. Data derived from the ids
+    (e.g. the caches of an EventDay linked to the registry) is valid as long as it does not change."""
+
+    def __init__(self):
+        self._teams: List[Team] = []
+        self._ids: Dict[Team, int] = {}
+        self.id_generation = 0
+
+    def __len__(self) -> int:
+        return len(self._teams)
+
+    def __iter__(self) -> Iterator[Team]:
+        return iter(self._teams)
+
+    def clear(self) -> None:
+        self._teams = []
+        self._ids = {}
+
+    def register(self, team: Team) -> int:
+        """Returns the id of the team. Unknown teams get the next free id."""
+        team_id = self._ids.get(team)
+        if team_id is None:
+            team_id = len(self._teams)
+            self._ids[team] = team_id
+            self._teams.append(team)
+        if team.id != team_id:
+            team.id = team_id
+            self.id_generation += 1
+        return team_id
+
+    def intern(self, team: Team) -> Team:
+        """Returns the registered instance equal to team. Unknown teams are registered."""
+        team_id = self._ids.get(team)
+        if team_id is None:
+            self.register(team)
+            return team
+        return self._teams[team_id]
+
+    def register_categories(self, categories: Iterable[Category]) -> None:
+        for cat in categories:
+            for team in cat.teams:
+                self.register(team)
+
+    def register_tournament(self, tournament: Iterable) -> None:
+        """Registers the teams of all matches in a list of EventDays and links the days to the registry."""
+        for day in tournament:
+            day.registry = self
+            for block in day.blocks:
+                for ev in block.events:
+                    if isinstance(ev, MatchEvent):
+                        for match in ev.matches:
+                            self.register(match.team1)
+                            self.register(match.team2)
+
+    def get_id(self, team: Team) -> Optional[int]:
+        return self._ids.get(team)
+
+    def get_team(self, team_id: int) -> Team:
+        return self._teams[team_id]
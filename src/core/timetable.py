@@ -0,0 +1,60 @@
+from datetime import datetime
+from typing import List, Optional
+
+import numpy as np
+
+MINUTES_PER_DAY = 24 * 60
+
+
+class Timetable:
+    """Start times of all events of a generated day, built once from the EventDayColumns.
+
+    Index i is the global event index (as used by EventDay.get_event), index len(timetable)
+    is the end of the day. Delays are stored as steps and applied on the next read, so
+    delaying the rest of the day is O(1)."""
+
+    def __init__(self, start_time: str, slot_start: np.ndarray, end: int):
+        parsed = datetime.strptime(start_time, "%H:%M")
+        self.start_time = start_time
+        self._start_minute = parsed.hour * 60 + parsed.minute
+        self._offsets = np.append(slot_start, end).astype(np.int32)
+        self._delay_steps = np.zeros(len(self._offsets), dtype=np.int32)
+        self._minutes: Optional[np.ndarray] = None
+        self._strings: Optional[List[str]] = None
+
+    @classmethod
+    def from_day(cls, day, start_time: str) -> "Timetable":
+        columns = day.get_columns()
+        return cls(start_time, columns.slot_start, columns.end)
+
+    def __len__(self) -> int:
+        """Returns the number of events."""
+        return len(self._offsets) - 1
+
+    def delay_from(self, index: int, minutes: int) -> None:
+        """Delays the event at index and all following events (and the end of the day)."""
+        self._delay_steps[index] += minutes
+        self._minutes = None
+        self._strings = None
+
+    def get_minutes(self) -> np.ndarray:
+        """Returns the start minute (after midnight) of every event, followed by the end of the day."""
+        if self._minutes is None:
+            self._minutes = self._start_minute + self._offsets + np.cumsum(self._delay_steps, dtype=np.int32)
+        return self._minutes
+
+    def minute(self, index: int) -> int:
+        return int(self.get_minutes()[index])
+
+    def get_time_strings(self) -> List[str]:
+        """Returns the start times formatted as "HH:MM" (wrapping at midnight), followed by the end of the day."""
+        if self._strings is None:
+            self._strings = [f"{m // 60:02d}:{m % 60:02d}"
+                             for m in (self.get_minutes() % MINUTES_PER_DAY).tolist()]
+        return self._strings
+
+    def time_str(self, index: int) -> str:
+        return self.get_time_strings()[index]
+
+    def end_str(self) -> str:
+        return self.get_time_strings()[-1]
@@ -1,14 +1,17 @@
+import multiprocessing
 import os
 import sys
 from PyQt5.QtWidgets import QApplication
 from controller.controller import Controller
 from PyQt5.QtGui import QIcon
 
-app = QApplication(sys.argv)
+if __name__ == "__main__":  # Worker processes of the parallel scheduler import this module as well
+    multiprocessing.freeze_support()    # Needed by the worker processes of the bundled exe
+    app = QApplication(sys.argv)
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-icon_path = os.path.join(BASE_DIR, "assets", "icon.ico")
-app.setWindowIcon(QIcon(icon_path))
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    icon_path = os.path.join(BASE_DIR, "assets", "icon.ico")
+    app.setWindowIcon(QIcon(icon_path))
 
-controller = Controller()
-sys.exit(app.exec_())
\ No newline at end of file
+    controller = Controller()
+    sys.exit(app.exec_())
\ No newline at end of file
@@ -1,5 +1,7 @@
 from typing import List
-from core import OtherEvent, Team, Category, EventDay
+from core import OtherEvent, Team, Category, EventDay, TeamRegistry
+from model import save_format
+from utils.scheduler.swiss import max_swiss_rounds
 
 class Model:
     def __init__(self):
@@ -8,6 +10,7 @@ class Model:
         self.categories: List[Category] = []
         self.groupings_changed: bool = False
         self._prev_group_ids: set[str] = set()
+        self.team_registry = TeamRegistry()
 
         self.group_info = {}
         self.other_events = {}
@@ -20,18 +23,25 @@ class Model:
         self.tournament_info = data.get("tournament_info", {})
         self.days = data.get("days", [])
         self.categories = [Category.from_dict(cat) for cat in data["categories"]]
+        self.team_registry.clear()
+        self.team_registry.register_categories(self.categories)
         self.group_info = data.get("group_info", {})
         self.other_events = {
             group_id: [OtherEvent.from_dict(e) for e in group_events]
             for group_id, group_events in data.get("events", {}).items()
         }
-        if "tournament_generated" in data:
-            self.tournament_generated = [EventDay.from_dict(event_day) for event_day in data["tournament_generated"]]
-        else:
+        if "tournament_generated" not in data:
             self.tournament_generated = []
+        elif save_format.get_format_version(data) >= 2:
+            self.tournament_generated = save_format.tournament_from_dict(data, self.other_events, self.team_registry)
+        else:
+            # Matches reference the Team instances of the categories instead of copies
+            self.tournament_generated = [EventDay.from_dict(event_day, self.team_registry)
+                                         for event_day in data["tournament_generated"]]
 
         # After set_data: Check, if groupings have changed.
         self._update_groupings_changed()
+        self._update_team_registry()
 
     def get_data(self) -> dict:
         return {
@@ -48,6 +58,7 @@ class Model:
 
     def to_serializable_dict(self) -> dict:
         return {
+            "format_version": save_format.FORMAT_VERSION,
             "tournament_info": self.tournament_info,
             "days": self.days,
             "categories": [category.to_dict() for category in self.categories],
@@ -56,7 +67,7 @@ class Model:
                 group_id: [event.to_dict() for event in group_events]
                 for group_id, group_events in self.other_events.items()
             },
-            "tournament_generated": [event_day.to_dict() for event_day in self.tournament_generated]
+            **save_format.tournament_to_dict(self.tournament_generated, self.other_events)
         }
     
     def set_tournament_info(self, tournament_info):
@@ -94,10 +105,18 @@ class Model:
                     team_names.append(team.name)
         return duplicates if len(duplicates) > 0 else None
 
+    def get_swiss_categories_with_too_many_rounds(self):
+        """Returns the names of the Swiss system categories with more rounds than can be paired without
+        rematches."""
+        names = [cat.name for cat in self.categories
+                 if cat.mode == "swiss" and int(cat.runs) > max_swiss_rounds(len(cat.teams))]
+        return names if len(names) > 0 else None
+
     def set_categories(self, categories: List[Category]):
-        """Set categories and check if groupings have changed."""
+        """Set categories, check if groupings have changed and assign team ids."""
         self.categories = categories
         self._update_groupings_changed()
+        self._update_team_registry()
     
     def get_categories(self) -> list:
         return self.categories
@@ -119,10 +138,21 @@ class Model:
     
     def set_tournament_generated(self, tournament_generated):
         self.tournament_generated = tournament_generated
+        self.team_registry.register_tournament(tournament_generated)
     
     def get_tournament_generated(self) -> List[EventDay]:
         return self.tournament_generated
 
+    def get_team_registry(self) -> TeamRegistry:
+        return self.team_registry
+
+    # Team ids
+    def _update_team_registry(self):
+        """Internal method: Assign ids to new teams (categories first, then generated matches). Known teams
+        keep their ids, so the generated tournament and its caches stay valid."""
+        self.team_registry.register_categories(self.categories)
+        self.team_registry.register_tournament(self.tournament_generated)
+
     # Groupings Changed Flag
     def _update_groupings_changed(self):
         """Internal method: Check, if number of groupings has changed."""
@@ -0,0 +1,98 @@
+"""
+Versioned save format of the generated tournament.
+
+Version 1 (files without "format_version") stores the full team dict for both sides of every
+match and a full copy of every OtherEvent. Version 2 stores every team once in a "teams" table
+and matches as [home id, away id]. OtherEvents taken from the model's other events (which are
+shared across days and blocks) are stored as a reference [group id, index] into "events".
+Version 3 adds the referee of a match as optional third id: [home id, away id, referee id].
+"""
+from typing import Dict, List, Tuple
+
+from core import EventBlock, EventDay, Match, MatchEvent, OtherEvent, Team, TeamRegistry
+
+FORMAT_VERSION = 3
+
+
+def get_format_version(data: dict) -> int:
+    version = data.get("format_version", 1)
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Unsupported save format version {version} (supported up to {FORMAT_VERSION}).")
+    return version
+
+
+def tournament_to_dict(tournament: List[EventDay], other_events: Dict[str, List[OtherEvent]]) -> dict:
+    """Returns the "teams" table and the compact "tournament_generated" entries of a save file.
+    The table holds the teams referenced by the matches only, numbered in order of appearance."""
+    event_refs: Dict[int, Tuple[str, int]] = {
+        id(e): (group_id, idx)
+        for group_id, group_events in other_events.items()
+        for idx, e in enumerate(group_events)
+    }
+
+    table: Dict[Team, int] = {}   # Team -> index in the "teams" table
+
+    def team_to_id(team):
+        team_id = table.get(team)
+        if team_id is None:
+            team_id = len(table)
+            table[team] = team_id
+        return team_id
+
+    def match_to_ids(m):
+        ids = [team_to_id(m.team1), team_to_id(m.team2)]
+        if m.referee is not None:
+            ids.append(team_to_id(m.referee))
+        return ids
+
+    def event_to_dict(e):
+        if e is None:
+            return None
+        if isinstance(e, MatchEvent):
+            return {
+                "type": "match",
+                "duration": e.duration,
+                "matches": [match_to_ids(m) for m in e.matches]
+            }
+        if isinstance(e, OtherEvent):
+            ref = event_refs.get(id(e))
+            if ref is not None:
+                return {"type": "other", "ref": list(ref)}
+            return {"type": "other", "data": e.to_dict()}
+        raise TypeError(f"Unsupported event type: {type(e).__name__}")
+
+    days = [
+        {"blocks": [{"events": [event_to_dict(e) for e in block.events]} for block in day.blocks]}
+        for day in tournament
+    ]
+    # The table is written after the days, such that it contains every team referenced by them
+    return {
+        "teams": [team.to_dict() for team in table],
+        "tournament_generated": days
+    }
+
+
+def tournament_from_dict(data: dict, other_events: Dict[str, List[OtherEvent]],
+                         registry: TeamRegistry) -> List[EventDay]:
+    """Creates the generated tournament of a version 2 or 3 save file. Teams equal to registered teams
+    and referenced OtherEvents are the instances of the model, not copies."""
+    teams = [registry.intern(Team.from_dict(t)) for t in data.get("teams", [])]
+
+    def event_from_dict(e):
+        if e is None:
+            return None
+        etype = e.get("type")
+        if etype == "match":
+            return MatchEvent(e["duration"], [Match(*(teams[team_id] for team_id in ids)) for ids in e["matches"]])
+        if etype == "other":
+            if "ref" in e:
+                group_id, idx = e["ref"]
+                return other_events[group_id][idx]
+            return OtherEvent.from_dict(e["data"])
+        raise ValueError(f"Unknown event type: {etype}")
+
+    return [
+        EventDay([EventBlock([event_from_dict(e) for e in block.get("events", [])]) for block in day.get("blocks", [])],
+                 registry)
+        for day in data.get("tournament_generated", [])
+    ]
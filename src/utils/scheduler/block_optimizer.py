@@ -0,0 +1,269 @@
+import math
+import random
+import time
+from typing import List, Optional
+
+from core import EventBlock, Match, MatchEvent, OtherEvent
+
+# Weights of the cost terms (see BlockCost)
+W_BACK_TO_BACK = 1.0        # per team playing in two linked consecutive MatchEvents
+W_PARALLEL = 2.0            # per additional match of a team within one MatchEvent
+W_MINUTE = 0.5              # per minute the double mission passes would add to the block
+W_HOME_AWAY = 2.0           # per home match more than away matches (or vice versa) of a team
+
+ITERATIONS_PER_MATCH = 400
+MAX_ITERATIONS = 15000      # per block, whatever its size
+PATIENCE = 3000             # iterations without an accepted improving move before the optimizer stops
+# Safety cap in seconds per block. Unlike the iteration budget it depends on the machine load, so a block
+# which reaches it is not reproducible (and marked as time_limited). The iteration budget keeps normal
+# blocks far below it.
+MAX_TIME = 2.0
+START_TEMPERATURE = 2.0
+END_TEMPERATURE = 0.02
+
+
+class BlockCost:
+    """Cost of the order of the matches in the MatchEvents (slots) of a block, updated in O(1) per
+    added or removed team. Moving a match keeps its home and away team, only switch_home_away changes
+    the home/away balance.
+
+    Two slots are linked if no OtherEvent lies between them. A team in two linked slots is a back to back
+    game. For every linked pair sharing a team the double mission passes add sequential_minutes to the
+    block (a pause or an empty field event), for every slot holding a team twice parallel_minutes."""
+
+    def __init__(self, slots: List[List[Match]], linked: List[bool], sequential_minutes: int = 0,
+                 parallel_minutes: int = 0):
+        self.linked = linked                            # linked[k]: slots k and k + 1 are linked
+        self.neighbours = [                             # (linked neighbour slot, index of the pair) per slot
+            [(k - 1, k - 1)] * (k > 0 and linked[k - 1]) + [(k + 1, k)] * (k < len(linked) and linked[k])
+            for k in range(len(slots))
+        ]
+        self.sequential_minutes = sequential_minutes
+        self.parallel_minutes = parallel_minutes
+        self.counts = [dict() for _ in slots]           # team id -> number of matches in the slot
+        self.shared = [0 for _ in slots]                # shared[k]: teams in slots k and k + 1
+        self.duplicates = [0 for _ in slots]            # additional matches of teams within slot k
+        self.balance = {}                               # team id -> home matches - away matches
+        self.back_to_back = 0
+        self.parallel = 0
+        self.added_minutes = 0
+        self.home_away_imbalance = 0
+        for k, matches in enumerate(slots):
+            for match in matches:
+                self.add_match(k, match)
+                self._change_balance(match.team1.id, 1)
+                self._change_balance(match.team2.id, -1)
+
+    @classmethod
+    def for_group(cls, slots: List[List[Match]], linked: List[bool], curr_group_info: dict) -> "BlockCost":
+        """Returns the cost with the added minutes of the double mission strategy of the group."""
+        match_dur = curr_group_info["match_dur"]
+        double_missions = curr_group_info.get("double_missions")
+        if double_missions == "pause":
+            pause_dur = curr_group_info["pause_dur"]
+            return cls(slots, linked, pause_dur, match_dur + pause_dur)
+        if double_missions == "empty_field":
+            return cls(slots, linked, match_dur, match_dur)
+        return cls(slots, linked)
+
+    @property
+    def is_optimal(self) -> bool:
+        return self.back_to_back == 0 and self.parallel == 0
+
+    @property
+    def total(self) -> float:
+        return (W_BACK_TO_BACK * self.back_to_back + W_PARALLEL * self.parallel
+                + W_MINUTE * self.added_minutes + W_HOME_AWAY * self.home_away_imbalance)
+
+    @property
+    def min_home_away_imbalance(self) -> int:
+        """Teams with an odd number of matches can not be balanced."""
+        return sum(balance % 2 for balance in self.balance.values())
+
+    def add_match(self, k: int, match: Match) -> None:
+        self._add_team(k, match.team1.id)
+        self._add_team(k, match.team2.id)
+
+    def remove_match(self, k: int, match: Match) -> None:
+        self._remove_team(k, match.team1.id)
+        self._remove_team(k, match.team2.id)
+
+    def switch_home_away(self, match: Match) -> None:
+        """Accounts for the switch of home and away team of match (team1 is the home team before)."""
+        self._change_balance(match.team1.id, -2)
+        self._change_balance(match.team2.id, 2)
+
+    def _change_balance(self, team_id: int, step: int) -> None:
+        before = self.balance.get(team_id, 0)
+        self.balance[team_id] = before + step
+        self.home_away_imbalance += abs(before + step) - abs(before)
+
+    def _add_team(self, k: int, team_id: int) -> None:
+        slot_counts = self.counts[k]
+        count = slot_counts.get(team_id, 0)
+        slot_counts[team_id] = count + 1
+        if count > 0:
+            self.parallel += 1
+            self.duplicates[k] += 1
+            if self.duplicates[k] == 1:
+                self.added_minutes += self.parallel_minutes
+            return
+        for neighbour, pair in self.neighbours[k]:
+            if team_id in self.counts[neighbour]:
+                self.back_to_back += 1
+                self.shared[pair] += 1
+                if self.shared[pair] == 1:
+                    self.added_minutes += self.sequential_minutes
+
+    def _remove_team(self, k: int, team_id: int) -> None:
+        slot_counts = self.counts[k]
+        count = slot_counts[team_id]
+        if count > 1:
+            slot_counts[team_id] = count - 1
+            self.parallel -= 1
+            self.duplicates[k] -= 1
+            if self.duplicates[k] == 0:
+                self.added_minutes -= self.parallel_minutes
+            return
+        del slot_counts[team_id]
+        for neighbour, pair in self.neighbours[k]:
+            if team_id in self.counts[neighbour]:
+                self.back_to_back -= 1
+                self.shared[pair] -= 1
+                if self.shared[pair] == 0:
+                    self.added_minutes -= self.sequential_minutes
+
+
+def optimize_block(block: EventBlock, curr_group_info: dict, seed: int = 0, max_iterations: Optional[int] = None,
+                   max_time: Optional[float] = MAX_TIME) -> EventBlock:
+    """Reorders the matches of the MatchEvents of a block by simulated annealing, before the double mission
+    passes run (see BlockCost). Moves swap two matches, swap two MatchEvents or switch home and away of a match; OtherEvents
+    keep their positions. A team never plays twice in one MatchEvent: moves which add such a match are
+    rejected. Stops after max_iterations (default: ITERATIONS_PER_MATCH per match, at most MAX_ITERATIONS)
+    or after PATIENCE iterations without an accepted move which lowers the cost, so the result only depends on the inputs and the
+    seed. max_time seconds (None: no limit) are a nondeterministic safety cap on top: a block stopped by it
+    has time_limited set. Returns a new block with the best order found."""
+    slots = []
+    linked = []
+    prev_was_match = False
+    for ev in block.events:
+        if isinstance(ev, MatchEvent):
+            if slots:
+                linked.append(prev_was_match)
+            slots.append(list(ev.matches))
+            prev_was_match = True
+        elif isinstance(ev, OtherEvent):
+            prev_was_match = False
+    num_matches = sum(len(matches) for matches in slots)
+    if len(slots) < 2 or num_matches < 2:
+        return block
+
+    cost = BlockCost.for_group(slots, linked, curr_group_info)
+    min_imbalance = cost.min_home_away_imbalance
+    best_total = cost.total
+    best_slots = [list(matches) for matches in slots]
+    last_improvement = 0
+    if max_iterations is None:
+        max_iterations = min(ITERATIONS_PER_MATCH * num_matches, MAX_ITERATIONS)
+
+    rng = random.Random(seed)
+    deadline = time.perf_counter() + max_time if max_time is not None else None
+    time_limited = False
+    current_total = best_total
+    for iteration in range(max_iterations):
+        if cost.is_optimal and cost.home_away_imbalance == min_imbalance:
+            break   # Optimal
+        if iteration - last_improvement >= PATIENCE:
+            break
+        if deadline is not None and iteration % 256 == 0 and time.perf_counter() > deadline:
+            time_limited = True
+            break
+        temperature = START_TEMPERATURE * (END_TEMPERATURE / START_TEMPERATURE) ** (iteration / max_iterations)
+
+        parallel_before = cost.parallel
+        move = rng.random()
+        if move < 0.6:
+            undo = _swap_matches(slots, cost, rng)
+        elif move < 0.8:
+            undo = _swap_slots(slots, cost, rng)
+        else:
+            undo = _switch_home_away(slots, cost, rng)
+        if undo is None:
+            continue
+        if cost.parallel > parallel_before:
+            undo()      # Hard constraint
+            continue
+
+        new_total = cost.total
+        delta = new_total - current_total
+        if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+            if delta < 0:
+                last_improvement = iteration
+            current_total = new_total
+            if new_total < best_total:
+                best_total = new_total
+                best_slots = [list(matches) for matches in slots]
+        else:
+            undo()
+
+    events = []
+    slot_idx = 0
+    for ev in block.events:
+        if isinstance(ev, MatchEvent):
+            ev = MatchEvent(ev.duration, best_slots[slot_idx])
+            slot_idx += 1
+        events.append(ev)
+    optimized = EventBlock(events)
+    optimized.time_limited = time_limited
+    return optimized
+
+def _rand_index(rng: random.Random, n: int) -> int:
+    """Like rng.randrange(n), but faster (the moves draw several indices per iteration)."""
+    return int(rng.random() * n)
+
+def _swap_matches(slots: List[List[Match]], cost: BlockCost, rng: random.Random):
+    k1, k2 = _rand_index(rng, len(slots)), _rand_index(rng, len(slots))
+    if k1 == k2 or not slots[k1] or not slots[k2]:
+        return None
+    i1, i2 = _rand_index(rng, len(slots[k1])), _rand_index(rng, len(slots[k2]))
+
+    def swap():
+        m1, m2 = slots[k1][i1], slots[k2][i2]
+        cost.remove_match(k1, m1)
+        cost.remove_match(k2, m2)
+        slots[k1][i1], slots[k2][i2] = m2, m1
+        cost.add_match(k1, m2)
+        cost.add_match(k2, m1)
+    swap()
+    return swap
+
+def _swap_slots(slots: List[List[Match]], cost: BlockCost, rng: random.Random):
+    k1, k2 = _rand_index(rng, len(slots)), _rand_index(rng, len(slots))
+    if k1 == k2:
+        return None
+
+    def swap():
+        for m in slots[k1]:
+            cost.remove_match(k1, m)
+        for m in slots[k2]:
+            cost.remove_match(k2, m)
+        slots[k1], slots[k2] = slots[k2], slots[k1]
+        for m in slots[k1]:
+            cost.add_match(k1, m)
+        for m in slots[k2]:
+            cost.add_match(k2, m)
+    swap()
+    return swap
+
+def _switch_home_away(slots: List[List[Match]], cost: BlockCost, rng: random.Random):
+    k = _rand_index(rng, len(slots))
+    if not slots[k]:
+        return None
+    i = _rand_index(rng, len(slots[k]))
+
+    def switch():
+        m = slots[k][i]
+        cost.switch_home_away(m)
+        slots[k][i] = Match(m.team2, m.team1)
+    switch()
+    return switch
@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from core import Category, Match, Team
+
+
+@dataclass(slots=True)
+class CategoryRun:
+    """Working state of a category during one create_schedule run.
+
+    References the Team instances of the model's category (in shuffled order, if set), so the
+    generated Matches share them. The category itself is left untouched. The remaining fields
+    are filled in by prepare_category."""
+    name: str
+    group: str
+    runs: int
+    teams: List[Team]
+    mode: str = "round_robin"
+    rr_runs: List[List[Match]] = field(default_factory=list)
+    matches: List[Match] = field(default_factory=list)
+    num_matches_per_rr: int = 0
+    num_rr_per_day: float = 0.0
+    num_rr_per_day_floored: int = 0
+    num_rr_remaining: int = 0
+
+    @classmethod
+    def from_category(cls, cat: Category, teams: Optional[List[Team]] = None) -> "CategoryRun":
+        """Returns the working state of a category. teams replaces the team order of the category
+        (e.g. shuffled). The teams must be registered."""
+        teams = list(cat.teams) if teams is None else teams
+        return cls(cat.name, cat.group, int(cat.runs), teams, cat.mode)
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+from typing import List, Optional
+
+from model.model import Model
+from model import save_format
+from core import EventDay
+
+# Increase when a change of the scheduler changes its results, such that old entries are not used anymore
+SCHEDULER_VERSION = 2
+
+
+def default_cache_dir() -> str:
+    base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "tournament_creator", "schedules")
+
+
+def schedule_key(model: Model) -> str:
+    """Returns a stable hash of everything create_schedule reads from the model."""
+    info = model.get_tournament_info()
+    content = {
+        "scheduler_version": SCHEDULER_VERSION,
+        "format_version": save_format.FORMAT_VERSION,
+        "num_days": len(model.get_days()),
+        "categories": [
+            {"group": cat.group, "runs": str(cat.runs), "mode": cat.mode, "teams": [team.to_dict() for team in cat.teams]}
+            for cat in model.get_categories()
+        ],
+        "group_info": model.get_group_info(),
+        "events": {
+            group_id: [e.to_dict() for e in group_events]
+            for group_id, group_events in model.get_other_events().items()
+        },
+        "shuffle": bool(info.get("shuffle", False)),
+        "shuffle_seed": info.get("shuffle_seed", 0) if info.get("shuffle", False) else None,
+        "prevent_identical_cat_days": bool(info.get("prevent_identical_cat_days", False))
+    }
+    encoded = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class DiskScheduleCache:
+    """Keeps generated tournaments in a local directory, one file (in the save format) per schedule_key.
+
+    Reading an entry updates its modification time. When more than max_entries files exist, the least
+    recently used ones are deleted. Unreadable entries count as missing."""
+
+    def __init__(self, directory: Optional[str] = None, max_entries: int = 32):
+        self.directory = directory or default_cache_dir()
+        self.max_entries = max_entries
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def _entries(self) -> List[str]:
+        try:
+            return [os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.endswith(".json")]
+        except OSError:
+            return []
+
+    def lookup(self, model: Model) -> Optional[List[EventDay]]:
+        """Returns the cached tournament of the model (referencing the teams and OtherEvents of the model)
+        or None."""
+        path = self._path(schedule_key(model))
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            tournament = save_format.tournament_from_dict(data, model.get_other_events(), model.get_team_registry())
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, IndexError, TypeError) as e:
+            print(f"Ignoring unreadable schedule cache entry {path}: {e}")
+            return None
+        return tournament
+
+    def store(self, model: Model, tournament: List[EventDay]) -> None:
+        """Stores the tournament of the model, unless the optimizer stopped at its time limit for one of
+        its blocks (such a result depends on the machine load)."""
+        if any(block.time_limited for day in tournament for block in day.blocks):
+            return
+        path = self._path(schedule_key(model))
+        data = {
+            "format_version": save_format.FORMAT_VERSION,
+            **save_format.tournament_to_dict(tournament, model.get_other_events())
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, path)
+            self._evict()
+        except OSError as e:
+            print(f"Could not write schedule cache entry {path}: {e}")
+
+    def clear(self) -> None:
+        for path in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda path: os.path.getmtime(path))
+        for path in entries[:len(entries) - self.max_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
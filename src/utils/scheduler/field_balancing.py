@@ -0,0 +1,76 @@
+from typing import Dict, List
+
+from core import EventBlock, MatchEvent
+
+
+def balance_fields(blocks: List[EventBlock]) -> List[EventBlock]:
+    """Permutes the matches of every MatchEvent across its fields (the match at index i is played on
+    field i + 1), such that every team plays on all fields about equally often.
+
+    The blocks (one per day, in order) are processed slot by slot with a running count of the matches of
+    every team per field. The matches of a slot get the fields with the smallest sum of the counts of
+    their teams, solved exactly as assignment problem (see best_field_assignment). This minimises the
+    growth of the sum of squared counts, i.e. the deviation from an even distribution. If the order of
+    the slot is already optimal, it is kept. Returns new blocks, the given ones are not changed."""
+    num_fields = max((len(ev.matches) for block in blocks for ev in block.events if isinstance(ev, MatchEvent)),
+                     default=0)
+    field_counts: Dict[int, List[int]] = {}     # Team id -> number of matches per field
+
+    def counts_of(team_id: int) -> List[int]:
+        counts = field_counts.get(team_id)
+        if counts is None:
+            counts = field_counts[team_id] = [0] * num_fields
+        return counts
+
+    new_blocks = []
+    for block in blocks:
+        events = []
+        for ev in block.events:
+            if isinstance(ev, MatchEvent) and len(ev.matches) > 1:
+                team_counts = [(counts_of(m.team1.id), counts_of(m.team2.id)) for m in ev.matches]
+                num_matches = len(ev.matches)
+                cost = [[counts1[f] + counts2[f] for f in range(num_matches)] for counts1, counts2 in team_counts]
+                fields = best_field_assignment(cost)
+                matches = [None] * num_matches
+                for m_idx, field_idx in enumerate(fields):
+                    matches[field_idx] = ev.matches[m_idx]
+                ev = MatchEvent(ev.duration, matches)
+            if isinstance(ev, MatchEvent):
+                for field_idx, m in enumerate(ev.matches):
+                    counts_of(m.team1.id)[field_idx] += 1
+                    counts_of(m.team2.id)[field_idx] += 1
+            events.append(ev)
+        new_blocks.append(EventBlock(events))
+    return new_blocks
+
+def best_field_assignment(cost: List[List[int]]) -> List[int]:
+    """Returns the field of every match (a permutation of range(len(cost))) with the minimal sum of
+    cost[match][field]. Dynamic programming over the subsets of used fields: O(n * 2^n) for n matches,
+    which is small for the number of fields of a slot. Keeps the identity if it is optimal."""
+    n = len(cost)
+    full = (1 << n) - 1
+    inf = float("inf")
+    best = [inf] * (full + 1)
+    last_field = [-1] * (full + 1)
+    best[0] = 0
+    for mask in range(full):
+        if best[mask] == inf:
+            continue
+        m_idx = mask.bit_count()    # The first m_idx matches are placed on the fields in mask
+        for field_idx in range(n):
+            bit = 1 << field_idx
+            if mask & bit:
+                continue
+            curr = best[mask] + cost[m_idx][field_idx]
+            if curr < best[mask | bit]:
+                best[mask | bit] = curr
+                last_field[mask | bit] = field_idx
+
+    if best[full] >= sum(cost[i][i] for i in range(n)):
+        return list(range(n))
+    fields = [0] * n
+    mask = full
+    for m_idx in range(n - 1, -1, -1):
+        fields[m_idx] = last_field[mask]
+        mask ^= 1 << last_field[mask]
+    return fields
@@ -0,0 +1,97 @@
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional
+
+from core import EventBlock, Match, MatchEvent, OtherEvent, TeamRegistry
+from .category_run import CategoryRun
+
+
+@dataclass
+class GroupInputs:
+    """Everything the scheduled blocks of one group depend on."""
+    key: tuple
+    other_events: List[List[OtherEvent]]    # Events of the block of every day before scheduling, in order
+
+    @classmethod
+    def collect(cls, group_idx: int, group_cats: List[CategoryRun], group_info: dict, blocks: List[EventBlock],
+                shortest_day_idx: int, prevent_identical_cat_days: bool) -> "GroupInputs":
+        """Collects the inputs of a group. The categories must already be shuffled."""
+        cats_key = tuple(
+            (str(cat.runs), cat.mode, tuple((team.name, team.color, team.font_color) for team in cat.teams))
+            for cat in group_cats
+        )
+        blocks_key = tuple(
+            tuple(None if ev is None else tuple(ev.to_dict().items()) for ev in block.events)
+            for block in blocks
+        )
+        key = (
+            group_idx,
+            cats_key,
+            json.dumps(group_info, sort_keys=True, default=str),
+            blocks_key,
+            shortest_day_idx,
+            bool(prevent_identical_cat_days)
+        )
+        other_events = [[ev for ev in block.events if ev is not None] for block in blocks]
+        return cls(key, other_events)
+
+
+class GroupScheduleCache:
+    """Keeps the scheduled blocks of every group, keyed by the inputs of the group (GroupInputs).
+
+    Regenerating a tournament after changing the group info, categories or other events of
+    one group only reschedules the groups whose inputs changed. The least recently used
+    entries are dropped once max_entries is reached."""
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def store(self, inputs: GroupInputs, blocks: List[EventBlock]) -> None:
+        if any(block.time_limited for block in blocks):
+            return  # Depends on the machine load, another run may give another result
+        self._entries[inputs.key] = (inputs.other_events, [list(block.events) for block in blocks])
+        self._entries.move_to_end(inputs.key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def lookup(self, inputs: GroupInputs, registry: TeamRegistry) -> Optional[List[EventBlock]]:
+        """Returns new blocks of every day for known inputs, else None. The blocks reference the
+        registered Team instances and the OtherEvents of the inputs, not the ones of the cached run."""
+        entry = self._entries.get(inputs.key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(inputs.key)
+        cached_other_events, cached_events = entry
+
+        # The keys are equal, hence the OtherEvents of both runs correspond one to one
+        other_event_map = {
+            id(cached): current
+            for cached_day, current_day in zip(cached_other_events, inputs.other_events)
+            for cached, current in zip(cached_day, current_day)
+        }
+
+        teams = {}  # id of cached team -> registered team
+
+        def get_team(team):
+            current = teams.get(id(team))
+            if current is None:
+                current = registry.intern(team)
+                teams[id(team)] = current
+            return current
+
+        def copy_event(ev):
+            if isinstance(ev, MatchEvent):
+                return MatchEvent(ev.duration, [Match(get_team(m.team1), get_team(m.team2)) for m in ev.matches])
+            if isinstance(ev, OtherEvent):
+                return other_event_map.get(id(ev), ev)
+            return ev
+
+        return [EventBlock([copy_event(ev) for ev in events]) for events in cached_events]
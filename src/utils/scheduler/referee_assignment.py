@@ -0,0 +1,67 @@
+from typing import List, Optional
+
+from core import EventBlock, Match, MatchEvent, OtherEvent, Team
+
+
+def assign_referees(blocks: List[EventBlock], teams: List[Team]) -> List[EventBlock]:
+    """Assigns a referee team out of teams to every match of the blocks (one block per day, in order).
+
+    A referee does not play and does not referee another match in that MatchEvent. Teams which played
+    in the MatchEvent right before are only taken if no other team is idle, so a team rarely has to
+    referee right after its own match. Among the candidates, the team with the fewest duties so far
+    (over all blocks) is taken, on ties the one with the lowest team id. Matches without an idle team
+    keep referee None.
+
+    Teams are handled as bitmasks over their registry ids: per MatchEvent, the idle teams are the pool
+    without the teams playing in it, and every duty count has a mask of the teams at that count. A
+    referee is therefore found with a few integer operations per match. Returns new blocks, the given
+    ones are not changed."""
+    team_by_id = {team.id: team for team in teams}
+    pool = 0
+    for team_id in team_by_id:
+        pool |= 1 << team_id
+    duty_levels = [pool]    # duty_levels[k]: Bitmask of the teams with k duties
+    duties = dict.fromkeys(team_by_id, 0)
+
+    def pick(candidates: int) -> Optional[int]:
+        for level_teams in duty_levels:
+            level_candidates = candidates & level_teams
+            if level_candidates:
+                return (level_candidates & -level_candidates).bit_length() - 1    # Lowest team id
+        return None
+
+    def add_duty(team_id: int) -> None:
+        level = duties[team_id]
+        duties[team_id] = level + 1
+        duty_levels[level] &= ~(1 << team_id)
+        if level + 1 == len(duty_levels):
+            duty_levels.append(0)
+        duty_levels[level + 1] |= 1 << team_id
+
+    new_blocks = []
+    for block in blocks:
+        events = []
+        prev_playing = 0    # Teams of the MatchEvent right before (None entries are removed later)
+        for ev in block.events:
+            if isinstance(ev, MatchEvent):
+                playing = ev.get_team_mask()
+                idle = pool & ~playing
+                matches = []
+                for m in ev.matches:
+                    referee_id = pick(idle & ~prev_playing)
+                    if referee_id is None:
+                        referee_id = pick(idle)
+                    if referee_id is None:
+                        matches.append(Match(m.team1, m.team2))
+                    else:
+                        idle &= ~(1 << referee_id)
+                        add_duty(referee_id)
+                        matches.append(Match(m.team1, m.team2, team_by_id[referee_id]))
+                events.append(MatchEvent(ev.duration, matches))
+                prev_playing = playing
+            else:
+                events.append(ev)
+                if isinstance(ev, OtherEvent):
+                    prev_playing = 0
+        new_blocks.append(EventBlock(events))
+    return new_blocks
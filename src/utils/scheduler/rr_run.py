@@ -1,45 +1,71 @@
-import copy
+from functools import lru_cache
+from typing import Iterator, Tuple, Union
+
+import numpy as np
+
 from core import Team, Match, Category
+from .category_run import CategoryRun
 
-def create_rr_run(cat: Category, alter_home_away: bool = False):
-    teams = copy.copy(cat.teams)
-    if len(teams) % 2 == 1:
-        teams.append(None) # If odd number: Append with a "dummy" team
-        
-    rr_run = []
-    n = len(teams)
+# Round robin by the circle method: team index 0 stays at position 0, the others rotate one position
+# per round. With an odd number of teams, a dummy team (index num_teams) is added and its matches are
+# dropped. In round r, position j > 0 holds team 1 + (j - 1 - r) mod (n - 1) and position i plays
+# against position n - 1 - i.
 
+def iter_rr_rounds(num_teams: int, alter_home_away: bool = False) -> Iterator[Tuple[Tuple[int, int], ...]]:
+    """Yields the rounds of a round robin run of num_teams teams as pairs of team indices (home, away)."""
+    n = num_teams + num_teams % 2
     for rr in range(n - 1):
         rr_matches = []
-        
         for i in range(n // 2):
-            team1 = teams[i]
-            team2 = teams[n - 1 - i]
-            if team1 is not None and team2 is not None:
-                if alter_home_away:
-                    rr_matches.append(Match(team2, team1))
-                else:
-                    rr_matches.append(Match(team1, team2))
+            idx1 = 0 if i == 0 else 1 + (i - 1 - rr) % (n - 1)
+            idx2 = 1 + (n - 2 - i - rr) % (n - 1)
+            if idx1 < num_teams and idx2 < num_teams:   # Skip the match of the dummy team
+                rr_matches.append((idx2, idx1) if alter_home_away else (idx1, idx2))
         if rr % 2 == 1: # Switch home and away for the first match every second rr to distribute home & away fairly
-            rr_matches[0] = Match(rr_matches[0].team2, rr_matches[0].team1)
-        rr_run.append(rr_matches)
+            rr_matches[0] = (rr_matches[0][1], rr_matches[0][0])
+        yield tuple(rr_matches)
+
+@lru_cache(maxsize=None)
+def get_rr_index_table(num_teams: int, alter_home_away: bool = False) -> tuple:
+    """Returns all rounds of iter_rr_rounds. The table only depends on the number of teams, therefore it is
+    computed once per process and shared by all categories (and shuffles) of that size."""
+    return tuple(iter_rr_rounds(num_teams, alter_home_away))
+
+@lru_cache(maxsize=None)
+def get_rr_index_array(num_teams: int, alter_home_away: bool = False) -> np.ndarray:
+    """Returns the same table as get_rr_index_table as read-only array of shape (rounds, matches per round, 2)."""
+    n = num_teams + num_teams % 2
+    if n == 0:
+        pairs = np.zeros((0, 0, 2), dtype=int)
+        pairs.setflags(write=False)
+        return pairs
+    rr = np.arange(n - 1)[:, None]
+    i = np.arange(n // 2)[None, :]
+    idx1 = np.where(i == 0, 0, 1 + (i - 1 - rr) % (n - 1))
+    idx2 = 1 + (n - 2 - i - rr) % (n - 1)
+    pairs = np.stack([idx2, idx1] if alter_home_away else [idx1, idx2], axis=-1)
 
-        # Rotate teams (without first team) for next round robin
-        teams = [teams[0]] + [teams[-1]] + teams[1:-1]
-    return rr_run
+    # Every round has exactly one match of the dummy team (if any)
+    valid = (idx1 < num_teams) & (idx2 < num_teams)
+    pairs = pairs[valid].reshape(n - 1, num_teams // 2, 2)
+    if num_teams >= 2:
+        pairs[1::2, 0] = pairs[1::2, 0, ::-1].copy()
+    pairs.setflags(write=False)
+    return pairs
 
-def create_n_rr_runs(cat: Category, alter_home_away: bool = True):
+def create_rr_run(cat: Union[Category, CategoryRun], alter_home_away: bool = False):
+    teams = cat.teams
+    return [[Match(teams[idx1], teams[idx2]) for idx1, idx2 in rr_matches]
+            for rr_matches in get_rr_index_table(len(teams), alter_home_away)]
+
+def create_n_rr_runs(cat: Union[Category, CategoryRun], alter_home_away: bool = True):
     rr_runs = []
-    
-    if alter_home_away:
-        for run_idx in range(int(cat.runs)):
-            if run_idx % 2 == 0:
-                rr_run = create_rr_run(cat, False)
-            else:
-                rr_run = create_rr_run(cat, True)
-            rr_runs.extend(rr_run)  # Add all rounds one after another
-    else:
-        for run_idx in range(cat.runs):
-            rr_runs.extend(create_rr_run(cat, False))   # Add all rounds one after another
-    
-    return rr_runs
\ No newline at end of file
+
+    # Both orientations are created once. The matches are immutable, therefore the runs share them.
+    runs = [create_rr_run(cat, False)]
+    if alter_home_away and int(cat.runs) > 1:
+        runs.append(create_rr_run(cat, True))
+    for run_idx in range(int(cat.runs)):
+        rr_runs.extend(runs[run_idx % len(runs)])   # Add all rounds one after another
+
+    return rr_runs
@@ -1,20 +1,30 @@
-import copy
 import hashlib
 import math
 import random
-from typing import List
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Optional
 
 from model.model import Model
 from .rr_run import create_n_rr_runs
-from core import EventDay, EventBlock, Category, Team, Match, MatchEvent, OtherEvent
-
-def create_schedule(model: Model) -> List[EventDay]:
+from .swiss import create_swiss_rounds, max_swiss_rounds
+from .group_cache import GroupInputs, GroupScheduleCache
+from .category_run import CategoryRun
+from .block_optimizer import optimize_block
+from .slot_packing import pack_matches
+from .referee_assignment import assign_referees
+from .field_balancing import balance_fields
+from core import EventDay, EventBlock, Team, Match, MatchEvent, OtherEvent
+
+def create_schedule(model: Model, cache: Optional[GroupScheduleCache] = None,
+                    executor: Optional[Executor] = None) -> List[EventDay]:
+    """Creates the tournament. With an executor (e.g. a ProcessPoolExecutor), the groups are scheduled
+    in parallel. The result is identical to the serial one."""
     num_days = len(model.get_days())
     if num_days == 0:
         return []
 
     # 1. Create empty EventDays
-    tournament = [EventDay() for _ in range(num_days)]
+    tournament = [EventDay(registry=model.get_team_registry()) for _ in range(num_days)]
 
     # 2. Create empty EventBlocks. We need n + 1 because after last grouping block there might be after_events
     # which must be added to a dedicated EventBlock.
@@ -59,180 +69,303 @@ def create_schedule(model: Model) -> List[EventDay]:
                 else:
                     tournament[e.day_index - 1].blocks[group_idx].add_event_after_n_nones(e.dur_index, e)
     
-    # 4. Create rr_runs for every category
-    categories = copy.deepcopy(model.get_categories())
+    # 4. Prepare categories. Teams are compared by their registry ids from here on.
+    # The categories of the model are not changed, the run works on CategoryRuns.
+    registry = model.get_team_registry()
+    registry.register_categories(model.get_categories())
     if model.get_tournament_info().get("shuffle", False):   # Shuffle team order if set to True
         shuffle_seed = model.get_tournament_info().get("shuffle_seed", 0)
         print(f"Scheduling with shuffle_seed: '{shuffle_seed}'")
-        for cat in categories:
-            cat.teams = shuffle_with_seed(cat.teams, shuffle_seed)
+        categories = [CategoryRun.from_category(cat, shuffle_with_seed(cat.teams, shuffle_seed))
+                      for cat in model.get_categories()]
     else:
         print("Scheduling without shuffling.")
-    rr_runs = []
-    for cat in categories:
-        rr_list = create_n_rr_runs(cat, True)
+        categories = [CategoryRun.from_category(cat) for cat in model.get_categories()]
+    prevent_identical_cat_days = model.get_tournament_info().get("prevent_identical_cat_days", False)
 
-        # Prevent identical consecutive day schedule for a category
-        if model.get_tournament_info().get("prevent_identical_cat_days", False):
-            if int(cat.runs) % num_days == 0:
-                day_length = len(rr_list) // num_days
-                # Let first
-                rotated = rr_list[:day_length]
-                new_rr_list = rotated.copy()
-                # From day 2 on: Rotate and append
-                for n in range(1, num_days):
-                    rotated = [rotated[-1]] + rotated[:-1]  # Last round becomes first
-                    new_rr_list.extend(rotated)
-                rr_list = new_rr_list
-
-        rr_runs.append(rr_list)
-        cat.rr_runs = rr_list
-        cat.matches = flatten_2d_list(rr_list)
-        # Add metrics to category
-        cat.num_matches_per_rr = len(cat.teams) // 2
-        cat.num_rr_per_day = len(rr_list) / num_days
-        cat.num_rr_per_day_floored = math.floor(cat.num_rr_per_day)
-        cat.num_rr_remaining = len(cat.rr_runs) - (num_days * cat.num_rr_per_day_floored)
-
-    # 5. Merge and distribute runs / matches of categories in same group on EventBlocks (starting at the shortest day)
+    # 5. + 6. Schedule the categories of every group on its EventBlocks (starting at the shortest day).
+    # Groups whose inputs did not change since the last run are taken from the cache.
     group_info = model.get_group_info()
-    for group_idx, group in enumerate(group_info):
-        # collect category indices in the current group
-        cat_indices = []
-        for cat_idx, cat in enumerate(categories):
-            if cat.group == group:
-                cat_indices.append(cat_idx)
+    cats_per_group = {group: [cat for cat in categories if cat.group == group] for group in group_info}
 
-        curr_group_info = group_info[group]
-        match_dur = curr_group_info["match_dur"]
-        num_fields = curr_group_info["num_fields"]
+    # Parallel mode: The matches of all groups are distributed in worker processes up front, as
+    # this does not depend on the shortest day (and therefore not on the previous groups).
+    distributions = {}
+    if executor is not None:
+        for group, group_cats in cats_per_group.items():
+            distributions[group] = executor.submit(_distribute_group_matches_task, group_cats, num_days,
+                                                   prevent_identical_cat_days)
+        registered_teams = list(registry)   # Index is the team id
 
+    for group_idx, group in enumerate(group_info):
+        group_cats = cats_per_group[group]
         shortest_day_idx = get_shortest_day_idx(tournament)
-
-        group_cats = [categories[c] for c in cat_indices]
-        group_cats_sorted = sorted(group_cats, key=lambda cat: cat.num_rr_per_day, reverse=True) # Sort by rr_per_day in ascending order
-
-        num_rr_per_cat_and_day = [[] for _ in range(num_days)]
-        # Compute number of categories rr for each day
-        for cat_idx, cat in enumerate(group_cats_sorted):
-            for d_idx, d in enumerate(num_rr_per_cat_and_day):
-                if d_idx < cat.num_rr_remaining:    # If remainder: append another rr
-                    d.append(cat.num_rr_per_day_floored + 1)
-                else:
-                    d.append(cat.num_rr_per_day_floored)
-
-        matches_per_day = [[] for _ in range(num_days)] # List of list of Matches
-        match_indices = [0 for _ in range(len(group_cats_sorted))]
-
-        for day_idx in range(len(num_rr_per_cat_and_day)):
-            num_rr_per_cat = num_rr_per_cat_and_day[day_idx]
-
-            num_rounds = max(num_rr_per_cat) # Number of rounds depends on longest category
-            rounds = [[] for _ in range(num_rounds)]    # List of Matches
-
-            # Distribute category matches on rounds
-            for cat_idx, cat in enumerate(group_cats_sorted):
-                cat_num_rr = num_rr_per_cat[cat_idx]
-                # Case 1 (num_rr is similar): Append entire rr per round
-                if num_rounds <= (cat_num_rr + 1):
-                    for round_idx in range(cat_num_rr):
-                        for _ in range(cat.num_matches_per_rr):
-                            rounds[round_idx].append(cat.matches[match_indices[cat_idx]])
-                            match_indices[cat_idx] += 1
-                # Case 2 (num_rr is different): Fill gaps with (partial) rr
-                else:
-                    num_gaps = num_rounds - 1 if num_rounds - 1 > 0 else 1
-                    gaps = [0 for _ in range(num_gaps)]
-
-                    gaps_per_rr = num_gaps // cat_num_rr
-                    gaps_remainder = num_gaps % cat_num_rr
-
-                    rr_splits_to_gaps = [gaps_per_rr for _ in range(cat_num_rr)]
-                    for x in range(gaps_remainder):
-                        rr_splits_to_gaps[x] += 1
-                    rr_splits_to_gaps.reverse()
-
-                    m_per_gap = []
-                    for split in rr_splits_to_gaps:
-                        gaps = [0 for _ in range(split)]
-                        for m_idx in range(cat.num_matches_per_rr):
-                            gaps[(m_idx % split)] += 1
-                        m_per_gap.extend(gaps)
-                    
-                    # If last gap round is shorter than first: reverse m_per_gap
-                    if num_rounds > 1:
-                        if len(rounds[-2]) < len(rounds[0]):
-                            m_per_gap.reverse()
-
-                    # Append matches to rounds according to m_per_gap
-                    for gap_idx, num_matches in enumerate(m_per_gap):
-                        for match_idx in range(num_matches):
-                            rounds[gap_idx].append(cat.matches[match_indices[cat_idx]])
-                            match_indices[cat_idx] += 1
-
-            # Append all matches to days list
-            for round in rounds:
-                matches_per_day[day_idx].extend(round)
-            
-        # Append matches_per_day to tournament.
-        for day_idx in range(num_days):
-            mod_day_idx = get_modified_day_idx(day_idx, shortest_day_idx, num_days)
-            curr_event = MatchEvent(match_dur, [])
-            for m in matches_per_day[day_idx]:
-                curr_event.matches.append(m)
-                if (len(curr_event.matches) == num_fields):
-                    tournament[mod_day_idx].blocks[group_idx].add_event_to_next_available_slot(curr_event)
-                    curr_event = MatchEvent(match_dur, [])
-                # If there remains a partial MatchEvent: Append it to the tournament too
-            if len(curr_event.matches) > 0:
-                tournament[mod_day_idx].blocks[group_idx].add_event_to_next_available_slot(curr_event)
-
-        # TODO: 6. Check for double missions and apply wished strategy:
-        # (a) empty fields, (b) pause, (c) ignore (default)
-        if "double_missions" in curr_group_info and curr_group_info["double_missions"] == "empty_field":
-            for day in tournament:
-                if has_double_missions(day.blocks[group_idx]):  # Check if block has double missions
-                    day.blocks[group_idx] = remove_double_missions_with_empty_field(day.blocks[group_idx], num_fields, match_dur)
-
-        elif "double_missions" in curr_group_info and curr_group_info["double_missions"] == "pause":
-            pause_dur = curr_group_info["pause_dur"]
-            for day in tournament:
-                block = day.blocks[group_idx]
-
-                # Resolve parallel double missions first
-                block = resolve_parallel_double_missions(block, num_fields, match_dur, pause_dur)
-
-                # Resolve sequential double missions
-                prev_teams = set()
-                curr_teams = set()
-                other_ev_buffer = 0
-                insertions = []
-
-                for ev_idx, event in enumerate(block.events):
-                    if isinstance(event, MatchEvent):
-                        curr_teams = event.get_unique_teams()
-                        if has_common_team(prev_teams, curr_teams):
-                            curr_pause = pause_dur - other_ev_buffer
-                            if curr_pause > 0:
-                                pause_event = OtherEvent(curr_pause, "", False, None, None, None, None)
-                                insertions.append((ev_idx, pause_event))
-                        other_ev_buffer = 0
-                        prev_teams = curr_teams
-                    elif isinstance(event, OtherEvent):
-                        other_ev_buffer += event.duration
-
-                for idx, event in reversed(insertions):
-                    block.insert_event_at_position(event, idx)
-
-                day.blocks[group_idx] = block
+        blocks = [day.blocks[group_idx] for day in tournament]
+
+        group_blocks = None
+        if cache is not None:
+            inputs = GroupInputs.collect(group_idx, group_cats, group_info[group], blocks,
+                                         shortest_day_idx, prevent_identical_cat_days)
+            group_blocks = cache.lookup(inputs, registry)
+            if group_blocks is not None:
+                print(f"Group {group}: Reusing cached schedule.")
+                if group in distributions:
+                    distributions[group].cancel()
+        if group_blocks is None:
+            if executor is None:
+                group_blocks = schedule_group(group_cats, group_info[group], blocks, shortest_day_idx, prevent_identical_cat_days)
+            else:
+                group_blocks = fill_group_blocks_in_parallel(executor, distributions[group].result(), group_cats,
+                                                             group_info[group], blocks, shortest_day_idx, registered_teams)
+            if cache is not None:
+                cache.store(inputs, group_blocks)
+        time_limited = any(block.time_limited for block in group_blocks)
+
+        # Referees are taken from the teams of the group
+        if group_info[group].get("referees", False):
+            group_blocks = assign_referees(group_blocks, [team for cat in group_cats for team in cat.teams])
+        # Spread the matches of every team evenly across the fields
+        if group_info[group].get("balance_fields", False):
+            group_blocks = balance_fields(group_blocks)
+
+        for day, block in zip(tournament, group_blocks):
+            block.time_limited = time_limited   # Kept for the disk cache
+            day.blocks[group_idx] = block
 
     # 7. Compact all blocks (remove nones).
     for day_idx in tournament:
         for block in day_idx.blocks:
-            block.events = block.get_valid_events()
+            block.remove_nones()
 
     return tournament
 
+def prepare_category(cat: CategoryRun, num_days: int, prevent_identical_cat_days: bool) -> None:
+    """Creates the rr_runs of a category and adds the metrics needed to distribute them on the days.
+    In Swiss mode, every round of the Swiss system takes the place of a round robin round."""
+    if cat.mode == "swiss":
+        if cat.runs > max_swiss_rounds(len(cat.teams)):
+            cat.runs = max_swiss_rounds(len(cat.teams))
+            print(f"Category '{cat.name}': Swiss system limited to {cat.runs} rounds to avoid rematches.")
+        rr_list = create_swiss_rounds(cat)
+    else:
+        rr_list = create_n_rr_runs(cat, True)
+
+    # Prevent identical consecutive day schedule for a category. Swiss rounds differ anyway (every day
+    # continues with the next rounds), rotating the rounds of the first day would create rematches.
+    if prevent_identical_cat_days and cat.mode != "swiss":
+        if cat.runs % num_days == 0:
+            day_length = len(rr_list) // num_days
+            # Let first
+            rotated = rr_list[:day_length]
+            new_rr_list = rotated.copy()
+            # From day 2 on: Rotate and append
+            for n in range(1, num_days):
+                rotated = [rotated[-1]] + rotated[:-1]  # Last round becomes first
+                new_rr_list.extend(rotated)
+            rr_list = new_rr_list
+
+    cat.rr_runs = rr_list
+    cat.matches = flatten_2d_list(rr_list)
+    # Add metrics to category
+    cat.num_matches_per_rr = len(cat.teams) // 2
+    cat.num_rr_per_day = len(rr_list) / num_days
+    cat.num_rr_per_day_floored = math.floor(cat.num_rr_per_day)
+    cat.num_rr_remaining = len(cat.rr_runs) - (num_days * cat.num_rr_per_day_floored)
+
+def schedule_group(group_cats: List[CategoryRun], curr_group_info: dict, blocks: List[EventBlock],
+                   shortest_day_idx: int, prevent_identical_cat_days: bool) -> List[EventBlock]:
+    """Distributes the matches of the categories of one group on its blocks (one per day, already
+    holding the OtherEvents) and resolves double missions. Returns the resulting block of every day."""
+    num_days = len(blocks)
+    matches_per_day = distribute_group_matches(group_cats, num_days, prevent_identical_cat_days)
+    for day_idx in range(num_days):
+        mod_day_idx = get_modified_day_idx(day_idx, shortest_day_idx, num_days)
+        blocks[mod_day_idx] = fill_group_block(blocks[mod_day_idx], matches_per_day[day_idx], curr_group_info)
+    return blocks
+
+def create_schedule_parallel(model: Model, cache: Optional[GroupScheduleCache] = None,
+                             max_workers: Optional[int] = None) -> List[EventDay]:
+    """Creates the tournament on a new process pool."""
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return create_schedule(model, cache, executor)
+
+def fill_group_blocks_in_parallel(executor: Executor, match_ids_per_day: List[List[tuple]], group_cats: List[CategoryRun],
+                                  curr_group_info: dict, blocks: List[EventBlock], shortest_day_idx: int,
+                                  registered_teams: List[Team]) -> List[EventBlock]:
+    """Like the second part of schedule_group, with one task per day. Matches are exchanged with the worker
+    processes as pairs of team ids. The returned blocks reference the registered teams and the OtherEvents
+    of the blocks, not the copies of the worker processes."""
+    num_days = len(blocks)
+    teams = {team.id: team for cat in group_cats for team in cat.teams}
+    futures = []
+    for day_idx in range(num_days):
+        mod_day_idx = get_modified_day_idx(day_idx, shortest_day_idx, num_days)
+        futures.append((mod_day_idx, executor.submit(_fill_group_block_task, blocks[mod_day_idx],
+                                                     match_ids_per_day[day_idx], curr_group_info, teams)))
+    new_blocks = list(blocks)
+    for mod_day_idx, future in futures:
+        worker_other_events, encoded_events, time_limited = future.result()
+        # The OtherEvents of the block before filling correspond one to one
+        other_event_map = {
+            id(worker_ev): ev
+            for worker_ev, ev in zip(worker_other_events, [ev for ev in blocks[mod_day_idx].events if ev is not None])
+        }
+        events = []
+        for ev in encoded_events:
+            if isinstance(ev, tuple):
+                duration, match_ids = ev
+                ev = MatchEvent(duration, [Match(registered_teams[t1], registered_teams[t2]) for t1, t2 in match_ids])
+            elif ev is not None:
+                ev = other_event_map.get(id(ev), ev)
+            events.append(ev)
+        new_blocks[mod_day_idx] = EventBlock(events)
+        new_blocks[mod_day_idx].time_limited = time_limited
+    return new_blocks
+
+def _distribute_group_matches_task(group_cats: List[CategoryRun], num_days: int, prevent_identical_cat_days: bool):
+    """Runs in a worker process. Returns the matches of every day as (team1 id, team2 id)."""
+    matches_per_day = distribute_group_matches(group_cats, num_days, prevent_identical_cat_days)
+    return [[(m.team1.id, m.team2.id) for m in matches] for matches in matches_per_day]
+
+def _fill_group_block_task(block: EventBlock, match_ids: List[tuple], curr_group_info: dict, teams: dict):
+    """Runs in a worker process. Returns the OtherEvents of the block before filling it (to map them to the
+    instances of the parent process), the events of the filled block, MatchEvents as
+    (duration, [(team1 id, team2 id), ...]), and its time_limited flag."""
+    other_events = [ev for ev in block.events if ev is not None]
+    matches = [Match(teams[t1], teams[t2]) for t1, t2 in match_ids]
+    block = fill_group_block(block, matches, curr_group_info)
+    return other_events, [(ev.duration, [(m.team1.id, m.team2.id) for m in ev.matches]) if isinstance(ev, MatchEvent) else ev
+                          for ev in block.events], block.time_limited
+
+def distribute_group_matches(group_cats: List[CategoryRun], num_days: int, prevent_identical_cat_days: bool) -> List[List[Match]]:
+    """Creates the rr_runs of the categories of a group and merges their matches into one list per day.
+    The result does not depend on the day the group starts with."""
+    for cat in group_cats:
+        prepare_category(cat, num_days, prevent_identical_cat_days)
+
+    group_cats_sorted = sorted(group_cats, key=lambda cat: cat.num_rr_per_day, reverse=True) # Sort by rr_per_day in ascending order
+
+    num_rr_per_cat_and_day = [[] for _ in range(num_days)]
+    # Compute number of categories rr for each day
+    for cat_idx, cat in enumerate(group_cats_sorted):
+        for d_idx, d in enumerate(num_rr_per_cat_and_day):
+            if d_idx < cat.num_rr_remaining:    # If remainder: append another rr
+                d.append(cat.num_rr_per_day_floored + 1)
+            else:
+                d.append(cat.num_rr_per_day_floored)
+
+    matches_per_day = [[] for _ in range(num_days)] # List of list of Matches
+    match_indices = [0 for _ in range(len(group_cats_sorted))]
+
+    for day_idx in range(len(num_rr_per_cat_and_day)):
+        num_rr_per_cat = num_rr_per_cat_and_day[day_idx]
+
+        num_rounds = max(num_rr_per_cat) # Number of rounds depends on longest category
+        rounds = [[] for _ in range(num_rounds)]    # List of Matches
+
+        # Distribute category matches on rounds
+        for cat_idx, cat in enumerate(group_cats_sorted):
+            cat_num_rr = num_rr_per_cat[cat_idx]
+            if cat_num_rr == 0:     # Fewer rr (e.g. Swiss rounds) than days: No matches on this day
+                continue
+            # Case 1 (num_rr is similar): Append entire rr per round
+            if num_rounds <= (cat_num_rr + 1):
+                for round_idx in range(cat_num_rr):
+                    for _ in range(cat.num_matches_per_rr):
+                        rounds[round_idx].append(cat.matches[match_indices[cat_idx]])
+                        match_indices[cat_idx] += 1
+            # Case 2 (num_rr is different): Fill gaps with (partial) rr
+            else:
+                num_gaps = num_rounds - 1 if num_rounds - 1 > 0 else 1
+                gaps = [0 for _ in range(num_gaps)]
+
+                gaps_per_rr = num_gaps // cat_num_rr
+                gaps_remainder = num_gaps % cat_num_rr
+
+                rr_splits_to_gaps = [gaps_per_rr for _ in range(cat_num_rr)]
+                for x in range(gaps_remainder):
+                    rr_splits_to_gaps[x] += 1
+                rr_splits_to_gaps.reverse()
+
+                m_per_gap = []
+                for split in rr_splits_to_gaps:
+                    gaps = [0 for _ in range(split)]
+                    for m_idx in range(cat.num_matches_per_rr):
+                        gaps[(m_idx % split)] += 1
+                    m_per_gap.extend(gaps)
+
+                # If last gap round is shorter than first: reverse m_per_gap
+                if num_rounds > 1:
+                    if len(rounds[-2]) < len(rounds[0]):
+                        m_per_gap.reverse()
+
+                # Append matches to rounds according to m_per_gap
+                for gap_idx, num_matches in enumerate(m_per_gap):
+                    for match_idx in range(num_matches):
+                        rounds[gap_idx].append(cat.matches[match_indices[cat_idx]])
+                        match_indices[cat_idx] += 1
+
+        # Append all matches to days list
+        for round in rounds:
+            matches_per_day[day_idx].extend(round)
+
+    return matches_per_day
+
+def fill_group_block(block: EventBlock, matches: List[Match], curr_group_info: dict) -> EventBlock:
+    """Appends the matches of one day to the block of a group and resolves double missions."""
+    match_dur = curr_group_info["match_dur"]
+    num_fields = curr_group_info["num_fields"]
+
+    if curr_group_info.get("double_missions") == "pack":
+        # Colour the conflict graph of the matches: no team plays twice in a MatchEvent, no repair needed
+        for slot in pack_matches(matches, num_fields):
+            block.add_event_to_next_available_slot(MatchEvent(match_dur, slot))
+    else:
+        curr_event = MatchEvent(match_dur, [])
+        for m in matches:
+            curr_event.matches.append(m)
+            if (len(curr_event.matches) == num_fields):
+                block.add_event_to_next_available_slot(curr_event)
+                curr_event = MatchEvent(match_dur, [])
+        # If there remains a partial MatchEvent: Append it to the block too
+        if len(curr_event.matches) > 0:
+            block.add_event_to_next_available_slot(curr_event)
+
+    # 6. Check for double missions and apply wished strategy
+    resolved_block = resolve_double_missions(block, curr_group_info)
+
+    # Optional: Reorder the matches to avoid double missions. The new order is kept unless it makes the block
+    # longer or lets a team play twice in a MatchEvent more often.
+    if curr_group_info.get("optimize", False):
+        optimized_block = optimize_block(block, curr_group_info)
+        time_limited = optimized_block.time_limited
+        optimized_block = resolve_double_missions(optimized_block, curr_group_info)
+        if (optimized_block.total_duration() <= resolved_block.total_duration()
+                and count_parallel_double_missions(optimized_block) <= count_parallel_double_missions(resolved_block)):
+            resolved_block = optimized_block
+        resolved_block.time_limited = time_limited  # The choice depends on the optimized block as well
+
+    return resolved_block
+
+def resolve_double_missions(block: EventBlock, curr_group_info: dict) -> EventBlock:
+    """Applies the double mission strategy of the group to a filled block:
+    (a) empty fields, (b) pause, (c) ignore (default). Packed blocks ("pack") have no double missions
+    within a MatchEvent and are left as they are. Afterwards the minimum rest of the group (if any) is
+    enforced."""
+    match_dur = curr_group_info["match_dur"]
+    num_fields = curr_group_info["num_fields"]
+    if "double_missions" in curr_group_info and curr_group_info["double_missions"] == "empty_field":
+        if has_double_missions(block):  # Check if block has double missions
+            block = remove_double_missions_with_empty_field(block, num_fields, match_dur)
+
+    elif "double_missions" in curr_group_info and curr_group_info["double_missions"] == "pause":
+        block = resolve_double_missions_with_pauses(block, match_dur, curr_group_info["pause_dur"])
+
+    if curr_group_info.get("min_rest", 0) > 0:
+        block = enforce_min_rest(block, curr_group_info)
+
+    return block
+
 def flatten_2d_list(rr_runs: list) -> list:
     matches = []
     for rr in rr_runs:
@@ -253,8 +386,9 @@ def get_shortest_day_idx(tournament: List[EventDay]) -> int:
 def get_modified_day_idx(day_idx: int, shortest_day_idx: int, num_days: int) -> int:
     return (day_idx + shortest_day_idx) % num_days
 
-def has_common_team(prev_teams: set, curr_teams: set) -> bool:
-    return not prev_teams.isdisjoint(curr_teams)
+def has_common_team(prev_teams: int, curr_teams: int) -> bool:
+    """Teams are given as bitmasks over the team ids (see MatchEvent.get_team_mask)."""
+    return (prev_teams & curr_teams) != 0
 
 def remove_double_missions_with_empty_field(block: EventBlock, num_fields, match_dur):
     new_block = EventBlock()
@@ -266,32 +400,38 @@ def remove_double_missions_with_empty_field(block: EventBlock, num_fields, match
     # Insert all Matches into new block. Prevent double missions.
     events = block.get_valid_events()
     curr_event = MatchEvent(match_dur, [])
-    prev_teams = set()
+    curr_teams = 0  # Bitmask of the team ids of curr_event, updated along with its matches
+    prev_teams = 0
     other_ev_buffer = 0
     for event in events:
         if isinstance(event, MatchEvent):
             matches = event.matches
             for match in matches:
+                match_teams = match.team_mask
                 # Case 1: team1 or team2 already in current event -> Add empty buffer MatchEvent and start new event
-                if (match.team1 in curr_event.get_unique_teams() or match.team2 in curr_event.get_unique_teams()):
+                if match_teams & curr_teams:
                     new_block.add_event_to_next_available_slot(curr_event)
                     new_block.add_event_to_next_available_slot(MatchEvent(match_dur, []))
-                    prev_teams = set()
+                    prev_teams = 0
                     curr_event = MatchEvent(match_dur, [match])
+                    curr_teams = match_teams
                 # Case 2: team1 or team2 in previous event -> Start new event
-                elif (match.team1 in prev_teams or match.team2 in prev_teams):
+                elif match_teams & prev_teams:
                     new_block.add_event_to_next_available_slot(curr_event)
-                    prev_teams = curr_event.get_unique_teams()
+                    prev_teams = curr_teams
                     curr_event = MatchEvent(match_dur, [match])
+                    curr_teams = match_teams
                 # Case 3: no double mission -> Append match to current event
                 else:
                     curr_event.matches.append(match)
+                    curr_teams |= match_teams
                     
                 # If all fields are occupied: Add MatchEvent to block
                 if len(curr_event.matches) == num_fields:
                     new_block.add_event_to_next_available_slot(curr_event)
-                    prev_teams = curr_event.get_unique_teams()
+                    prev_teams = curr_teams
                     curr_event = MatchEvent(match_dur, [])
+                    curr_teams = 0
             
             other_ev_buffer = 0 # Reset buffer time
         
@@ -299,7 +439,7 @@ def remove_double_missions_with_empty_field(block: EventBlock, num_fields, match
             other_ev_buffer += event.duration
             # If buffer from OtherEvent(s) is long enough: no empty field needed.
             if other_ev_buffer >= match_dur:
-                prev_teams = set()
+                prev_teams = 0
 
     # If there remains a partial MatchEvent: Append it to the block as well
     if len(curr_event.matches) > 0:
@@ -308,19 +448,31 @@ def remove_double_missions_with_empty_field(block: EventBlock, num_fields, match
     return new_block
 
 def has_double_missions(block: EventBlock):
-    prev_teams = set()
-    curr_teams = set()
+    prev_teams = 0
+    curr_teams = 0
     for event in block.events:
         if isinstance(event, MatchEvent):
-            curr_teams = event.get_unique_teams()
+            curr_teams = event.get_team_mask()
             if has_common_team(curr_teams, prev_teams):
                 return True
             prev_teams = curr_teams
         elif isinstance(event, OtherEvent):
-            prev_teams = set()
+            prev_teams = 0
 
     return False
 
+def count_parallel_double_missions(block: EventBlock) -> int:
+    """Returns the number of matches whose teams already play in an earlier match of the same MatchEvent."""
+    count = 0
+    for event in block.events:
+        if isinstance(event, MatchEvent):
+            teams_in_event = 0
+            for match in event.matches:
+                if has_common_team(teams_in_event, match.team_mask):
+                    count += 1
+                teams_in_event |= match.team_mask
+    return count
+
 def shuffle_with_seed(lst: list, seed: str | int):
     if isinstance(seed, str):
         seed = int(hashlib.sha256(seed.encode()).hexdigest(), 16) % (10**8)
@@ -329,46 +481,154 @@ def shuffle_with_seed(lst: list, seed: str | int):
     rng.shuffle(shuffled)
     return shuffled
 
-def resolve_parallel_double_missions(block: EventBlock, num_fields, match_dur, pause_dur):
-    new_block = EventBlock()
-    other_ev_buffer = 0
+def resolve_double_missions_with_pauses(block: EventBlock, match_dur, pause_dur) -> EventBlock:
+    """Resolves double missions with pauses in one pass over the events of the block:
+    1. Parallel: Matches of a MatchEvent whose teams already play in it are moved to a followup
+       MatchEvent after a pause (repeatedly, until no team plays twice in a MatchEvent).
+    2. Sequential: A pause is inserted before every MatchEvent which shares a team with the previous
+       MatchEvent.
+    OtherEvents (including the pauses of 1.) since the previous MatchEvent count towards a pause."""
+    events = []
+    # State of 1.
+    parallel_buffer = 0
+    # State of 2.
+    prev_teams = 0
+    sequential_buffer = 0
+
+    def emit(ev):
+        nonlocal prev_teams, sequential_buffer
+        if isinstance(ev, MatchEvent):
+            curr_teams = ev.get_team_mask()
+            if has_common_team(prev_teams, curr_teams):
+                curr_pause = pause_dur - sequential_buffer
+                if curr_pause > 0:
+                    events.append(OtherEvent(curr_pause, "", False, None, None, None, None))
+            sequential_buffer = 0
+            prev_teams = curr_teams
+        else:
+            sequential_buffer += ev.duration
+        events.append(ev)
 
     for ev in block.events:
         if isinstance(ev, MatchEvent):
-            curr_event = MatchEvent(match_dur, [])
-            conflict_buffer = []
-            teams_in_event = set()
-
-            for match in ev.matches:
-                # Check if team is already in this event
-                if (match.team1 in teams_in_event) or (match.team2 in teams_in_event):
-                    # Move to buffer
-                    conflict_buffer.append(match)
-                else:
-                    curr_event.matches.append(match)
-                    teams_in_event.update([match.team1, match.team2])
-
-            # Append valid event
+            curr_event, conflict_buffer = _split_parallel_conflicts(ev.matches, match_dur)
             if len(curr_event.matches) > 0:
-                new_block.add_event_to_next_available_slot(curr_event)
+                emit(curr_event)
 
             # If conflicts existing: Pause, then new event
-            if conflict_buffer:
-                curr_pause = pause_dur - other_ev_buffer
+            while conflict_buffer:
+                curr_pause = pause_dur - parallel_buffer
                 if curr_pause > 0:
-                    pause_event = OtherEvent(curr_pause, "", False, None, None, None, None)
-                    new_block.add_event_to_next_available_slot(pause_event)
-
-                followup_event = MatchEvent(match_dur, conflict_buffer)
-                new_block.add_event_to_next_available_slot(followup_event)
+                    emit(OtherEvent(curr_pause, "", False, None, None, None, None))
+                followup_event, conflict_buffer = _split_parallel_conflicts(conflict_buffer, match_dur)
+                emit(followup_event)
+                parallel_buffer = 0
 
-            other_ev_buffer = 0
+            parallel_buffer = 0
 
         elif isinstance(ev, OtherEvent):
-            new_block.add_event_to_next_available_slot(ev)
-            other_ev_buffer += ev.duration
-            if other_ev_buffer >= match_dur:
-                # Pause is long enough: teams may appear again
-                pass
+            emit(ev)
+            parallel_buffer += ev.duration
 
-    return new_block
+    return EventBlock(events)
+
+def _split_parallel_conflicts(matches: List[Match], match_dur) -> tuple:
+    """Returns a MatchEvent with the matches whose teams do not play in an earlier one of them, and the
+    remaining matches."""
+    curr_event = MatchEvent(match_dur, [])
+    conflict_buffer = []
+    teams_in_event = 0  # Bitmask of team ids
+    for match in matches:
+        match_teams = match.team_mask
+        # Check if team is already in this event
+        if match_teams & teams_in_event:
+            # Move to buffer
+            conflict_buffer.append(match)
+        else:
+            curr_event.matches.append(match)
+            teams_in_event |= match_teams
+    return curr_event, conflict_buffer
+
+def enforce_min_rest(block: EventBlock, curr_group_info: dict) -> EventBlock:
+    """Places the matches of the block again in their order such that every team rests at least
+    "min_rest" slots (events in between) or minutes ("min_rest_unit": "slots" or "minutes") between two
+    matches. A match which would start too early is moved to the next MatchEvent with a free field. If no
+    waiting match fits, the block waits: with a pause for the "pause" strategy, else with an empty field.
+    OtherEvents keep their order. The last slot and the end minute of every team are kept in arrays
+    indexed by team id, so every check is O(1)."""
+    match_dur = curr_group_info["match_dur"]
+    num_fields = curr_group_info["num_fields"]
+    min_rest = curr_group_info["min_rest"]
+    in_minutes = curr_group_info.get("min_rest_unit", "slots") == "minutes"
+    pause_dur = curr_group_info.get("pause_dur", 0) or match_dur
+    wait_with_pause = curr_group_info.get("double_missions") == "pause"
+
+    source_events = block.get_valid_events()
+    num_teams = 1 + max((max(m.team1.id, m.team2.id) for ev in source_events
+                         if isinstance(ev, MatchEvent) for m in ev.matches), default=-1)
+    never = -(1 << 30)
+    last_slot = [never] * num_teams     # Slot index of the last match of a team
+    last_end = [never] * num_teams      # Minute at which the last match of a team ended
+
+    events = []
+    slot = 0
+    clock = 0
+
+    def ready_slot(match: Match) -> int:
+        prev = max(last_slot[match.team1.id], last_slot[match.team2.id])
+        return prev + 1 + (0 if in_minutes else min_rest)
+
+    def ready_minute(match: Match) -> int:
+        prev = max(last_end[match.team1.id], last_end[match.team2.id])
+        return prev + (min_rest if in_minutes else 0)
+
+    def emit(ev) -> None:
+        nonlocal slot, clock
+        events.append(ev)
+        clock += ev.duration
+        if isinstance(ev, MatchEvent):
+            for m in ev.matches:
+                for team_id in (m.team1.id, m.team2.id):
+                    last_slot[team_id] = slot
+                    last_end[team_id] = clock
+        slot += 1
+
+    def wait(waiting: List[Match]) -> None:
+        if not wait_with_pause:
+            emit(MatchEvent(match_dur, []))
+        elif in_minutes:
+            emit(OtherEvent(min(ready_minute(m) for m in waiting) - clock, "", False, None, None, None, None))
+        else:
+            emit(OtherEvent(pause_dur, "", False, None, None, None, None))
+
+    def place(candidates: List[Match], duration: int, keep_empty: bool) -> List[Match]:
+        """Emits a MatchEvent with the first candidates which are rested (waits until at least one of them
+        is). Returns the candidates left over."""
+        while True:
+            chosen = []
+            chosen_teams = 0
+            left = []
+            for m in candidates:
+                if (len(chosen) < num_fields and not (m.team_mask & chosen_teams)
+                        and slot >= ready_slot(m) and clock >= ready_minute(m)):
+                    chosen.append(m)
+                    chosen_teams |= m.team_mask
+                else:
+                    left.append(m)
+            if chosen or keep_empty:
+                emit(MatchEvent(duration, chosen))
+                return left
+            wait(candidates)
+
+    pending = []    # Matches moved back, in their original order
+    for ev in source_events:
+        if isinstance(ev, OtherEvent):
+            emit(ev)
+        elif len(ev.matches) == 0 and not pending:
+            emit(ev)    # Empty field of the double mission strategy
+        else:
+            pending = place(pending + ev.matches, ev.duration, keep_empty=len(ev.matches) == 0)
+    while pending:
+        pending = place(pending, match_dur, keep_empty=False)
+
+    return EventBlock(events)
@@ -0,0 +1,95 @@
+import contextlib
+import copy
+import io
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from model.model import Model
+from core import EventDay
+from utils.tourn_stats.schedule_metrics import compute_schedule_metrics
+from .scheduler import create_schedule
+
+# Weight of every quality measure in ScheduleScore.total (lower total is better)
+SCORE_WEIGHTS = {
+    "num_pauses": 10.0,             # per pause inserted for double missions
+    "num_empty_events": 10.0,       # per empty-field MatchEvent
+    "day_length_spread": 1.0,       # per minute between the longest and the shortest day
+    "home_away_imbalance": 2.0,     # per home match more than away matches (or vice versa), summed over teams
+    "min_rest": -1.0,               # per minute of the shortest rest (capped at MIN_REST_CAP)
+}
+MIN_REST_CAP = 60   # Rests longer than this do not improve the score anymore
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleScore:
+    """Quality measures of a generated tournament."""
+    num_pauses: int
+    num_empty_events: int
+    day_length_spread: int
+    home_away_imbalance: int
+    min_rest: Optional[int]     # Minutes between the end of a match and the next match of the same team on that day
+
+    @property
+    def total(self) -> float:
+        min_rest = MIN_REST_CAP if self.min_rest is None else min(self.min_rest, MIN_REST_CAP)
+        return (SCORE_WEIGHTS["num_pauses"] * self.num_pauses
+                + SCORE_WEIGHTS["num_empty_events"] * self.num_empty_events
+                + SCORE_WEIGHTS["day_length_spread"] * self.day_length_spread
+                + SCORE_WEIGHTS["home_away_imbalance"] * self.home_away_imbalance
+                + SCORE_WEIGHTS["min_rest"] * min_rest)
+
+
+def score_schedule(tournament: List[EventDay]) -> ScheduleScore:
+    """Returns the quality measures of a generated tournament."""
+    metrics = compute_schedule_metrics(tournament)
+    has_gaps = metrics.num_gaps > 0
+    durations = metrics.day_durations
+    return ScheduleScore(
+        num_pauses=metrics.num_pauses,
+        num_empty_events=metrics.num_empty_events,
+        day_length_spread=int(durations.max() - durations.min()) if len(durations) > 0 else 0,
+        home_away_imbalance=int(np.abs(metrics.home - metrics.away).sum()),
+        min_rest=int(metrics.min_rest[has_gaps].min()) if has_gaps.any() else None
+    )
+
+def search_seeds(model: Model, seeds: Iterable[str], executor: Optional[Executor] = None,
+                 chunk_size: int = 4) -> List[Tuple[str, ScheduleScore]]:
+    """Creates the tournament with every shuffle seed and scores it. With an executor (e.g. a
+    ProcessPoolExecutor), chunks of seeds are scheduled in worker processes. The model is not changed.
+    Returns (seed, score) of every seed, best first. Equal scores keep the order of the seeds."""
+    seeds = [str(seed) for seed in seeds]
+    chunks = [seeds[i:i + chunk_size] for i in range(0, len(seeds), chunk_size)]
+    search_model = copy.copy(model)
+    search_model.tournament_generated = []  # Not needed for scheduling, keeps the tasks small
+    if executor is None:
+        results = [_score_seeds_task(search_model, chunk) for chunk in chunks]
+    else:
+        futures = [executor.submit(_score_seeds_task, search_model, chunk) for chunk in chunks]
+        results = [future.result() for future in futures]
+    scores = [result for chunk_results in results for result in chunk_results]
+    return sorted(scores, key=lambda result: result[1].total)
+
+def find_best_seed(model: Model, num_seeds: int, executor: Optional[Executor] = None) -> Tuple[str, ScheduleScore]:
+    """Searches the seeds '1' to 'num_seeds' and writes the best one into the tournament info of the model.
+    Returns the best seed and its score."""
+    best_seed, best_score = search_seeds(model, range(1, num_seeds + 1), executor)[0]
+    info = model.get_tournament_info()
+    info["shuffle"] = True
+    info["shuffle_seed"] = best_seed
+    model.set_tournament_info(info)
+    return best_seed, best_score
+
+def _score_seeds_task(model: Model, seeds: List[str]) -> List[Tuple[str, ScheduleScore]]:
+    """Runs in a worker process (or in the calling process). The schedule of every seed is created on a
+    shallow copy of the model with its own tournament info. Returns (seed, score) of every seed."""
+    seed_model = copy.copy(model)
+    results = []
+    for seed in seeds:
+        seed_model.set_tournament_info({**model.get_tournament_info(), "shuffle": True, "shuffle_seed": seed})
+        with contextlib.redirect_stdout(io.StringIO()):
+            tournament = create_schedule(seed_model)
+        results.append((seed, score_schedule(tournament)))
+    return results
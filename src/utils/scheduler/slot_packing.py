@@ -0,0 +1,109 @@
+import heapq
+from typing import Dict, List, Tuple
+
+from core import Match
+
+
+def pack_matches(matches: List[Match], num_fields: int) -> List[List[Match]]:
+    """Distributes the matches of a day on as few slots (MatchEvents) as possible, without a team playing
+    twice in a slot and with at most num_fields matches per slot. A team playing in two consecutive slots
+    is a soft conflict, which is avoided where possible. Returns the matches of every slot.
+
+    Slots filled in list order (as without packing) are kept if no team plays twice in a slot and they
+    are not worse than the colouring (see colour_matches)."""
+    in_order = [matches[i:i + num_fields] for i in range(0, len(matches), num_fields)]
+    in_order_conflicts = count_conflicts(in_order)
+    if in_order_conflicts == (0, 0):
+        return in_order     # Fewest possible slots without any conflict
+
+    coloured = colour_matches(matches, num_fields)
+    if in_order_conflicts[0] == 0 and (len(in_order), in_order_conflicts[1]) <= (len(coloured), count_conflicts(coloured)[1]):
+        return in_order
+    return coloured
+
+def count_conflicts(slots: List[List[Match]]) -> Tuple[int, int]:
+    """Returns the number of (matches of a team within the same slot beyond the first, teams playing in
+    two consecutive slots)."""
+    hard = 0
+    soft = 0
+    prev_teams = set()
+    for slot in slots:
+        teams = set()
+        for match in slot:
+            for team_id in (match.team1.id, match.team2.id):
+                if team_id in teams:
+                    hard += 1
+                teams.add(team_id)
+        soft += len(teams & prev_teams)
+        prev_teams = teams
+    return hard, soft
+
+def colour_matches(matches: List[Match], num_fields: int) -> List[List[Match]]:
+    """Colours the conflict graph of the matches, where matches sharing a team are adjacent, DSATUR-style.
+
+    A priority queue yields the match whose neighbours already use the most distinct slots (then the one
+    with most neighbours, then the earlier one). It gets the slot which holds no neighbour, has a free field
+    and shares the fewest teams with the slots before and after it, the earliest of these. The lower bound
+    of len(matches) / num_fields slots is opened up front, further slots only if no slot fits."""
+    num_matches = len(matches)
+    team_ids = [(m.team1.id, m.team2.id) for m in matches]
+
+    matches_of_team: Dict[int, List[int]] = {}
+    for m_idx, (team1_id, team2_id) in enumerate(team_ids):
+        matches_of_team.setdefault(team1_id, []).append(m_idx)
+        if team2_id != team1_id:
+            matches_of_team.setdefault(team2_id, []).append(m_idx)
+    degree = [len(matches_of_team[t1]) + len(matches_of_team[t2]) - 2 for t1, t2 in team_ids]
+
+    neighbour_slots = [set() for _ in range(num_matches)]   # Slots used by the neighbours of a match
+    slot_of_match = [-1] * num_matches
+    num_slots = -(-num_matches // num_fields)
+    slots: List[List[int]] = [[] for _ in range(num_slots)]
+    teams_of_slot: List[Dict[int, int]] = [{} for _ in range(num_slots)]   # team id -> matches in the slot
+    open_slots = list(range(num_slots))                      # Slots with a free field, ascending
+
+    # Priority queue of (-saturation, -degree, index). Entries become stale when the saturation grows.
+    queue = [(0, -degree[m_idx], m_idx) for m_idx in range(num_matches)]
+    heapq.heapify(queue)
+
+    def soft_conflicts(slot_idx: int, m_idx: int) -> int:
+        count = 0
+        for neighbour in (slot_idx - 1, slot_idx + 1):
+            if 0 <= neighbour < len(slots):
+                count += sum(1 for t in team_ids[m_idx] if t in teams_of_slot[neighbour])
+        return count
+
+    while queue:
+        neg_saturation, _, m_idx = heapq.heappop(queue)
+        if slot_of_match[m_idx] >= 0 or -neg_saturation != len(neighbour_slots[m_idx]):
+            continue    # Already placed or stale entry
+
+        best_slot = -1
+        best_conflicts = None
+        for slot_idx in open_slots:
+            if slot_idx in neighbour_slots[m_idx]:
+                continue
+            conflicts = soft_conflicts(slot_idx, m_idx)
+            if best_conflicts is None or conflicts < best_conflicts:
+                best_slot, best_conflicts = slot_idx, conflicts
+                if conflicts == 0:
+                    break
+        if best_slot < 0:
+            best_slot = len(slots)
+            slots.append([])
+            teams_of_slot.append({})
+            open_slots.append(best_slot)
+
+        slots[best_slot].append(m_idx)
+        slot_of_match[m_idx] = best_slot
+        if len(slots[best_slot]) >= num_fields:
+            open_slots.remove(best_slot)
+        for t in team_ids[m_idx]:
+            teams_of_slot[best_slot][t] = teams_of_slot[best_slot].get(t, 0) + 1
+            for neighbour in matches_of_team[t]:
+                if slot_of_match[neighbour] < 0 and best_slot not in neighbour_slots[neighbour]:
+                    neighbour_slots[neighbour].add(best_slot)
+                    heapq.heappush(queue, (-len(neighbour_slots[neighbour]), -degree[neighbour], neighbour))
+
+    # Keep the original order of the matches within a slot
+    return [[matches[m_idx] for m_idx in sorted(slot)] for slot in slots]
@@ -0,0 +1,159 @@
+from functools import lru_cache
+from typing import Iterator, List, Optional, Set, Tuple, Union
+
+from core import Category, Match
+from .category_run import CategoryRun
+
+# Swiss system: every round, the teams are ranked by score and paired within their score group (top half
+# against bottom half), teams which cannot be paired there float down to the next group. The tournament is
+# scheduled before any result is known, therefore the scores are projected: the team listed first (the
+# better seed) wins. The pairings then only depend on the number of teams and rounds, like the round robin
+# tables. With an odd number of teams, the lowest ranked team without a bye so far has a bye (counts as win).
+
+MAX_BACKTRACKING_STEPS = 100000
+
+
+def max_swiss_rounds(num_teams: int) -> int:
+    """Returns the number of rounds which can always be paired without rematches. Up to this number, every
+    team has met fewer than half of the teams of a round, so the teams it has not met yet form a graph with a
+    perfect matching (Dirac's theorem), which _pair_without_rematches finds. More rounds may get stuck."""
+    return num_teams // 2
+
+
+
+def iter_swiss_rounds(num_teams: int, num_rounds: int) -> Iterator[Tuple[Tuple[int, int], ...]]:
+    """Yields the rounds of a Swiss system of num_teams teams as pairs of team indices (home, away).
+    The opponents of every team are kept in a set (O(1) checks). If the score groups leave a rematch, the
+    round is paired again by backtracking. Without rematches for num_rounds <= max_swiss_rounds(num_teams)."""
+    scores = [0] * num_teams
+    opponents: List[Set[int]] = [set() for _ in range(num_teams)]
+    home_balance = [0] * num_teams     # Home matches - away matches
+    last_home = [False] * num_teams
+    had_bye = [False] * num_teams
+
+    for rnd in range(num_rounds):
+        # Score groups (best first), teams within a group by seed. Scores are at most rnd + 1.
+        groups = [[] for _ in range(rnd + 2)]
+        for team in range(num_teams):
+            groups[rnd + 1 - scores[team]].append(team)
+
+        if num_teams % 2 == 1:
+            ranked_last_first = [team for group in reversed(groups) for team in reversed(group)]
+            bye = next((team for team in ranked_last_first if not had_bye[team]), ranked_last_first[0])
+            had_bye[bye] = True
+            scores[bye] += 1
+            groups = [[team for team in group if team != bye] for group in groups]
+
+        pairs = _pair_score_groups(groups, opponents)
+        if any(team2 in opponents[team1] for team1, team2 in pairs):
+            ranked = [team for group in groups for team in group]
+            pairs = _pair_without_rematches(ranked, opponents) or pairs
+        rr_matches = []
+        for team1, team2 in pairs:
+            opponents[team1].add(team2)
+            opponents[team2].add(team1)
+            scores[min(team1, team2)] += 1
+            # The team with fewer home than away matches plays at home. On a tie the team which played away
+            # last, else the higher ranked team every second round.
+            key1 = (home_balance[team1], last_home[team1], rnd % 2)
+            key2 = (home_balance[team2], last_home[team2], 1 - rnd % 2)
+            home, away = (team1, team2) if key1 < key2 else (team2, team1)
+            home_balance[home] += 1
+            home_balance[away] -= 1
+            last_home[home] = True
+            last_home[away] = False
+            rr_matches.append((home, away))
+        yield tuple(rr_matches)
+
+def _pair_score_groups(groups: List[List[int]], opponents: List[Set[int]]) -> List[Tuple[int, int]]:
+    """Pairs the teams of every score group, top half against bottom half (Dutch system). Returns the pairs
+    (higher ranked team first)."""
+    pairs = []
+    floaters = []
+    for group in groups:
+        pool = floaters + group
+        half = len(pool) // 2
+        top, bottom = pool[:half], pool[half:]
+        used = [False] * len(bottom)
+        floaters = []
+        start = 0   # First unused team of the bottom half
+        for team in top:
+            partner_idx = start
+            while partner_idx < len(bottom) and (used[partner_idx] or bottom[partner_idx] in opponents[team]):
+                partner_idx += 1
+            if partner_idx == len(bottom):
+                floaters.append(team)   # Floats down to the next score group
+                continue
+            used[partner_idx] = True
+            while start < len(bottom) and used[start]:
+                start += 1
+            pairs.append((team, bottom[partner_idx]))
+        floaters.extend(team for idx, team in enumerate(bottom) if not used[idx])
+
+    # Teams left over at the end: A rematch is swapped with a pair made before (lowest ranked first), if
+    # both new pairs are no rematches. Otherwise it is kept.
+    while floaters:
+        team = floaters.pop(0)
+        partner_idx = next((idx for idx, other in enumerate(floaters) if other not in opponents[team]), 0)
+        partner = floaters.pop(partner_idx)
+        if partner in opponents[team]:
+            for pair_idx in range(len(pairs) - 1, -1, -1):
+                other1, other2 = pairs[pair_idx]
+                if other1 not in opponents[team] and other2 not in opponents[partner]:
+                    pairs[pair_idx] = (other1, team)
+                    team, partner = other2, partner
+                    break
+                if other2 not in opponents[team] and other1 not in opponents[partner]:
+                    pairs[pair_idx] = (other1, partner)
+                    team, partner = other2, team
+                    break
+        pairs.append((team, partner))
+    return pairs
+
+def _pair_without_rematches(ranked: List[int], opponents: List[Set[int]],
+                            max_steps: int = MAX_BACKTRACKING_STEPS) -> Optional[List[Tuple[int, int]]]:
+    """Backtracking over the pairs of a round: the highest ranked free team is paired with the next ranked
+    free team it has not met yet. Returns the pairs (higher ranked team first), or None if there is no
+    pairing without rematches (or it was not found within max_steps)."""
+    free = [True] * len(ranked)
+    pairs = []
+    steps = 0
+
+    def solve(first: int) -> bool:
+        nonlocal steps
+        while first < len(ranked) and not free[first]:
+            first += 1
+        if first == len(ranked):
+            return True
+        free[first] = False
+        team = ranked[first]
+        for idx in range(first + 1, len(ranked)):
+            partner = ranked[idx]
+            if not free[idx] or partner in opponents[team]:
+                continue
+            steps += 1
+            if steps > max_steps:
+                break
+            free[idx] = False
+            pairs.append((team, partner))
+            if solve(first + 1):
+                return True
+            pairs.pop()
+            free[idx] = True
+        free[first] = True
+        return False
+
+    return pairs if solve(0) else None
+
+@lru_cache(maxsize=None)
+def get_swiss_index_table(num_teams: int, num_rounds: int) -> tuple:
+    """Returns all rounds of iter_swiss_rounds, computed once per process and size."""
+    return tuple(iter_swiss_rounds(num_teams, num_rounds))
+
+def create_swiss_rounds(cat: Union[Category, CategoryRun]) -> List[List[Match]]:
+    """Returns the rounds of a Swiss system category. The runs of the category are its number of rounds
+    (at most max_swiss_rounds), the order of its teams is the seeding."""
+    teams = cat.teams
+    num_rounds = min(int(cat.runs), max_swiss_rounds(len(teams)))
+    return [[Match(teams[idx1], teams[idx2]) for idx1, idx2 in rr_matches]
+            for rr_matches in get_swiss_index_table(len(teams), num_rounds)]
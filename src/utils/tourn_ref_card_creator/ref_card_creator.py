@@ -1,9 +1,7 @@
-from datetime import datetime, timedelta
 import os
 import xlsxwriter
 from xlsxwriter.utility import xl_rowcol_to_cell
 
-from core.event import MatchEvent
 from model.model import Model
 
 class RefCardCreator():
@@ -48,19 +46,18 @@ class RefCardCreator():
             ws = self.worksheets[day_idx]
             self._set_col_widths(ws)
             date = self.model_days[day_idx]["Date"]
-            events = day.get_all_valid_events()
+            times = day.get_timetable(self.model_days[day_idx]["Start time"]).get_time_strings()
+            columns = day.get_columns()
             match_idx = 0
             for field_idx in range(day.max_fields()):
-                curr_time = datetime.strptime(self.model_days[day_idx]["Start time"], "%H:%M")
                 field = f"Feld {field_idx + 1}"
-                for ev in events:
-                    if isinstance(ev, MatchEvent) and len(ev.matches) > field_idx:
-                        team1 = ev.matches[field_idx].team1.name
-                        team2 = ev.matches[field_idx].team2.name
-                        time = f"{curr_time.strftime("%H:%M")}"
-                        self._write_ref_card(ws, match_idx, field, date, time, team1, team2)
-                        match_idx += 1
-                    curr_time += timedelta(minutes=ev.duration)
+                # All matches on this field, ordered by time
+                for row in columns.rows_of_field(field_idx):
+                    slot = int(columns.slot[row])
+                    match = day.get_event(slot).matches[field_idx]
+                    referee = "" if match.referee is None else match.referee.name
+                    self._write_ref_card(ws, match_idx, field, date, times[slot], match.team1.name, match.team2.name, referee)
+                    match_idx += 1
             # Set print area
             end_row_idx = (self.CARD_NUM_ROWS * ((match_idx + 1) // 2)) - 1
             end_col_idx = (2 * self.CARD_NUM_COLS) + 1
@@ -82,7 +79,7 @@ class RefCardCreator():
             # Set format to A4
             ws.set_paper(9)
 
-    def _write_ref_card(self, ws, position: int, field: str, date: str, time: str, home: str, away: str):
+    def _write_ref_card(self, ws, position: int, field: str, date: str, time: str, home: str, away: str, referee: str = ""):
         row_offset = (position // 2) * self.CARD_NUM_ROWS
         col_offset = (position % 2) * (self.CARD_NUM_COLS + 2)
         # Header lines top & bottom
@@ -105,6 +102,9 @@ class RefCardCreator():
         ws.write(row_offset + 8, col_offset + 5, "", self.score_fmt)
         ws.write(row_offset + 8, col_offset + 6, ":", self.score_fmt)
         ws.write(row_offset + 8, col_offset + 7, "", self.score_fmt)
+        # Referee
+        if referee:
+            ws.write(row_offset + 9, col_offset + 2, f"Schiri: {referee}", self.result_fmt)
         # Signature
         for idx in range(3):
             ws.write(row_offset + 10, col_offset + 2 + idx, "", self.sign_fmt)
@@ -0,0 +1,174 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from core import Category, EventDay
+
+# A gap is the time between two consecutive matches of a team on the same day. Its rest slots are the
+# events (matches, pauses, breaks) in between, a back-to-back is a gap without any event in between.
+
+
+@dataclass(slots=True)
+class MetricsSummary:
+    """Aggregated metrics of a set of teams (e.g. a category or a group)."""
+    num_teams: int
+    num_matches: int
+    min_rest: Optional[int]         # Minutes, None if no team plays twice on a day
+    mean_rest: Optional[float]      # Minutes
+    longest_idle: int               # Minutes
+    back_to_backs: int
+    home_away_imbalance: int        # Sum over the teams of |home - away|
+
+
+@dataclass(slots=True)
+class ScheduleMetrics:
+    """Quality metrics of a generated tournament. Per team arrays are indexed by team id."""
+    # Per team
+    home: np.ndarray
+    away: np.ndarray
+    num_gaps: np.ndarray
+    back_to_backs: np.ndarray
+    min_rest: np.ndarray            # Minutes (float, NaN without gaps)
+    mean_rest: np.ndarray           # Minutes (float, NaN without gaps)
+    longest_idle: np.ndarray        # Longest gap in minutes (0 without gaps)
+    min_rest_slots: np.ndarray      # Fewest events between two matches (-1 without gaps)
+    field_counts: np.ndarray        # Matches per (team, field)
+    # Per day
+    day_durations: np.ndarray
+    block_utilisation: List[np.ndarray]     # Per block: matches / (match slots * fields of the block)
+    # Entire tournament
+    num_pauses: int
+    num_empty_events: int
+
+    @property
+    def num_teams(self) -> int:
+        return len(self.home)
+
+    @property
+    def num_matches(self) -> np.ndarray:
+        return self.home + self.away
+
+    def plays_all(self, team_ids: Iterable[int]) -> bool:
+        """Returns True if every team plays in the tournament. False for teams added (or changed) after
+        the tournament was generated."""
+        return all(team_id is not None and 0 <= team_id < self.num_teams and self.num_matches[team_id] > 0
+                   for team_id in team_ids)
+
+    def summarize(self, team_ids: Iterable[int]) -> MetricsSummary:
+        """Returns the aggregated metrics of the teams with the given ids."""
+        ids = np.array([team_id for team_id in team_ids if team_id is not None and 0 <= team_id < self.num_teams],
+                       dtype=np.int64)
+        num_gaps = int(self.num_gaps[ids].sum())
+        has_gaps = self.num_gaps[ids] > 0
+        return MetricsSummary(
+            num_teams=len(ids),
+            num_matches=int(self.num_matches[ids].sum()),
+            min_rest=int(self.min_rest[ids][has_gaps].min()) if num_gaps > 0 else None,
+            mean_rest=float((self.mean_rest[ids][has_gaps] * self.num_gaps[ids][has_gaps]).sum() / num_gaps) if num_gaps > 0 else None,
+            longest_idle=int(self.longest_idle[ids].max()) if len(ids) > 0 else 0,
+            back_to_backs=int(self.back_to_backs[ids].sum()),
+            home_away_imbalance=int(np.abs(self.home[ids] - self.away[ids]).sum())
+        )
+
+    def summarize_groups(self, categories: List[Category]) -> Dict[str, MetricsSummary]:
+        """Returns the aggregated metrics of every group of the categories."""
+        group_teams: Dict[str, List[int]] = {}
+        for cat in categories:
+            group_teams.setdefault(cat.group, []).extend(team.id for team in cat.teams)
+        return {group: self.summarize(team_ids) for group, team_ids in group_teams.items()}
+
+
+def compute_schedule_metrics(tournament: List[EventDay]) -> ScheduleMetrics:
+    """Returns the metrics of a generated tournament, computed on the columnar form of its days."""
+    gap_teams, gap_minutes, gap_slots = [], [], []
+    homes, aways, fields, field_teams = [], [], [], []
+    block_utilisation = []
+    num_pauses = 0
+    num_empty_events = 0
+
+    for day in tournament:
+        columns = day.get_columns()
+        homes.append(columns.home)
+        aways.append(columns.away)
+        field_teams.append(np.concatenate([columns.home, columns.away]))
+        fields.append(np.concatenate([columns.field, columns.field]))
+
+        # Pauses inserted by the scheduler are the only OtherEvents without placement
+        num_pauses += sum(1 for ev in columns.other_events if ev.bef_dur_aft is None)
+        is_match_slot = np.ones(columns.num_slots, dtype=bool)
+        is_match_slot[columns.other_slot] = False
+        used_slots = np.zeros(columns.num_slots, dtype=bool)
+        used_slots[columns.slot] = True
+        num_empty_events += int((is_match_slot & ~used_slots).sum())
+
+        # Consecutive matches of every team, ordered by (team, slot)
+        teams = np.concatenate([columns.home, columns.away])
+        slots = np.concatenate([columns.slot, columns.slot])
+        starts = np.concatenate([columns.start, columns.start])
+        ends = starts + np.concatenate([columns.duration, columns.duration])
+        order = np.lexsort((slots, teams))
+        teams, slots, starts, ends = teams[order], slots[order], starts[order], ends[order]
+        same_team = (teams[1:] == teams[:-1]) & (teams[1:] >= 0)
+        gap_teams.append(teams[1:][same_team])
+        gap_minutes.append(starts[1:][same_team] - ends[:-1][same_team])
+        gap_slots.append(slots[1:][same_team] - slots[:-1][same_team] - 1)
+
+        # Slot utilisation of the blocks: slot s belongs to block slot_block[s]
+        num_blocks = len(day.blocks)
+        slot_block = np.repeat(np.arange(num_blocks), [block.number_of_events() for block in day.blocks])
+        match_slots = np.bincount(slot_block[is_match_slot], minlength=num_blocks)
+        matches = np.bincount(slot_block[columns.slot], minlength=num_blocks)
+        capacity = match_slots * np.array([block.get_metrics().max_fields for block in day.blocks], dtype=np.int64)
+        utilisation = np.full(num_blocks, np.nan)
+        np.divide(matches, capacity, out=utilisation, where=capacity > 0)
+        block_utilisation.append(utilisation)
+
+    home = _concat(homes)
+    away = _concat(aways)
+    num_teams = int(max(home.max(initial=-1), away.max(initial=-1))) + 1
+    home_counts = np.bincount(home[home >= 0], minlength=num_teams)
+    away_counts = np.bincount(away[away >= 0], minlength=num_teams)
+
+    field_team = _concat(field_teams)
+    field = _concat(fields)
+    num_fields = int(field.max(initial=-1)) + 1
+    registered = field_team >= 0
+    field_counts = np.bincount(field_team[registered] * num_fields + field[registered],
+                               minlength=num_teams * num_fields).reshape(num_teams, num_fields)
+
+    gap_team = _concat(gap_teams)
+    gap_minute = _concat(gap_minutes)
+    gap_slot = _concat(gap_slots)
+    num_gaps = np.bincount(gap_team, minlength=num_teams)
+    has_gaps = num_gaps > 0
+
+    min_rest = np.full(num_teams, np.inf)
+    np.minimum.at(min_rest, gap_team, gap_minute)
+    min_rest[~has_gaps] = np.nan
+    mean_rest = np.full(num_teams, np.nan)
+    np.divide(np.bincount(gap_team, weights=gap_minute, minlength=num_teams), num_gaps, out=mean_rest, where=has_gaps)
+    longest_idle = np.zeros(num_teams, dtype=np.int64)
+    np.maximum.at(longest_idle, gap_team, gap_minute)
+    min_rest_slots = np.full(num_teams, np.iinfo(np.int64).max)
+    np.minimum.at(min_rest_slots, gap_team, gap_slot)
+    min_rest_slots[~has_gaps] = -1
+
+    return ScheduleMetrics(
+        home=home_counts,
+        away=away_counts,
+        num_gaps=num_gaps,
+        back_to_backs=np.bincount(gap_team[gap_slot == 0], minlength=num_teams),
+        min_rest=min_rest,
+        mean_rest=mean_rest,
+        longest_idle=longest_idle,
+        min_rest_slots=min_rest_slots,
+        field_counts=field_counts,
+        day_durations=np.array([day.total_duration() for day in tournament], dtype=np.int64),
+        block_utilisation=block_utilisation,
+        num_pauses=num_pauses,
+        num_empty_events=num_empty_events
+    )
+
+def _concat(arrays: List[np.ndarray]) -> np.ndarray:
+    return np.concatenate(arrays).astype(np.int64) if arrays else np.zeros(0, dtype=np.int64)
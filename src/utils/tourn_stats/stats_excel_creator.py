@@ -1,4 +1,3 @@
-from datetime import datetime, timedelta
 import xlsxwriter
 import time, os
 
@@ -79,30 +78,28 @@ class StatsExcelCreator():
                 ws.set_column(col_offset+2, col_offset+2, 20)
 
             row_idx = 2
-            curr_time = datetime.strptime(model_days[day_idx]["Start time"], "%H:%M")
-            for ev in day.get_all_valid_events():
+            times = day.get_timetable(model_days[day_idx]["Start time"]).get_time_strings()
+            for ev_idx, ev in day.iter_events():
                 if isinstance(ev, MatchEvent):
                     for field_idx in range(max_num_fields):
                         col_offset = start_col + field_idx * 3
                         if field_idx < len(ev.matches):
                             m = ev.matches[field_idx]
-                            ws.write(row_idx, col_offset, curr_time.strftime("%H:%M"), self.time_fmt)
+                            ws.write(row_idx, col_offset, times[ev_idx], self.time_fmt)
                             home_fmt = self._add_and_get_color_format(m.team1.color)
                             away_fmt = self._add_and_get_color_format(m.team2.color)
                             ws.write(row_idx, col_offset+1, m.team1.name, home_fmt)
                             ws.write(row_idx, col_offset+2, m.team2.name, away_fmt)
                         else:
-                            ws.write(row_idx, col_offset,   curr_time.strftime("%H:%M"), self.time_fmt)
+                            ws.write(row_idx, col_offset,   times[ev_idx], self.time_fmt)
                             ws.write(row_idx, col_offset+1, "", self.team_fmt)
                             ws.write(row_idx, col_offset+2, "", self.team_fmt)
                     row_idx += 1
                 elif isinstance(ev, OtherEvent):
-                    ws.write(row_idx, start_col, curr_time.strftime("%H:%M"), self.time_fmt)
+                    ws.write(row_idx, start_col, times[ev_idx], self.time_fmt)
                     ws.merge_range(row_idx, start_col+1, row_idx, end_col, ev.label, self.other_fmt)
                     row_idx += 1
 
-                curr_time += timedelta(minutes=ev.duration)
-
             start_col = end_col + 2
 
 
@@ -136,8 +133,9 @@ class StatsExcelCreator():
                 home = 0
                 away = 0
                 for day in tourn_days:
-                    home += day.count_team_home(team)
-                    away += day.count_team_away(team)
+                    occurrences = day.get_team_occurrences(team)
+                    home += occurrences.home
+                    away += occurrences.away
                 ws.write(row_idx, col_idx, team.name, self._add_and_get_color_format(team.color))
                 ws.write(row_idx, col_idx + 1, home + away)
                 ws.write(row_idx, col_idx + 2, home)
@@ -163,10 +161,11 @@ class StatsExcelCreator():
             row_idx = 2
             for cat in cats:
                 for team in cat.teams:
+                    occurrences = day.get_team_occurrences(team)
                     ws.write(row_idx, col_idx, team.name, self._add_and_get_color_format(team.color))
-                    ws.write(row_idx, col_idx + 1, day.count_team_total(team))
-                    ws.write(row_idx, col_idx + 2, day.count_team_home(team))
-                    ws.write(row_idx, col_idx + 3, day.count_team_away(team))
+                    ws.write(row_idx, col_idx + 1, occurrences.total)
+                    ws.write(row_idx, col_idx + 2, occurrences.home)
+                    ws.write(row_idx, col_idx + 3, occurrences.away)
 
                     row_idx += 1
                 row_idx += 1
@@ -83,6 +83,10 @@ class DataSheetsWriter():
         day_col_offsets = self._get_day_col_offsets()
         day_col_offsets = day_col_offsets[:-1]  # Remove last element
 
+        # Day metrics do not depend on the team: Look them up once per day
+        day_num_fields = [day.max_fields() for day in self.tourn_generated]
+        day_num_events = [day.total_events() for day in self.tourn_generated]
+
         cats = self.model.get_categories()
         row_idx = 1 + row_offset
         
@@ -104,10 +108,10 @@ class DataSheetsWriter():
                 # 1. Collect and sum up metrics per day
                 for day_idx, day in enumerate(self.tourn_generated):
                     day_col_offset = day_col_offsets[day_idx]
-                    num_fields = day.max_fields()
+                    num_fields = day_num_fields[day_idx]
 
                     mtrc_col_range = (num_fields * 2)
-                    day_num_rows = day.total_events() + 3
+                    day_num_rows = day_num_events[day_idx] + 3
 
                     # Metric sums from one day
                     for metr in range(7):
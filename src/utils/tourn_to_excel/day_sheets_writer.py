@@ -1,4 +1,3 @@
-from datetime import datetime, timedelta
 from core.event import MatchEvent, OtherEvent
 from model.model import Model
 
@@ -188,34 +187,24 @@ class DaySheetsWriter():
         for day_idx, day in enumerate(self.tourn_generated):
             num_fields = day.max_fields()
             ws = self.worksheets[day_idx]
-            curr_time = datetime.strptime(model_days[day_idx]["Start time"], "%H:%M")
-            # Time for every field + in last row
-            for ev_idx, event in enumerate(day.get_all_valid_events()):
+            times = day.get_timetable(model_days[day_idx]["Start time"]).get_time_strings()
+            # Time for every field + in last row (ending time)
+            for ev_idx, time in enumerate(times):
                 for n in range(num_fields + 1):
                     col_idx = self.get_time_col_idx(n)
                     if n == 0:
-                        ws.write(start_row_idx + ev_idx, col_idx, f"{curr_time.strftime("%H:%M")}", self.standard_format_all_borders_left_fat)
+                        ws.write(start_row_idx + ev_idx, col_idx, time, self.standard_format_all_borders_left_fat)
                     elif n == num_fields:
-                        ws.write(start_row_idx + ev_idx, col_idx, f"{curr_time.strftime("%H:%M")}", self.standard_format_all_borders_right_fat)
+                        ws.write(start_row_idx + ev_idx, col_idx, time, self.standard_format_all_borders_right_fat)
                     else:
-                        ws.write(start_row_idx + ev_idx, col_idx, f"{curr_time.strftime("%H:%M")}", self.standard_format_all_borders)
-                curr_time += timedelta(minutes=event.duration)
-            # Add ending time
-            for n in range(num_fields + 1):
-                col_idx = self.get_time_col_idx(n)
-                if n == 0:
-                    ws.write(start_row_idx + ev_idx + 1, col_idx, f"{curr_time.strftime("%H:%M")}", self.standard_format_all_borders_left_fat)
-                elif n == num_fields:
-                    ws.write(start_row_idx + ev_idx + 1, col_idx, f"{curr_time.strftime("%H:%M")}", self.standard_format_all_borders_right_fat)
-                else:
-                    ws.write(start_row_idx + ev_idx + 1, col_idx, f"{curr_time.strftime("%H:%M")}", self.standard_format_all_borders)
+                        ws.write(start_row_idx + ev_idx, col_idx, time, self.standard_format_all_borders)
 
     # Write all events + bottom row border
     def write_events_and_appendix(self, start_row_idx):
         for day_idx, day in enumerate(self.tourn_generated):
             num_fields = day.max_fields()
             ws = self.worksheets[day_idx]
-            for ev_idx, ev in enumerate(day.get_all_valid_events()):
+            for ev_idx, ev in day.iter_events():
                 if isinstance(ev, OtherEvent):
                     self._write_other_event(ws, ev, ev_idx + start_row_idx, num_fields)
                 elif isinstance(ev, MatchEvent):
@@ -242,7 +231,7 @@ class DaySheetsWriter():
             worksheet.write(row_idx, center_col_idx + 2, match.team2.name, away_format)   # Away team
             self._write_points_cells(worksheet, row_idx, center_col_idx)
             self._write_result_cells(worksheet, row_idx, center_col_idx)
-            self._write_ref_cells(worksheet, row_idx, num_fields, m_idx)
+            self._write_ref_cells(worksheet, row_idx, num_fields, m_idx, match.referee)
 
     def _write_points_cells(self, worksheet, row_idx, center_col_idx):
         home_res_cell = xl_rowcol_to_cell(row_idx, center_col_idx - 1)
@@ -259,10 +248,10 @@ class DaySheetsWriter():
             worksheet.write(row_idx, col_idx, "", self.result_cell_format)
         worksheet.write(row_idx, center_col_idx, ":", self.colon_cell_format)
 
-    def _write_ref_cells(self, worksheet, row_idx, num_fields, field_idx):
+    def _write_ref_cells(self, worksheet, row_idx, num_fields, field_idx, referee=None):
         # for field_idx in range(0, num_fields):
         col_idx = self.get_ref_col_idx(num_fields, field_idx)
-        worksheet.write(row_idx, col_idx, "", self.ref_cell_format)
+        worksheet.write(row_idx, col_idx, "" if referee is None else referee.name, self.ref_cell_format)
 
     def _write_appendix_and_get_last_row_idx(self, worksheet, start_row_idx, num_fields):
         appendix = self.model.get_tournament_info().get("appendix_day_info", "")
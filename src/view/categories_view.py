@@ -1,6 +1,6 @@
 from PyQt5.QtWidgets import (
     QWidget, QTableWidget, QTableWidgetItem, QVBoxLayout, QToolBar, QAction,
-    QHeaderView, QColorDialog, QSpinBox
+    QHeaderView, QColorDialog, QSpinBox, QComboBox
 )
 from PyQt5.QtGui import QColor, QBrush, QKeySequence, QFont
 from PyQt5.QtCore import Qt
@@ -10,7 +10,7 @@ from core import Team, Category
 
 class CategoriesView(QWidget):
     MAX_CATEGORIES = 10
-    MAX_TEAMS = 30
+    MAX_TEAMS = 100
 
     CELL_WIDTH = 240
     CELL_HEIGHT = 30
@@ -18,7 +18,11 @@ class CategoriesView(QWidget):
     TITLE_ROW_INDEX = 0
     GROUP_ROW_INDEX = 1
     RUNS_ROW_INDEX = 2
-    TEAM_ROW_OFFSET = 3  # Teams start at this row
+    MODE_ROW_INDEX = 3
+    TEAM_ROW_OFFSET = 4  # Teams start at this row
+
+    # Text in the mode row -> Category.mode
+    MODES = {"Round robin": "round_robin", "Swiss": "swiss"}
 
     def __init__(self, controller=None):
         super().__init__()
@@ -56,7 +60,8 @@ class CategoriesView(QWidget):
         # Vertical headers
         self.table.setVerticalHeaderItem(self.TITLE_ROW_INDEX, QTableWidgetItem("Category Name"))
         self.table.setVerticalHeaderItem(self.GROUP_ROW_INDEX, QTableWidgetItem("Group"))
-        self.table.setVerticalHeaderItem(self.RUNS_ROW_INDEX, QTableWidgetItem("Runs"))
+        self.table.setVerticalHeaderItem(self.RUNS_ROW_INDEX, QTableWidgetItem("Runs / Rounds"))
+        self.table.setVerticalHeaderItem(self.MODE_ROW_INDEX, QTableWidgetItem("Mode"))
         for row in range(self.TEAM_ROW_OFFSET, total_rows):
             self.table.setVerticalHeaderItem(row, QTableWidgetItem(f"Team {row - self.TEAM_ROW_OFFSET + 1}"))
 
@@ -79,6 +84,12 @@ class CategoriesView(QWidget):
             runs_spin.setFrame(False)
             self.table.setCellWidget(self.RUNS_ROW_INDEX, col, runs_spin)
 
+            # Mode: Round robin (runs) or Swiss system (rounds)
+            mode_combo = QComboBox()
+            mode_combo.addItems(list(self.MODES))
+            mode_combo.setFrame(False)
+            self.table.setCellWidget(self.MODE_ROW_INDEX, col, mode_combo)
+
             self.table.setColumnWidth(col, self.CELL_WIDTH)
 
         # Row height
@@ -132,6 +143,10 @@ class CategoriesView(QWidget):
                     spin = self.table.cellWidget(r, c)
                     row_data.append(str(spin.value()) if spin else "")
                     row_colors.append("")
+                elif r == self.MODE_ROW_INDEX:
+                    combo = self.table.cellWidget(r, c)
+                    row_data.append(combo.currentText() if combo else "")
+                    row_colors.append("")
                 else:
                     item = self.table.item(r, c)
                     row_data.append(item.text() if item else "")
@@ -182,6 +197,11 @@ class CategoriesView(QWidget):
                         except ValueError:
                             pass
 
+                elif r == self.MODE_ROW_INDEX:
+                    combo = self.table.cellWidget(r, c)
+                    if combo and text in self.MODES:
+                        combo.setCurrentText(text)
+
                 else:
                     item = self.table.item(r, c)
                     if not item:
@@ -224,6 +244,9 @@ class CategoriesView(QWidget):
             runs_widget = self.table.cellWidget(self.RUNS_ROW_INDEX, col)
             runs = str(runs_widget.value()) if runs_widget else ""
 
+            mode_widget = self.table.cellWidget(self.MODE_ROW_INDEX, col)
+            mode = self.MODES.get(mode_widget.currentText(), "round_robin") if mode_widget else "round_robin"
+
             # Background color from category cell
             cat_color = self.column_colors.get((self.TITLE_ROW_INDEX, col))
             bg_color = cat_color.name() if cat_color else "#FFFFFF"
@@ -238,7 +261,7 @@ class CategoriesView(QWidget):
                     teams.append(Team(name=text, color=color_hex))
 
             if name or teams:
-                cat = Category(name=name, group=group, runs=runs, teams=teams, bg_color=bg_color)
+                cat = Category(name=name, group=group, runs=runs, teams=teams, bg_color=bg_color, mode=mode)
                 categories.append(cat)
 
         # Compare with previous groupings.
@@ -266,6 +289,11 @@ class CategoriesView(QWidget):
             if runs_spin:
                 runs_spin.setValue(0)
 
+            # Reset Mode
+            mode_combo = self.table.cellWidget(self.MODE_ROW_INDEX, col)
+            if mode_combo:
+                mode_combo.setCurrentText("Round robin")
+
             # Empty Team rows
             for row in range(self.TEAM_ROW_OFFSET, self.table.rowCount()):
                 self.table.setItem(row, col, QTableWidgetItem(""))
@@ -301,6 +329,11 @@ class CategoriesView(QWidget):
                 except (ValueError, TypeError):
                     pass
 
+            # Mode
+            mode_combo = self.table.cellWidget(self.MODE_ROW_INDEX, col)
+            if mode_combo:
+                mode_combo.setCurrentText("Swiss" if category.mode == "swiss" else "Round robin")
+
             # Teams
             for i, team in enumerate(category.teams):
                 row = self.TEAM_ROW_OFFSET + i
@@ -1,14 +1,13 @@
-from datetime import datetime, timedelta
-
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem,
-    QHeaderView, QAbstractScrollArea
+    QHeaderView, QAbstractScrollArea, QSpinBox
 )
 from PyQt5.QtGui import QFont, QBrush, QColor
 from PyQt5.QtCore import Qt
 
 from core import MatchEvent, OtherEvent
 from view.status_label import StatusLabel
+from utils.tourn_stats.schedule_metrics import compute_schedule_metrics
 
 class CreateTourn(QWidget):
     def __init__(self, controller):
@@ -29,15 +28,26 @@ class CreateTourn(QWidget):
         button_layout.setSpacing(40)
 
         regenerate_btn = QPushButton("Regenerate")
+        search_seed_btn = QPushButton("Search best seed")
         export_btn = QPushButton("Export to Excel")
 
-        for btn in [regenerate_btn, export_btn]:
+        for btn in [regenerate_btn, search_seed_btn, export_btn]:
             btn.setFont(QFont("Arial", 10, QFont.Bold))
             btn.setFixedSize(240, 50)
 
+        # Number of shuffle seeds tried by "Search best seed"
+        self.num_seeds_input = QSpinBox()
+        self.num_seeds_input.setRange(2, 1000)
+        self.num_seeds_input.setValue(20)
+        self.num_seeds_input.setSuffix(" seeds")
+        self.num_seeds_input.setFixedHeight(50)
+
         regenerate_btn.clicked.connect(self.generate_tourn)
+        search_seed_btn.clicked.connect(self.search_best_seed)
         export_btn.clicked.connect(self.export_excel)
         button_layout.addWidget(regenerate_btn)
+        button_layout.addWidget(search_seed_btn)
+        button_layout.addWidget(self.num_seeds_input)
         button_layout.addWidget(export_btn)
 
         self.main_layout.addLayout(button_layout)
@@ -57,9 +67,28 @@ class CreateTourn(QWidget):
 
     def generate_tourn(self):
         if self.model_is_complete():
-            self.controller.generate_tournament_from_model()    # Generate tournament from Model
+            from_cache = self.controller.generate_tournament_from_model()    # Generate tournament from Model
             self.build_schedule_tables()    # Generate table with tournament
-            self.status_label.show_message("Tournament regenerated", 3000)
+            summary = self.metrics_summary()
+            if from_cache:
+                self.status_label.show_message(f"Tournament loaded from cache ({summary})", 5000)
+            else:
+                self.status_label.show_message(f"Tournament regenerated ({summary})", 5000)
+
+    def metrics_summary(self) -> str:
+        model = self.controller.model
+        metrics = compute_schedule_metrics(model.get_tournament_generated())
+        summary = metrics.summarize(team.id for cat in model.get_categories() for team in cat.teams)
+        min_rest = "-" if summary.min_rest is None else f"{summary.min_rest} min"
+        return (f"min. rest {min_rest}, {summary.back_to_backs} back-to-backs, "
+                f"{metrics.num_pauses} pauses, {metrics.num_empty_events} empty fields")
+
+    def search_best_seed(self):
+        if self.model_is_complete():
+            best_seed, best_score = self.controller.search_best_seed(self.num_seeds_input.value())
+            self.build_schedule_tables()
+            self.status_label.show_message(f"✅ Best seed: '{best_seed}' (score {best_score.total:.0f}, "
+                                           f"{best_score.num_pauses} pauses, {best_score.num_empty_events} empty fields)", 6000)
 
     # Use export module
     def export_excel(self):
@@ -112,7 +141,7 @@ class CreateTourn(QWidget):
         for day in tourn_generated:
             num_cols += 1 + day.max_fields() * 4    # 1 for time, per fields: [home, ":", away, spacer]
             day_col_start_indices.append(num_cols)
-            total_events = len(day.get_all_valid_events())
+            total_events = day.total_events()
             if total_events > 0:
                 num_rows = max(num_rows, total_events + 2)  # +2 for header
 
@@ -164,15 +193,12 @@ class CreateTourn(QWidget):
                     self.table.setColumnWidth(col_offset + (m_e * 4), 30)   # Spacer between matches
 
             # b) starting times
-            if day.total_events() > 0:
-                curr_time = datetime.strptime(model_days[day_idx]["Start time"], "%H:%M")
-            else:
-                curr_time = datetime.strptime("00:00", "%H:%M")
-            for ev_idx, event in enumerate(day.get_all_valid_events()):
-                time_item = QTableWidgetItem(f"{curr_time.strftime("%H:%M")}")
+            start_time = model_days[day_idx]["Start time"] if day.total_events() > 0 else "00:00"
+            times = day.get_timetable(start_time).get_time_strings()
+            for ev_idx, event in day.iter_events():
+                time_item = QTableWidgetItem(times[ev_idx])
                 time_item.setTextAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
                 self.table.setItem(ev_idx + 2, col_offset, time_item)
-                curr_time += timedelta(minutes=event.duration)
 
                 # c) OtherEvents
                 if isinstance(event, OtherEvent):
@@ -1,5 +1,5 @@
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, QComboBox, QSpacerItem, QSizePolicy
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, QComboBox, QSpacerItem, QSizePolicy, QCheckBox
 )
 from PyQt5.QtCore import Qt
 
@@ -66,10 +66,11 @@ class GroupInfoView(QWidget):
 
             # --- Double Missions Dropdown ---
             combo_double = QComboBox()
-            combo_double.addItems(["Empty fields", "Pause", "Ignore"])
+            combo_double.addItems(["Empty fields", "Pause", "Pack", "Ignore"])
             default_value = group_info.get(group_id_str, {}).get("double_missions", "Empty fields")
             combo_double.setCurrentText(
                 "Pause" if default_value == "pause" else
+                "Pack" if default_value == "pack" else
                 "Ignore" if default_value == "ignore" else
                 "Empty fields"
             )
@@ -101,12 +102,46 @@ class GroupInfoView(QWidget):
                 lambda _, cb=combo_double, pc=pause_container: pc.setVisible(cb.currentText() == "Pause")
             )
 
+            # --- Minimum rest between two matches of a team (0: off) ---
+            spin_min_rest = QSpinBox()
+            spin_min_rest.setMinimum(0)
+            spin_min_rest.setMaximum(999)
+            spin_min_rest.setValue(group_info.get(group_id_str, {}).get("min_rest", 0))
+            combo_rest_unit = QComboBox()
+            combo_rest_unit.addItems(["Slots", "Minutes"])
+            combo_rest_unit.setCurrentText(
+                "Minutes" if group_info.get(group_id_str, {}).get("min_rest_unit", "slots") == "minutes" else "Slots"
+            )
+            row_layout.addWidget(QLabel("Min. rest:"))
+            row_layout.addWidget(spin_min_rest)
+            row_layout.addWidget(combo_rest_unit)
+
+            # --- Optimizer: Reorder matches to avoid double missions ---
+            check_optimize = QCheckBox("Optimize order")
+            check_optimize.setChecked(group_info.get(group_id_str, {}).get("optimize", False))
+            row_layout.addWidget(check_optimize)
+
+            # --- Referees: Teams of the group referee the matches ---
+            check_referees = QCheckBox("Assign referees")
+            check_referees.setChecked(group_info.get(group_id_str, {}).get("referees", False))
+            row_layout.addWidget(check_referees)
+
+            # --- Balance fields: Every team plays on all fields about equally often ---
+            check_balance_fields = QCheckBox("Balance fields")
+            check_balance_fields.setChecked(group_info.get(group_id_str, {}).get("balance_fields", False))
+            row_layout.addWidget(check_balance_fields)
+
             # Save widgets
             self.group_fields[group_id] = {
                 "match_dur": spin_match,
                 "num_fields": spin_fields,
                 "double_missions": combo_double,
                 "pause_dur": spin_pause,
+                "optimize": check_optimize,
+                "min_rest": spin_min_rest,
+                "min_rest_unit": combo_rest_unit,
+                "referees": check_referees,
+                "balance_fields": check_balance_fields,
             }
 
             row_layout.addStretch()
@@ -122,6 +157,7 @@ class GroupInfoView(QWidget):
             mapped_value = (
                 "empty_field" if combo_value == "Empty fields" else
                 "pause" if combo_value == "Pause" else
+                "pack" if combo_value == "Pack" else
                 "ignore"
             )
 
@@ -130,5 +166,10 @@ class GroupInfoView(QWidget):
                 "num_fields": widgets["num_fields"].value(),
                 "double_missions": mapped_value,
                 "pause_dur": widgets["pause_dur"].value() if mapped_value == "pause" else 0,
+                "optimize": widgets["optimize"].isChecked(),
+                "min_rest": widgets["min_rest"].value(),
+                "min_rest_unit": "minutes" if widgets["min_rest_unit"].currentText() == "Minutes" else "slots",
+                "referees": widgets["referees"].isChecked(),
+                "balance_fields": widgets["balance_fields"].isChecked(),
             }
         return group_info
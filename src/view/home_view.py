@@ -54,6 +54,13 @@ class HomeView(QWidget):
         main_layout.addWidget(self.identical_checkbox)
         main_layout.addSpacing(25)
 
+        # Checkbox: Schedule groups in parallel worker processes (worthwhile for many groups only)
+        self.parallel_checkbox = QCheckBox("Schedule groups in parallel (uses all processor cores).")
+        self.parallel_checkbox.setChecked(False)
+        self.parallel_checkbox.stateChanged.connect(self.update_model)
+        main_layout.addWidget(self.parallel_checkbox)
+        main_layout.addSpacing(25)
+
         # Checkbox: Seed to shuffle teams
         shuffle_row = QHBoxLayout()
         self.shuffle_checkbox = QCheckBox("Set seed to shuffle teams")
@@ -118,6 +125,7 @@ class HomeView(QWidget):
             "appendix_day_info": self.appendix_input.toPlainText().strip(),
             "shuffle": self.shuffle_checkbox.isChecked(),
             "prevent_identical_cat_days": self.identical_checkbox.isChecked(),
+            "parallel_scheduling": self.parallel_checkbox.isChecked(),
             "shuffle_seed": self.seed_input.text().strip() if self.shuffle_checkbox.isChecked() else ""
         }
 
@@ -126,6 +134,7 @@ class HomeView(QWidget):
         self.title_input.setText(data.get("title", ""))
         self.appendix_input.setPlainText(data.get("appendix_day_info", ""))
         self.identical_checkbox.setChecked(data.get("prevent_identical_cat_days", False))
+        self.parallel_checkbox.setChecked(data.get("parallel_scheduling", False))
         self.shuffle_checkbox.setChecked(data.get("shuffle", False))
         self.seed_input.setText(data.get("shuffle_seed", ""))
         self.toggle_seed_input()
@@ -44,6 +44,10 @@ class MainView(QMainWindow):
         shortcut_open.setContext(Qt.ApplicationShortcut)
         shortcut_open.activated.connect(self.home_tab.load_from_file)
 
+    def closeEvent(self, event):
+        self.controller.close()
+        super().closeEvent(event)
+
     def on_tab_changed(self, index):
         prev_index = getattr(self, "_prev_tab_index", None)
         self._prev_tab_index = index
@@ -71,6 +75,18 @@ class MainView(QMainWindow):
                 # Undo tab change
                 self.tabs.setCurrentIndex(prev_index)
                 return
+            # Prevent tab to change if a Swiss system category has too many rounds
+            too_many_rounds = self.controller.model.get_swiss_categories_with_too_many_rounds()
+            if too_many_rounds:
+                QMessageBox.warning(
+                    self,
+                    "Too Many Rounds",
+                    f"A Swiss system category can have at most half as many rounds as teams "
+                    f"(without rematches). Use round robin for more rounds:\n\n" + "\n".join(too_many_rounds)
+                )
+                # Undo tab change
+                self.tabs.setCurrentIndex(prev_index)
+                return
 
         # When leaving the Days Tab
         if prev_index == self.tabs.indexOf(self.days_tab):
@@ -2,6 +2,9 @@ from PyQt5.QtWidgets import QWidget, QLabel, QGridLayout
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont, QPalette, QColor
 
+from utils.scheduler.swiss import max_swiss_rounds
+from utils.tourn_stats.schedule_metrics import compute_schedule_metrics
+
 class OverviewView(QWidget):
     def __init__(self, controller):
         super().__init__()
@@ -34,6 +37,18 @@ class OverviewView(QWidget):
             "Matches per team & day"
         ]
 
+        # Metrics of the generated tournament
+        tournament = model.get_tournament_generated()
+        schedule_metrics = compute_schedule_metrics(tournament) if tournament else None
+        if schedule_metrics is not None:
+            metrics += [
+                "Min. rest (min)",
+                "Mean rest (min)",
+                "Longest idle (min)",
+                "Back-to-backs",
+                "Home/away imbalance"
+            ]
+
         # First column: metric names
         for row, label in enumerate(metrics, start=0):  # Start at row 0
             lbl = QLabel(label)
@@ -49,8 +64,14 @@ class OverviewView(QWidget):
             group = cat.group
             runs = int(cat.runs)
             duration = group_info.get(group, {}).get("match_dur", "N/A")
-            matches_per_team = (num_teams - 1) * runs if num_teams > 1 else 0
+            if cat.mode == "swiss":
+                matches_per_team = min(runs, max_swiss_rounds(num_teams))     # One match per round
+            else:
+                matches_per_team = (num_teams - 1) * runs if num_teams > 1 else 0
             matches_per_day = round(matches_per_team / num_days, 2) if num_days > 0 else "N/A"
+            matches_per_team_text = str(matches_per_team)
+            if cat.mode == "swiss" and num_teams % 2 == 1 and matches_per_team > 0:
+                matches_per_team_text += f" ({matches_per_team - 1} with bye)"
 
             values = [
                 cat.name,
@@ -58,9 +79,20 @@ class OverviewView(QWidget):
                 group,
                 str(runs),
                 str(duration),
-                str(matches_per_team),
+                matches_per_team_text,
                 str(matches_per_day)
             ]
+            if schedule_metrics is not None and not schedule_metrics.plays_all(team.id for team in teams):
+                values += ["-"] * 5     # Category changed after the tournament was generated
+            elif schedule_metrics is not None:
+                summary = schedule_metrics.summarize(team.id for team in teams)
+                values += [
+                    "-" if summary.min_rest is None else str(summary.min_rest),
+                    "-" if summary.mean_rest is None else f"{summary.mean_rest:.1f}",
+                    str(summary.longest_idle),
+                    str(summary.back_to_backs),
+                    str(summary.home_away_imbalance)
+                ]
 
             for row, val in enumerate(values, start=0):
                 lbl = QLabel(val)
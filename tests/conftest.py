@@ -0,0 +1,43 @@
+import copy
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src/')))
+
+import pytest
+
+from core import Category, OtherEvent, Team, TeamRegistry
+from model.model import Model
+
+
+@pytest.fixture
+def create_teams():
+    """Returns a function which creates num_teams teams (named prefix + index) registered in a new TeamRegistry."""
+    def create(num_teams: int, prefix: str = "t") -> list:
+        teams = [Team(f"{prefix}{i}", "#FFFFFF", None) for i in range(num_teams)]
+        registry = TeamRegistry()
+        for team in teams:
+            registry.register(team)
+        return teams
+    return create
+
+
+@pytest.fixture
+def create_model():
+    """Returns a function which creates a Model. categories holds (name, group, runs, num_teams[, color, font_color])
+    tuples, the teams are named lowercase name + index. Without other_events, group "1" has a lunch after its matches."""
+    def create(categories: list, group_info: dict, num_days: int = 2, other_events: dict = None,
+               tournament_info: dict = None) -> Model:
+        test_model = Model()
+        test_model.set_days(list(range(num_days)))
+        test_model.set_categories([
+            Category(name, group, runs, [Team(f"{name.lower()}{i}", *colors) for i in range(num_teams)])
+            for name, group, runs, num_teams, *colors in categories
+        ])
+        test_model.set_group_info(copy.deepcopy(group_info))
+        if other_events is None:
+            other_events = {"1": [OtherEvent(15, "Lunch", False, None, 0, "after", None)]}
+        test_model.set_other_events(other_events)
+        if tournament_info is not None:
+            test_model.set_tournament_info(dict(tournament_info))
+        return test_model
+    return create
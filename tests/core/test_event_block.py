@@ -0,0 +1,76 @@
+import random
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src/')))
+
+from core import OtherEvent, EventBlock
+from core.free_slot_tree import FreeSlotTree
+
+
+def _add_after_n_nones_reference(events, n, event):
+    """Linear scan of the original implementation."""
+    while sum(1 for e in events if e is None) < n:
+        events.append(None)
+    none_seen = 0
+    idx = 0
+    while idx < len(events):
+        if events[idx] is None:
+            none_seen += 1
+            if none_seen == n:
+                idx += 1
+                break
+        idx += 1
+    while idx < len(events) and events[idx] is not None:
+        idx += 1
+    events.insert(idx, event)
+
+def test_free_slot_tree():
+    rnd = random.Random(3)
+    flags = [rnd.random() < 0.4 for _ in range(37)]
+    tree = FreeSlotTree(flags[:20])
+    for flag in flags[20:]:
+        tree.append(flag)
+    for _ in range(50):
+        idx = rnd.randrange(len(flags))
+        flags[idx] = rnd.random() < 0.4
+        tree.set_free(idx, flags[idx])
+
+        free = [i for i, flag in enumerate(flags) if flag]
+        assert tree.count_free() == len(free)
+        assert tree.first_free() == (free[0] if free else None)
+        for n, pos in enumerate(free, start=1):
+            assert tree.find_nth_free(n) == pos
+            assert tree.count_free_before(pos) == n - 1
+        start = rnd.randrange(len(flags) + 1)
+        assert tree.next_free(start) == next((i for i in free if i >= start), None)
+
+def test_slot_operations_match_linear_scan():
+    rnd = random.Random(7)
+    for _ in range(20):
+        block = EventBlock([])
+        reference = []
+        for i in range(60):
+            event = OtherEvent(1, str(i))
+            op = rnd.randrange(4)
+            if op == 0:
+                n = rnd.randrange(4)
+                block.add_event_after_n_nones(n, event)
+                _add_after_n_nones_reference(reference, n, event)
+            elif op == 1:
+                block.add_event_to_next_available_slot(event)
+                if None in reference:
+                    reference[reference.index(None)] = event
+                else:
+                    reference.append(event)
+            elif op == 2:
+                pos = rnd.randrange(len(reference) + 3)
+                block.insert_event_at_position(event, pos)
+                reference.extend([None] * (pos - len(reference)))
+                reference.insert(pos, event)
+            else:
+                pos = rnd.randrange(len(reference) + 3)
+                block.add_event_at_position(event, pos)
+                reference.extend([None] * (pos + 1 - len(reference)))
+                reference[pos] = event
+            assert block.events == reference
+        assert block.number_of_events() == sum(1 for e in reference if e is not None)
@@ -0,0 +1,131 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src/')))
+
+from core import Team, Match, MatchEvent, OtherEvent, EventBlock, EventDay, TeamRegistry
+
+
+def _create_day():
+    teams = [Team(f"team{i}", "#FFFFFF", None, i) for i in range(4)]
+    blocks = [
+        EventBlock([None, MatchEvent(10, [Match(teams[0], teams[1])]), None, OtherEvent(5, "A")]),
+        EventBlock([]),
+        EventBlock([MatchEvent(10, [Match(teams[2], teams[3])]), None]),
+        EventBlock([OtherEvent(15, "B"), MatchEvent(10, [Match(teams[1], teams[2])])])
+    ]
+    return EventDay(blocks)
+
+def test_get_event_across_blocks():
+    day = _create_day()
+    events = day.get_all_valid_events()
+    assert len(events) == 5
+    for idx, event in enumerate(events):
+        assert day.get_event(idx) is event
+
+    with pytest.raises(IndexError):
+        day.get_event(5)
+    with pytest.raises(IndexError):
+        day.get_event(-1)
+
+def test_set_event_keeps_index_valid():
+    day = _create_day()
+    new_events = [MatchEvent(20, []) for _ in range(day.total_events())]
+    for idx, event in day.iter_events():
+        day.set_event(idx, new_events[idx])
+    assert day.get_all_valid_events() == new_events
+    assert day.total_duration() == 100
+
+    # Structural change through a block is picked up as well
+    day.get_block(1).add_event(OtherEvent(5, "C"))
+    assert day.get_event(2).label == "C"
+    assert day.total_events() == 6
+
+    with pytest.raises(IndexError):
+        day.set_event(6, OtherEvent(5, "D"))
+
+def test_iter_events():
+    day = _create_day()
+    assert [idx for idx, _ in day.iter_events()] == [0, 1, 2, 3, 4]
+    assert [ev for _, ev in day.iter_events()] == day.get_all_valid_events()
+    assert [idx for idx, _ in day.iter_events(start=2)] == [2, 3, 4]
+    assert [ev for _, ev in day.iter_events(start=3)] == day.get_all_valid_events()[3:]
+    assert list(day.iter_events(start=5)) == []
+    assert list(EventDay().iter_events()) == []
+
+def test_team_occurrences():
+    day = _create_day()
+    team1 = day.get_event(0).matches[0].team2
+    occurrences = day.get_team_occurrences(team1)
+    assert (occurrences.home, occurrences.away, occurrences.total) == (1, 1, 2)
+    assert occurrences.slots == [0, 4]
+    assert occurrences.fields == [0, 0]
+    assert day.count_team_home(team1) == 1
+    assert day.count_team_away(team1) == 1
+    assert day.count_team_total(team1) == 2
+
+    # Replace a single event: index is updated incrementally
+    team0 = day.get_event(0).matches[0].team1
+    day.set_event(4, MatchEvent(10, [Match(team1, team0), Match(team0, team1)]))
+    assert day.get_team_occurrences(team1).slots == [0, 4, 4]
+    assert day.get_team_occurrences(team1).fields == [0, 0, 1]
+    assert day.count_team_home(team1) == 1
+    assert day.count_team_away(team1) == 2
+    assert day.count_team_total(team0) == 3
+
+    # Append a block
+    day.add_block(EventBlock([MatchEvent(10, [Match(team0, team1)])]))
+    assert day.get_team_occurrences(team0).slots == [0, 4, 4, 5]
+    assert day.count_team_home(team0) == 3
+
+    # Unknown teams never play
+    assert day.count_team_total(Team("unknown", "#FFFFFF", None, 99)) == 0
+
+def test_team_occurrences_of_unregistered_teams():
+    a, b, c, d = [Team(name, "#FFFFFF") for name in "abcd"]
+    day = EventDay([EventBlock([MatchEvent(10, [Match(a, b)]), MatchEvent(10, [Match(c, d), Match(b, a)])])])
+    assert (day.count_team_home(a), day.count_team_away(a), day.count_team_total(a)) == (1, 1, 2)
+    assert day.count_team_total(c) == 1
+    assert day.get_team_occurrences(b).slots == [0, 1]
+    assert day.get_team_occurrences(b).fields == [0, 1]
+    assert day.count_team_total(Team("e", "#FFFFFF")) == 0
+
+def test_team_occurrences_follow_new_ids():
+    day = _create_day()
+    teams = [day.get_event(0).matches[0].team1, day.get_event(0).matches[0].team2,
+             day.get_event(2).matches[0].team1, day.get_event(2).matches[0].team2]
+    assert [day.count_team_total(team) for team in teams] == [1, 2, 2, 1]
+    assert list(day.get_columns().home) == [0, 2, 1]
+
+    # Registering the teams in another order gives them other ids: the caches of linked days are rebuilt
+    registry = TeamRegistry()
+    registry.register_tournament([day])
+    assert day.registry is registry
+    registry.clear()
+    for team in reversed(teams):
+        registry.register(team)
+    assert [day.count_team_total(team) for team in teams] == [1, 2, 2, 1]
+    assert list(day.get_columns().home) == [3, 1, 2]
+
+    # Other registries do not touch the caches
+    other_day = _create_day()
+    columns = other_day.get_columns()
+    TeamRegistry().register(Team("other", "#FFFFFF", None, 5))
+    assert other_day.get_columns() is columns
+
+def test_metrics_follow_mutations():
+    day = _create_day()
+    assert (day.total_events(), day.total_duration(), day.total_matches(), day.max_fields()) == (5, 50, 3, 1)
+
+    team = day.get_event(0).matches[0].team1
+    day.set_event(0, MatchEvent(15, [Match(team, team), Match(team, team)]))
+    assert (day.total_events(), day.total_duration(), day.total_matches(), day.max_fields()) == (5, 55, 4, 2)
+
+    day.get_block(1).add_event(OtherEvent(30, "C"))
+    day.get_block(2).insert_event_at_position(MatchEvent(10, []), 0)
+    assert (day.total_events(), day.total_duration(), day.total_matches()) == (7, 95, 4)
+    assert day.get_block(2).total_duration() == 20
+
+    day.get_block(0).remove_nones()
+    day.get_block(0).remove_event(0)
+    assert (day.total_events(), day.total_duration(), day.max_fields()) == (6, 80, 1)
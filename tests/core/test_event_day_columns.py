@@ -0,0 +1,51 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src/')))
+
+from core import Team, Match, MatchEvent, OtherEvent, EventBlock, EventDay
+
+
+def _create_day():
+    teams = [Team(f"team{i}", "#FFFFFF", None, i) for i in range(4)]
+    block1 = EventBlock([
+        OtherEvent(5, "Opening"),
+        MatchEvent(10, [Match(teams[0], teams[1]), Match(teams[2], teams[3])]),
+        None,
+        MatchEvent(10, [Match(teams[1], teams[2])])
+    ])
+    block2 = EventBlock([
+        OtherEvent(15, "Break"),
+        MatchEvent(12, [Match(teams[3], teams[0])])
+    ])
+    return EventDay([block1, block2])
+
+def test_columns_match_event_graph():
+    day = _create_day()
+    columns = day.get_columns()
+
+    assert len(columns) == 4
+    assert columns.num_slots == 5
+    assert columns.slot.tolist() == [1, 1, 2, 4]
+    assert columns.field.tolist() == [0, 1, 0, 0]
+    assert columns.home.tolist() == [0, 2, 1, 3]
+    assert columns.away.tolist() == [1, 3, 2, 0]
+    assert columns.duration.tolist() == [10, 10, 10, 12]
+    assert columns.start.tolist() == [5, 5, 15, 40]
+    assert columns.end == day.total_duration()
+
+    assert columns.other_slot.tolist() == [0, 3]
+    assert columns.other_start.tolist() == [0, 25]
+    assert [ev.label for ev in columns.other_events] == ["Opening", "Break"]
+
+    assert columns.rows_of_field(0).tolist() == [0, 2, 3]
+    assert columns.rows_of_team(0).tolist() == [0, 3]
+
+def test_columns_are_cached_until_day_changes():
+    day = _create_day()
+    columns = day.get_columns()
+    assert day.get_columns() is columns
+
+    day.get_block(1).add_event(MatchEvent(12, []))
+    assert day.get_columns() is not columns
+    assert day.get_columns().num_slots == 6
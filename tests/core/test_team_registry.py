@@ -0,0 +1,80 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src/')))
+
+from core import Team, Category, TeamRegistry
+from model.model import Model
+from utils.scheduler.scheduler import create_schedule
+
+
+def test_register_assigns_dense_ids():
+    registry = TeamRegistry()
+    teams = [Team(f"team{i}", "#FFFFFF", None) for i in range(4)]
+    for team in teams:
+        registry.register(team)
+
+    assert [team.id for team in teams] == [0, 1, 2, 3]
+    assert len(registry) == 4
+    assert registry.get_team(2) is teams[2]
+
+    # Equal teams share the id of the first registered instance
+    copy_of_team1 = Team("team1", "#FFFFFF", None)
+    assert registry.register(copy_of_team1) == 1
+    assert copy_of_team1.id == 1
+    assert len(registry) == 4
+
+def test_model_registers_categories_and_generated_teams():
+    test_model = Model()
+    test_model.set_days([0, 1])
+    test_model.set_categories([
+        Category("A", "1", 1, [Team(f"a{i}", "#FFFFFF", None) for i in range(3)]),
+        Category("B", "1", 1, [Team(f"b{i}", "#FFFFFF", None) for i in range(4)])
+    ])
+    test_model.set_group_info({"1": {"match_dur": 10, "num_fields": 2}})
+
+    ids = [team.id for cat in test_model.get_categories() for team in cat.teams]
+    assert ids == list(range(7))
+
+    test_model.set_tournament_generated(create_schedule(test_model))
+    assert len(test_model.get_team_registry()) == 7
+    for day in test_model.get_tournament_generated():
+        for ev in day.get_all_valid_events():
+            for match in ev.matches:
+                assert test_model.get_team_registry().get_team(match.team1_id) == match.team1
+                assert test_model.get_team_registry().get_team(match.team2_id) == match.team2
+
+def test_load_reuses_category_teams():
+    test_model = Model()
+    test_model.set_days([0, 1])
+    test_model.set_categories([Category("A", "1", 1, [Team(f"a{i}", "#FFFFFF", None) for i in range(4)])])
+    test_model.set_group_info({"1": {"match_dur": 10, "num_fields": 2}})
+    test_model.set_tournament_generated(create_schedule(test_model))
+
+    loaded_model = Model()
+    loaded_model.set_data(test_model.to_serializable_dict())
+    category_teams = {id(team) for team in loaded_model.get_categories()[0].teams}
+    for day in loaded_model.get_tournament_generated():
+        for ev in day.get_all_valid_events():
+            for match in ev.matches:
+                assert id(match.team1) in category_teams
+                assert id(match.team2) in category_teams
+    assert not hasattr(loaded_model.get_categories()[0].teams[0], "__dict__")
+
+def test_category_edit_keeps_ids_of_generated_tournament():
+    test_model = Model()
+    test_model.set_days([0])
+    teams = [Team(f"a{i}", "#FFFFFF", None) for i in range(4)]
+    test_model.set_categories([Category("A", "1", 1, teams)])
+    test_model.set_group_info({"1": {"match_dur": 10, "num_fields": 2}})
+    test_model.set_tournament_generated(create_schedule(test_model))
+    day = test_model.get_tournament_generated()[0]
+    assert day.count_team_total(teams[3]) == 3
+
+    # A new team in front gets a new id, the known teams keep theirs
+    new_team = Team("new", "#FFFFFF", None)
+    test_model.set_categories([Category("A", "1", 1, [new_team, *teams])])
+    assert [team.id for team in teams] == [0, 1, 2, 3]
+    assert new_team.id == 4
+    assert day.count_team_total(teams[3]) == 3
+    assert day.count_team_total(new_team) == 0
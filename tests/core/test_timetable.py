@@ -0,0 +1,37 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src/')))
+
+from core import Team, Match, MatchEvent, OtherEvent, EventBlock, EventDay
+
+
+def _create_day():
+    teams = [Team(f"team{i}", "#FFFFFF", None, i) for i in range(4)]
+    blocks = [
+        EventBlock([MatchEvent(10, [Match(teams[0], teams[1])]), None, OtherEvent(5, "A")]),
+        EventBlock([MatchEvent(12, [Match(teams[2], teams[3])]), MatchEvent(12, [Match(teams[0], teams[2])])])
+    ]
+    return EventDay(blocks)
+
+def test_time_strings():
+    day = _create_day()
+    timetable = day.get_timetable("08:50")
+    assert len(timetable) == 4
+    assert timetable.get_time_strings() == ["08:50", "09:00", "09:05", "09:17", "09:29"]
+    assert timetable.minute(1) == 9 * 60
+    assert timetable.end_str() == "09:29"
+    assert day.get_timetable("08:50") is timetable
+
+    # Wraps at midnight
+    assert day.get_timetable("23:55").get_time_strings() == ["23:55", "00:05", "00:10", "00:22", "00:34"]
+
+def test_delay_and_rebuild():
+    day = _create_day()
+    timetable = day.get_timetable("10:00")
+    timetable.delay_from(2, 15)
+    timetable.delay_from(3, 5)
+    assert timetable.get_time_strings() == ["10:00", "10:10", "10:30", "10:47", "10:59"]
+
+    # A changed day gets a new timetable
+    day.get_block(0).add_event(OtherEvent(30, "B"))
+    assert day.get_timetable("10:00").get_time_strings() == ["10:00", "10:10", "10:15", "10:45", "10:57", "11:09"]
@@ -0,0 +1,79 @@
+import json
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src/')))
+
+from core import OtherEvent
+from model.model import Model
+from model import save_format
+from utils.scheduler.scheduler import create_schedule
+
+
+CATEGORIES = [("A", "1", 1, 5), ("B", "2", 1, 4, "#FF0000", "#000000")]
+GROUP_INFO = {
+    "1": {"match_dur": 10, "num_fields": 2, "pause_time": 5, "pause_after": 2},
+    "2": {"match_dur": 12, "num_fields": 1}
+}
+
+def _create_scheduled_model(create_model):
+    test_model = create_model(CATEGORIES, GROUP_INFO, num_days=3, other_events={"1": [
+        OtherEvent(15, "Lunch", False, None, 0, "after", None),
+        OtherEvent(5, "Speech", True, "#00FF00", 0, "during", 1)
+    ]})
+    test_model.set_tournament_generated(create_schedule(test_model))
+    return test_model
+
+def test_round_trip(create_model):
+    test_model = _create_scheduled_model(create_model)
+    saved = json.loads(json.dumps(test_model.to_serializable_dict()))
+    assert saved["format_version"] == save_format.FORMAT_VERSION
+
+    loaded_model = Model()
+    loaded_model.set_data(saved)
+    assert loaded_model.get_tournament_generated() == test_model.get_tournament_generated()
+
+    # Shared events are the instances of the model's other events
+    lunch = loaded_model.get_other_events()["1"][0]
+    for day in loaded_model.get_tournament_generated():
+        assert any(ev is lunch for ev in day.get_all_valid_events())
+
+def test_teams_table_holds_referenced_teams_only(create_model):
+    test_model = _create_scheduled_model(create_model)
+    # Removed teams stay in the registry
+    test_model.set_categories(test_model.get_categories()[:1])
+    test_model.set_group_info({"1": test_model.get_group_info()["1"]})
+    test_model.set_tournament_generated(create_schedule(test_model))
+    assert len(test_model.get_team_registry()) == 9
+
+    saved = json.loads(json.dumps(test_model.to_serializable_dict()))
+    assert sorted(team["name"] for team in saved["teams"]) == [f"a{i}" for i in range(5)]
+    loaded_model = Model()
+    loaded_model.set_data(saved)
+    assert loaded_model.get_tournament_generated() == test_model.get_tournament_generated()
+
+def test_load_legacy_format(create_model):
+    test_model = _create_scheduled_model(create_model)
+    legacy = test_model.to_serializable_dict()
+    del legacy["format_version"]
+    del legacy["teams"]
+    legacy["tournament_generated"] = [day.to_dict() for day in test_model.get_tournament_generated()]
+
+    loaded_model = Model()
+    loaded_model.set_data(json.loads(json.dumps(legacy)))
+    assert loaded_model.get_tournament_generated() == test_model.get_tournament_generated()
+    assert len(json.dumps(test_model.to_serializable_dict())) < len(json.dumps(legacy))
+
+def test_round_trip_with_referees(create_model):
+    test_model = _create_scheduled_model(create_model)
+    group_info = test_model.get_group_info()
+    group_info["1"]["referees"] = True
+    test_model.set_group_info(group_info)
+    test_model.set_tournament_generated(create_schedule(test_model))
+    referees = [m.referee.name for day in test_model.get_tournament_generated()
+                for ev in day.get_all_valid_events() if hasattr(ev, "matches") for m in ev.matches if m.referee]
+    assert len(referees) > 0
+
+    loaded_model = Model()
+    loaded_model.set_data(json.loads(json.dumps(test_model.to_serializable_dict())))
+    assert [m.referee.name for day in loaded_model.get_tournament_generated()
+            for ev in day.get_all_valid_events() if hasattr(ev, "matches") for m in ev.matches if m.referee] == referees
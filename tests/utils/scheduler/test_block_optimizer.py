@@ -0,0 +1,103 @@
+import random
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../src/')))
+
+from core import OtherEvent, Match, MatchEvent, EventBlock
+from utils.scheduler.block_optimizer import BlockCost, optimize_block, _swap_matches, _swap_slots, _switch_home_away
+from utils.scheduler.scheduler import count_parallel_double_missions, fill_group_block
+
+
+def _cost_state(cost):
+    return (cost.back_to_back, cost.parallel, cost.added_minutes, cost.home_away_imbalance)
+
+def test_incremental_cost_equals_recomputed_cost(create_teams):
+    teams = create_teams(8)
+    rng = random.Random(3)
+    slots = [[Match(*rng.sample(teams, 2)) for _ in range(3)] for _ in range(6)]
+    linked = [True, True, False, True, True]
+    cost = BlockCost(slots, linked, 5, 15)
+
+    for _ in range(500):
+        move = rng.choice([_swap_matches, _swap_slots, _switch_home_away])
+        undo = move(slots, cost, rng)
+        if undo is not None and rng.random() < 0.3:
+            undo()
+        assert _cost_state(cost) == _cost_state(BlockCost(slots, linked, 5, 15))
+
+def test_optimize_block_removes_back_to_back_games(create_teams):
+    a, b, c, d, e, f = create_teams(6)
+    lunch = OtherEvent(30, "Lunch", False, None, 0, "before", None)
+    block = EventBlock([
+        lunch,
+        MatchEvent(10, [Match(a, b)]),
+        MatchEvent(10, [Match(a, c)]),
+        MatchEvent(10, [Match(d, e)]),
+        MatchEvent(10, [Match(b, c)]),
+        MatchEvent(10, [Match(e, f)])
+    ])
+    group_info = {"match_dur": 10, "num_fields": 1, "double_missions": "pause", "pause_dur": 5}
+    optimized = optimize_block(block, group_info)
+
+    events = optimized.get_valid_events()
+    assert events[0] is lunch
+    slots = [ev.matches for ev in events[1:]]
+    cost = BlockCost(slots, [True] * 4)
+    assert cost.back_to_back == 0
+    # Same matches, home and away may be switched
+    assert sorted(tuple(sorted((m.team1.id, m.team2.id))) for ev in events[1:] for m in ev.matches) == \
+           sorted(tuple(sorted((m.team1.id, m.team2.id))) for ev in block.get_valid_events()[1:] for m in ev.matches)
+
+def test_optimized_block_is_not_longer(create_teams):
+    teams = create_teams(8)
+    rng = random.Random(5)
+    matches = [Match(*rng.sample(teams, 2)) for _ in range(30)]
+    for double_missions in ["pause", "empty_field"]:
+        group_info = {"match_dur": 10, "num_fields": 2, "double_missions": double_missions, "pause_dur": 5}
+        plain = fill_group_block(EventBlock(), matches, group_info)
+        optimized = fill_group_block(EventBlock(), matches, {**group_info, "optimize": True})
+        assert optimized.total_duration() <= plain.total_duration()
+
+def test_optimized_block_has_no_parallel_double_missions(create_teams):
+    teams = create_teams(7)
+    rng = random.Random(11)
+    for _ in range(6):
+        matches = [Match(*rng.sample(teams, 2)) for _ in range(rng.randint(12, 24))]
+        for double_missions in ["pack", "pause"]:
+            group_info = {"match_dur": 10, "num_fields": 3, "double_missions": double_missions, "pause_dur": 5}
+            plain = fill_group_block(EventBlock(), matches, group_info)
+            optimized = fill_group_block(EventBlock(), matches, {**group_info, "optimize": True})
+            assert count_parallel_double_missions(plain) == 0
+            assert count_parallel_double_missions(optimized) == 0
+
+    # The optimizer itself never adds a match of a team to a MatchEvent it already plays in
+    a, b, c, d, e, f = teams[:6]
+    block = EventBlock([
+        MatchEvent(10, [Match(a, b), Match(c, d)]),
+        MatchEvent(10, [Match(a, c), Match(e, f)]),
+        MatchEvent(10, [Match(b, d), Match(e, a)])
+    ])
+    group_info = {"match_dur": 10, "num_fields": 2, "double_missions": "pack"}
+    assert count_parallel_double_missions(optimize_block(block, group_info, seed=4)) == 0
+
+def test_optimize_block_is_deterministic(create_teams):
+    teams = create_teams(8)
+    rng = random.Random(7)
+    block = EventBlock([MatchEvent(10, [Match(*rng.sample(teams, 2)) for _ in range(2)]) for _ in range(12)])
+    group_info = {"match_dur": 10, "num_fields": 2, "double_missions": "pause", "pause_dur": 5}
+
+    def order(b):
+        return [[(m.team1.id, m.team2.id) for m in ev.matches] for ev in b.get_valid_events()]
+    # Without time limit the result only depends on the inputs and the seed
+    assert order(optimize_block(block, group_info, seed=1)) == order(optimize_block(block, group_info, seed=1, max_time=None))
+
+def test_time_limited_block_is_marked(create_teams):
+    teams = create_teams(8)
+    rng = random.Random(7)
+    block = EventBlock([MatchEvent(10, [Match(*rng.sample(teams, 2)) for _ in range(2)]) for _ in range(10)])
+    group_info = {"match_dur": 10, "num_fields": 2, "double_missions": "pause", "pause_dur": 5}
+
+    assert not optimize_block(block, group_info).time_limited
+    limited = optimize_block(block, group_info, max_time=0)
+    assert limited.time_limited
+    assert len(limited.get_valid_events()) == 10
@@ -0,0 +1,101 @@
+import json
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../src/')))
+
+from core import MatchEvent
+from utils.scheduler import scheduler
+from utils.scheduler.scheduler import create_schedule
+from utils.scheduler.disk_cache import DiskScheduleCache, schedule_key
+from model.model import Model
+
+
+CATEGORIES = [("A", "1", 2, 6), ("B", "2", 1, 4)]
+GROUP_INFO = {
+    "1": {"match_dur": 10, "num_fields": 2, "double_missions": "pause", "pause_dur": 5},
+    "2": {"match_dur": 12, "num_fields": 1, "double_missions": "empty_field"}
+}
+TOURNAMENT_INFO = {"title": "Test", "shuffle": True, "shuffle_seed": "1"}
+
+def test_schedule_key(create_model):
+    test_model = create_model(CATEGORIES, GROUP_INFO, tournament_info=TOURNAMENT_INFO)
+    key = schedule_key(test_model)
+    assert key == schedule_key(create_model(CATEGORIES, GROUP_INFO, tournament_info=TOURNAMENT_INFO))
+
+    # Reloading the model keeps the key
+    reloaded = Model()
+    reloaded.set_data(json.loads(json.dumps(test_model.to_serializable_dict())))
+    assert schedule_key(reloaded) == key
+
+    # The title is not read by the scheduler
+    test_model.set_tournament_info({"title": "Other", "shuffle": True, "shuffle_seed": "1"})
+    assert schedule_key(test_model) == key
+
+    test_model.set_tournament_info({"title": "Test", "shuffle": True, "shuffle_seed": "2"})
+    assert schedule_key(test_model) != key
+
+    test_model = create_model(CATEGORIES, GROUP_INFO, tournament_info=TOURNAMENT_INFO)
+    test_model.get_group_info()["2"]["num_fields"] = 2
+    assert schedule_key(test_model) != key
+
+    test_model = create_model(CATEGORIES, GROUP_INFO, tournament_info=TOURNAMENT_INFO)
+    test_model.get_categories()[0].runs = 3
+    assert schedule_key(test_model) != key
+
+def test_disk_cache_lookup_and_store(tmp_path, create_model):
+    cache = DiskScheduleCache(str(tmp_path))
+    test_model = create_model(CATEGORIES, GROUP_INFO, tournament_info=TOURNAMENT_INFO)
+    assert cache.lookup(test_model) is None
+
+    tournament = create_schedule(test_model)
+    cache.store(test_model, tournament)
+    assert len(cache) == 1
+
+    # Hit from another model with the same content
+    other_model = create_model(CATEGORIES, GROUP_INFO, tournament_info=TOURNAMENT_INFO)
+    cached = cache.lookup(other_model)
+    assert cached is not None
+    assert [day.to_dict() for day in cached] == [day.to_dict() for day in tournament]
+    lunch = other_model.get_other_events()["1"][0]
+    assert any(e is lunch for day in cached for block in day.blocks for e in block.events)
+    teams = {id(team) for cat in other_model.get_categories() for team in cat.teams}
+    assert all(id(m.team1) in teams and id(m.team2) in teams
+               for day in cached for block in day.blocks for e in block.events
+               if isinstance(e, MatchEvent) for m in e.matches)
+
+    # Unreadable entries are a miss
+    with open(os.path.join(str(tmp_path), f"{schedule_key(test_model)}.json"), "w") as f:
+        f.write("{")
+    assert cache.lookup(test_model) is None
+
+def test_disk_cache_evicts_least_recently_used(tmp_path, create_model):
+    cache = DiskScheduleCache(str(tmp_path), max_entries=2)
+    models = []
+    for seed in range(3):
+        test_model = create_model(CATEGORIES, GROUP_INFO, tournament_info=TOURNAMENT_INFO)
+        test_model.set_tournament_info({"title": "Test", "shuffle": True, "shuffle_seed": str(seed)})
+        models.append(test_model)
+
+    cache.store(models[0], create_schedule(models[0]))
+    cache.store(models[1], create_schedule(models[1]))
+    # Use the first entry, such that the second one is the least recently used
+    path = os.path.join(str(tmp_path), f"{schedule_key(models[1])}.json")
+    os.utime(path, (0, 0))
+    assert cache.lookup(models[0]) is not None
+
+    cache.store(models[2], create_schedule(models[2]))
+    assert len(cache) == 2
+    assert cache.lookup(models[1]) is None
+    assert cache.lookup(models[0]) is not None
+    assert cache.lookup(models[2]) is not None
+
+def test_disk_cache_skips_time_limited_schedules(tmp_path, monkeypatch, create_model):
+    optimize_block = scheduler.optimize_block
+    monkeypatch.setattr(scheduler, "optimize_block", lambda block, group_info: optimize_block(block, group_info, max_time=0))
+    cache = DiskScheduleCache(str(tmp_path))
+    test_model = create_model(CATEGORIES, GROUP_INFO, tournament_info=TOURNAMENT_INFO)
+    test_model.get_group_info()["1"]["optimize"] = True
+
+    cache.store(test_model, create_schedule(test_model))
+    assert len(cache) == 0
+    assert cache.lookup(test_model) is None
@@ -0,0 +1,32 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../src/')))
+
+from core import Match, MatchEvent, OtherEvent, EventBlock, EventDay
+from utils.scheduler.field_balancing import balance_fields, best_field_assignment
+from utils.tourn_stats.schedule_metrics import compute_schedule_metrics
+
+
+def test_best_field_assignment():
+    assert best_field_assignment([[0, 1], [1, 0]]) == [0, 1]
+    assert best_field_assignment([[1, 0], [0, 1]]) == [1, 0]
+    assert best_field_assignment([[2, 2], [2, 2]]) == [0, 1]    # Identity on ties
+    assert best_field_assignment([[5, 0, 0], [0, 5, 5], [5, 5, 0]]) == [1, 0, 2]
+
+def test_balance_fields(create_teams):
+    teams = create_teams(6)
+    # Every team plays in list position 0, 1 or 2 only
+    blocks = [EventBlock([
+        MatchEvent(10, [Match(teams[0], teams[1]), Match(teams[2], teams[3]), Match(teams[4], teams[5])])
+        for _ in range(6)
+    ] + [OtherEvent(15, "Lunch")]) for _ in range(2)]
+    result = balance_fields(blocks)
+
+    field_counts = compute_schedule_metrics([EventDay([block]) for block in result]).field_counts
+    assert field_counts.tolist() == [[4, 4, 4]] * 6
+    # Same matches per slot, the given blocks are not changed
+    for block, new_block in zip(blocks, result):
+        assert new_block.events[-1] is block.events[-1]
+        for ev, new_ev in zip(block.events[:-1], new_block.events[:-1]):
+            assert sorted(id(m) for m in ev.matches) == sorted(id(m) for m in new_ev.matches)
+            assert ev.matches[0].team1 is teams[0]
@@ -0,0 +1,79 @@
+import contextlib
+import io
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../src/')))
+
+from core import OtherEvent, Category, Team
+from utils.scheduler import scheduler
+from utils.scheduler.scheduler import create_schedule
+from utils.scheduler.group_cache import GroupScheduleCache
+
+
+CATEGORIES = [("A", "1", 2, 6), ("B", "2", 2, 5)]
+GROUP_INFO = {
+    "1": {"match_dur": 10, "num_fields": 2, "double_missions": "empty_field"},
+    "2": {"match_dur": 12, "num_fields": 2, "double_missions": "pause", "pause_dur": 5}
+}
+
+def _schedule(test_model, cache):
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        tournament = create_schedule(test_model, cache)
+    return tournament, output.getvalue().count("Reusing cached schedule")
+
+def test_only_changed_groups_are_rescheduled(create_model):
+    test_model = create_model(CATEGORIES, GROUP_INFO)
+    cache = GroupScheduleCache()
+
+    first, reused = _schedule(test_model, cache)
+    assert reused == 0
+    second, reused = _schedule(test_model, cache)
+    assert reused == 2
+    assert second == first
+
+    # Changing group 2 keeps group 1
+    test_model.get_group_info()["2"]["num_fields"] = 1
+    third, reused = _schedule(test_model, cache)
+    assert reused == 1
+    assert third == create_schedule(test_model)
+
+    # After-events of group 1 are placed in the block of group 2
+    test_model.set_other_events({"1": [OtherEvent(20, "Lunch", False, None, 0, "after", None)]})
+    fourth, reused = _schedule(test_model, cache)
+    assert reused == 1
+    assert fourth == create_schedule(test_model)
+
+def test_cached_blocks_reference_current_instances(create_model):
+    test_model = create_model(CATEGORIES, GROUP_INFO)
+    cache = GroupScheduleCache()
+    _schedule(test_model, cache)
+
+    # The views create new instances on every update
+    test_model.set_categories([Category(c.name, c.group, c.runs, [Team(t.name, t.color) for t in c.teams])
+                               for c in test_model.get_categories()])
+    lunch = OtherEvent(15, "Lunch", False, None, 0, "after", None)
+    test_model.set_other_events({"1": [lunch]})
+    tournament, reused = _schedule(test_model, cache)
+    assert reused == 2
+
+    registry = test_model.get_team_registry()
+    for day in tournament:
+        assert any(ev is lunch for ev in day.get_all_valid_events())
+        for ev in day.get_all_valid_events():
+            for match in getattr(ev, "matches", []):
+                assert registry.get_team(match.team1_id) is match.team1
+                assert registry.get_team(match.team2_id) is match.team2
+
+def test_time_limited_blocks_are_not_cached(monkeypatch, create_model):
+    optimize_block = scheduler.optimize_block
+    monkeypatch.setattr(scheduler, "optimize_block", lambda block, group_info: optimize_block(block, group_info, max_time=0))
+    test_model = create_model(CATEGORIES, GROUP_INFO)
+    test_model.get_group_info()["1"]["optimize"] = True
+    cache = GroupScheduleCache()
+
+    tournament, reused = _schedule(test_model, cache)
+    assert all(day.blocks[0].time_limited for day in tournament)
+    assert not any(day.blocks[1].time_limited for day in tournament)
+    _, reused = _schedule(test_model, cache)
+    assert reused == 1
@@ -0,0 +1,43 @@
+import contextlib
+import io
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../src/')))
+
+from core import OtherEvent, Category, Team, MatchEvent
+from utils.scheduler.scheduler import create_schedule
+from model.model import Model
+
+
+def test_parallel_schedule_is_identical_to_serial():
+    test_model = Model()
+    test_model.set_days([0, 1, 2])
+    test_model.set_categories([
+        Category(f"Cat {i}", str(i % 3 + 1), 3, [Team(f"c{i}_{j}", "#FFFFFF", None) for j in range(4 + i)])
+        for i in range(6)
+    ])
+    test_model.set_group_info({
+        "1": {"match_dur": 10, "num_fields": 2, "double_missions": "empty_field"},
+        "2": {"match_dur": 12, "num_fields": 3, "double_missions": "pause", "pause_dur": 5},
+        "3": {"match_dur": 8, "num_fields": 2}
+    })
+    lunch = OtherEvent(30, "Lunch", False, None, 0, "after", None)
+    test_model.set_other_events({"1": [lunch], "3": [OtherEvent(5, "Speech", False, None, 2, "during", 1)]})
+    test_model.set_tournament_info({"shuffle": True, "shuffle_seed": "7"})
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        serial = create_schedule(test_model)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            parallel = create_schedule(test_model, executor=executor)
+
+    assert parallel == serial
+
+    # Events and teams are the instances of the model, not the copies of the worker processes
+    registry = test_model.get_team_registry()
+    for day in parallel:
+        assert any(ev is lunch for ev in day.get_all_valid_events())
+        for ev in day.get_all_valid_events():
+            if isinstance(ev, MatchEvent):
+                for match in ev.matches:
+                    assert registry.get_team(match.team1_id) is match.team1
@@ -0,0 +1,59 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../src/')))
+
+from core import Match, MatchEvent, OtherEvent, EventBlock
+from utils.scheduler.referee_assignment import assign_referees
+
+
+def test_assign_referees(create_teams):
+    a, b, c, d, e, f = teams = create_teams(6)
+    block = EventBlock([
+        MatchEvent(10, [Match(a, b), Match(c, d)]),
+        MatchEvent(10, [Match(a, c), Match(e, f)]),
+        None,
+        MatchEvent(10, [Match(b, d)]),
+        OtherEvent(15, "Lunch"),
+        MatchEvent(10, [Match(e, f)])
+    ])
+    result = assign_referees([block], teams)[0]
+    referees = [[m.referee for m in ev.matches] if isinstance(ev, MatchEvent) else ev for ev in result.events]
+    # Idle teams are e and f. Then b and d, who did not play right before. Then all idle teams played
+    # right before: a has the fewest duties. After the break, c has the fewest duties.
+    assert referees == [[e, f], [b, d], None, [a], block.events[4], [c]]
+    assert result.events[4] is block.events[4]
+
+    # The given block keeps its matches
+    assert all(m.referee is None for ev in block.get_valid_events() if isinstance(ev, MatchEvent) for m in ev.matches)
+    # Matches with referees equal the matches without
+    assert result.events[0] == block.events[0]
+
+def test_assign_referees_balances_duties(create_teams):
+    teams = create_teams(9)
+    # Round robin like slots: 4 matches of 8 teams on 4 fields, 1 team idle
+    blocks = []
+    for day in range(2):
+        events = []
+        for rr in range(9):
+            playing = [teams[(rr + i) % 9] for i in range(8)]
+            events.append(MatchEvent(10, [Match(playing[2 * i], playing[2 * i + 1]) for i in range(4)]))
+        blocks.append(EventBlock(events))
+    result = assign_referees(blocks, teams)
+
+    duties = {team.name: 0 for team in teams}
+    for block in result:
+        for ev in block.events:
+            playing = {team.name for m in ev.matches for team in (m.team1, m.team2)}
+            referees = [m.referee for m in ev.matches if m.referee is not None]
+            assert len({r.name for r in referees}) == len(referees)     # One match per referee
+            assert not playing & {r.name for r in referees}             # Referees are idle
+            for referee in referees:
+                duties[referee.name] += 1
+    # Only 1 idle team per slot: the other matches have no referee
+    assert sum(duties.values()) == 18
+    assert max(duties.values()) - min(duties.values()) <= 1
+
+def test_assign_referees_without_idle_team(create_teams):
+    a, b = teams = create_teams(2)
+    result = assign_referees([EventBlock([MatchEvent(10, [Match(a, b)])])], teams)
+    assert result[0].events[0].matches[0].referee is None
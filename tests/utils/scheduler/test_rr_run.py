@@ -4,7 +4,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../src/')))
 
 from core import Team, Match, Category
-from utils.scheduler.rr_run import create_rr_run, create_n_rr_runs
+from utils.scheduler.rr_run import create_rr_run, create_n_rr_runs, iter_rr_rounds, get_rr_index_table, get_rr_index_array
 
 
 def test_create_rr_run():
@@ -41,4 +41,20 @@ def test_create_n_rr_runs():
     
     assert result[0][0].team1 == result[5][0].team2
     
-    assert len(result) == 10
\ No newline at end of file
+    assert len(result) == 10
+
+def test_rr_index_table():
+    # Pairings and home/away of saved tournaments must not change
+    assert get_rr_index_table(5) == (((1, 4), (2, 3)), ((4, 0), (1, 2)), ((0, 3), (4, 2)), ((2, 0), (3, 1)), ((0, 1), (3, 4)))
+    assert get_rr_index_table(4, True) == (((3, 0), (2, 1)), ((0, 2), (1, 3)), ((1, 0), (3, 2)))
+    assert next(iter_rr_rounds(6)) == ((0, 5), (1, 4), (2, 3))
+
+    for num_teams in range(1, 12):
+        for alter_home_away in [False, True]:
+            table = get_rr_index_table(num_teams, alter_home_away)
+            array = get_rr_index_array(num_teams, alter_home_away)
+            assert array.shape == (len(table), num_teams // 2, 2)
+            assert [tuple(map(tuple, rr)) for rr in array.tolist()] == list(table)
+            # Every pair of teams plays exactly once
+            pairs = {frozenset(m) for rr in table for m in rr}
+            assert len(pairs) == num_teams * (num_teams - 1) // 2
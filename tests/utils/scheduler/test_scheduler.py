@@ -4,8 +4,8 @@ import os
 from typing import List
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../src/')))
 
-from core import OtherEvent, EventBlock, Category, Team, MatchEvent
-from utils.scheduler.scheduler import create_schedule
+from core import OtherEvent, EventBlock, Category, Team, Match, MatchEvent
+from utils.scheduler.scheduler import create_schedule, has_double_missions, resolve_double_missions_with_pauses, resolve_double_missions
 from model.model import Model
 
 def test_create_schedule_other_events():
@@ -338,7 +338,117 @@ def test_double_mission_handling_empty_field():
     assert len(tournament[0].blocks[0].get_event(9).matches) == 1
 
     assert len(tournament[1].blocks[0].get_event(4).matches) == 0
-    
+
+def test_create_schedule_keeps_categories():
+    test_model = Model()
+    test_model.set_days([0, 1])
+    teams = _create_n_teams(5)
+    cat = Category("Cat 1", "1", 2, list(teams))
+    test_model.set_categories([cat])
+    test_model.set_group_info({"1": {"match_dur": 15, "num_fields": 2}})
+    test_model.set_tournament_info({"shuffle": True, "shuffle_seed": "3"})
+
+    tournament = create_schedule(test_model)
+
+    # No scratch attributes and no reordering of the teams of the model
+    assert cat.teams == teams
+    assert not hasattr(cat, "rr_runs")
+    # The matches reference the teams of the model
+    for day in tournament:
+        for ev in day.get_all_valid_events():
+            for match in ev.matches:
+                assert any(match.team1 is team for team in teams)
+                assert any(match.team2 is team for team in teams)
+
+def test_double_missions_with_team_masks(create_teams):
+    teams = create_teams(70, "team")
+    a, b, c, d = teams[0], teams[1], teams[64], teams[69]   # Ids above 63 as well
+    assert Match(a, c).team_mask == (1 << 0) | (1 << 64)
+    assert MatchEvent(10, [Match(a, c), Match(b, d)]).get_team_mask() == (1 << 0) | (1 << 1) | (1 << 64) | (1 << 69)
+
+    assert not has_double_missions(EventBlock([MatchEvent(10, [Match(a, b)]), MatchEvent(10, [Match(c, d)])]))
+    assert has_double_missions(EventBlock([MatchEvent(10, [Match(a, c)]), MatchEvent(10, [Match(d, c)])]))
+    # An OtherEvent in between separates the MatchEvents
+    assert not has_double_missions(EventBlock([MatchEvent(10, [Match(a, c)]), OtherEvent(5, "Break"),
+                                               MatchEvent(10, [Match(d, c)])]))
+
+    block = resolve_double_missions_with_pauses(EventBlock([MatchEvent(10, [Match(a, c), Match(c, d), Match(b, d)])]), 10, 5)
+    assert [len(ev.matches) if isinstance(ev, MatchEvent) else ev.duration for ev in block.get_valid_events()] == [2, 5, 1]
+
+def test_resolve_double_missions_with_pauses(create_teams):
+    a, b, c, d = create_teams(4, "team")
+    lunch = OtherEvent(3, "Lunch")
+    block = EventBlock([
+        MatchEvent(10, [Match(a, b)]),
+        MatchEvent(10, [Match(b, c)]),          # Sequential: pause of 5
+        lunch,
+        MatchEvent(10, [Match(c, d)]),          # Sequential: pause of 5 - 3
+        None,
+        MatchEvent(10, [Match(a, b), Match(b, d)]),   # Parallel: pause of 5, then followup
+        MatchEvent(10, [Match(a, d)])           # Sequential (to followup): pause of 5
+    ])
+    result = resolve_double_missions_with_pauses(block, 10, 5)
+    assert [ev.duration if isinstance(ev, OtherEvent) else [m.team1.name + m.team2.name for m in ev.matches]
+            for ev in result.events] == [
+        ["team0team1"], 5, ["team1team2"], 3, 2, ["team2team3"], ["team0team1"], 5, ["team1team3"], 5, ["team0team3"]
+    ]
+    assert result.events[3] is lunch
+
+    # The followup MatchEvent is split again if its matches share a team
+    result = resolve_double_missions_with_pauses(EventBlock([MatchEvent(10, [Match(a, b), Match(a, c), Match(b, c)])]), 10, 5)
+    assert [ev.duration if isinstance(ev, OtherEvent) else [m.team1.name + m.team2.name for m in ev.matches]
+            for ev in result.events] == [["team0team1"], 5, ["team0team2"], 5, ["team1team2"]]
+
+def test_resolve_double_missions_with_min_rest(create_teams):
+    a, b, c, d, e, f = create_teams(6, "team")
+
+    def describe(block):
+        return [ev.duration if isinstance(ev, OtherEvent) else [m.team1.name[4:] + m.team2.name[4:] for m in ev.matches]
+                for ev in block.get_valid_events()]
+
+    # At least 2 slots between two matches of a team, empty fields to wait
+    block = EventBlock([
+        MatchEvent(10, [Match(a, b), Match(c, d)]),
+        MatchEvent(10, [Match(e, f), Match(a, c)]),
+        MatchEvent(10, [Match(b, d), Match(e, c)])
+    ])
+    group_info = {"match_dur": 10, "num_fields": 2, "double_missions": "empty_field", "min_rest": 2}
+    assert describe(resolve_double_missions(block, group_info)) == [
+        ["01", "23"], ["45"], [], ["02", "13"], [], [], ["42"]
+    ]
+
+    # At least 15 minutes, pauses to wait
+    block = EventBlock([MatchEvent(10, [Match(a, b)]), MatchEvent(10, [Match(c, d)]), MatchEvent(10, [Match(a, c)])])
+    group_info = {"match_dur": 10, "num_fields": 1, "double_missions": "pause", "pause_dur": 5,
+                  "min_rest": 15, "min_rest_unit": "minutes"}
+    assert describe(resolve_double_missions(block, group_info)) == [["01"], ["23"], 5, 10, ["02"]]
+
+def test_create_schedule_with_min_rest():
+    # Minimum rest combined with packed slots and with the optimizer, checked on the generated tournament
+    for strategy in [{"double_missions": "pack"}, {"double_missions": "pause", "pause_dur": 5, "optimize": True},
+                     {"double_missions": "pack", "optimize": True}]:
+        test_model = Model()
+        test_model.set_days([0, 1])
+        test_model.set_categories([
+            Category("Cat 1", "1", 2, _create_n_teams(6)),
+            Category("Cat 2", "1", 2, [Team(f"other{i}", "", None) for i in range(5)])
+        ])
+        test_model.set_group_info({"1": {"match_dur": 10, "num_fields": 3, "min_rest": 2, **strategy}})
+        tournament = create_schedule(test_model)
+
+        num_matches = 0
+        for day in tournament:
+            last_slot = {}
+            for slot, ev in enumerate(day.get_all_valid_events()):
+                if not isinstance(ev, MatchEvent):
+                    continue
+                teams_in_event = [team.id for m in ev.matches for team in (m.team1, m.team2)]
+                assert len(set(teams_in_event)) == len(teams_in_event)    # No team plays twice in a slot
+                for team_id in teams_in_event:
+                    assert slot - last_slot.get(team_id, -10) > 2           # At least 2 slots in between
+                    last_slot[team_id] = slot
+                num_matches += len(ev.matches)
+        assert num_matches == 2 * (15 + 10)
 
 def _create_n_teams(num_teams: int) -> list:
     teams = []
@@ -0,0 +1,84 @@
+import contextlib
+import io
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../src/')))
+
+from core import OtherEvent, Category, Team, Match, MatchEvent, EventBlock, EventDay
+from utils.scheduler.rr_run import create_rr_run
+from utils.scheduler.scheduler import create_schedule
+from utils.scheduler.seed_search import score_schedule, search_seeds, find_best_seed
+from model.model import Model
+
+
+CATEGORIES = [("A", "1", 2, 6), ("B", "1", 2, 5), ("C", "2", 3, 4)]
+GROUP_INFO = {
+    "1": {"match_dur": 10, "num_fields": 3, "double_missions": "pause", "pause_dur": 5},
+    "2": {"match_dur": 12, "num_fields": 2, "double_missions": "empty_field"}
+}
+TOURNAMENT_INFO = {"title": "Test", "shuffle": False, "shuffle_seed": ""}
+
+def test_rr_run_maps_index_table_on_teams():
+    teams = [Team(str(i), "#FFFFFF", None) for i in range(7)]
+    result = create_rr_run(Category("", "", 1, teams))
+    result_alter = create_rr_run(Category("", "", 1, list(reversed(teams))))
+    assert len(result) == len(result_alter) == 7
+    # Every pair plays exactly once
+    pairs = {frozenset((m.team1.name, m.team2.name)) for rr in result for m in rr}
+    assert len(pairs) == 21
+    # Same table for another list of teams of the same size
+    for rr, rr_alter in zip(result, result_alter):
+        assert [(6 - int(m.team1.name), 6 - int(m.team2.name)) for m in rr] == \
+               [(int(m.team1.name), int(m.team2.name)) for m in rr_alter]
+
+def test_score_schedule():
+    test_model = Model()
+    a, b, c, d = [Team(name, "#FFFFFF", None) for name in "abcd"]
+    test_model.set_categories([Category("X", "1", 1, [a, b, c, d])])
+    day1 = EventDay([EventBlock([
+        MatchEvent(10, [Match(a, b), Match(c, d)]),
+        OtherEvent(5, "", False, None, None, None, None),     # Inserted pause
+        MatchEvent(10, [Match(a, c)]),
+        MatchEvent(10, []),                                     # Empty field
+        MatchEvent(10, [Match(b, a)])
+    ])])
+    day2 = EventDay([EventBlock([
+        OtherEvent(15, "Lunch", False, None, 0, "after", None),
+        MatchEvent(10, [Match(d, b)])
+    ])])
+    score = score_schedule([day1, day2])
+    assert score.num_pauses == 1
+    assert score.num_empty_events == 1
+    assert score.day_length_spread == 45 - 25
+    # a: 2 home 1 away, b: 1 home 2 away, c: 1 home 1 away, d: 1 home 1 away
+    assert score.home_away_imbalance == 2
+    # a: 10-15 / 15-25 (rest 5), 25-35 / 35-45 (rest 10)
+    assert score.min_rest == 5
+
+def test_search_seeds(create_model):
+    test_model = create_model(CATEGORIES, GROUP_INFO, tournament_info=TOURNAMENT_INFO)
+    info_before = dict(test_model.get_tournament_info())
+
+    results = search_seeds(test_model, range(1, 9))
+    assert sorted(seed for seed, _ in results) == [str(i) for i in range(1, 9)]
+    assert [score.total for _, score in results] == sorted(score.total for _, score in results)
+    assert test_model.get_tournament_info() == info_before
+
+    # Scores equal the ones of a regular run with that seed
+    seed, score = results[0]
+    test_model.set_tournament_info({**info_before, "shuffle": True, "shuffle_seed": seed})
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert score_schedule(create_schedule(test_model)) == score
+
+def test_find_best_seed_in_parallel(create_model):
+    test_model = create_model(CATEGORIES, GROUP_INFO, tournament_info=TOURNAMENT_INFO)
+    serial = search_seeds(test_model, range(1, 7))
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        best_seed, best_score = find_best_seed(test_model, 6, executor)
+
+    assert (best_seed, best_score) == serial[0]
+    info = test_model.get_tournament_info()
+    assert info["shuffle"] is True
+    assert info["shuffle_seed"] == best_seed
+    assert info["title"] == "Test"
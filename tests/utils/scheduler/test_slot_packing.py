@@ -0,0 +1,45 @@
+import random
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../src/')))
+
+from core import Match, MatchEvent, EventBlock, OtherEvent
+from utils.scheduler.slot_packing import pack_matches, colour_matches, count_conflicts
+from utils.scheduler.scheduler import fill_group_block
+
+
+def test_colour_matches_has_no_team_twice_in_a_slot(create_teams):
+    teams = create_teams(10)
+    rng = random.Random(1)
+    matches = [Match(*rng.sample(teams, 2)) for _ in range(60)]
+    for num_fields in [1, 2, 3, 5]:
+        slots = colour_matches(matches, num_fields)
+        assert count_conflicts(slots)[0] == 0
+        assert all(0 < len(slot) <= num_fields for slot in slots)
+        assert sorted(id(m) for slot in slots for m in slot) == sorted(id(m) for m in matches)
+
+def test_pack_matches(create_teams):
+    a, b, c, d, e, f = create_teams(6)
+    # In list order, b plays twice in the first slot
+    matches = [Match(a, b), Match(b, c), Match(d, e), Match(c, f)]
+    slots = pack_matches(matches, 2)
+    assert len(slots) == 2
+    assert count_conflicts(slots) == (0, 2)   # {a-b, c-f}, {b-c, d-e}
+
+    # Conflict free list order is kept
+    matches = [Match(a, b), Match(c, d), Match(e, f), Match(a, c)]
+    assert pack_matches(matches, 2) == [matches[:2], matches[2:]]
+
+def test_fill_group_block_with_pack(create_teams):
+    a, b, c, d, e, f = create_teams(6)
+    lunch = OtherEvent(30, "Lunch", False, None, 0, "during", 1)
+    block = EventBlock()
+    block.add_event_after_n_nones(1, lunch)
+    matches = [Match(a, b), Match(b, c), Match(d, e), Match(c, f)]
+    group_info = {"match_dur": 10, "num_fields": 2, "double_missions": "pack"}
+    block = fill_group_block(block, matches, group_info)
+
+    events = block.get_valid_events()
+    assert events[1] is lunch
+    assert [len(ev.matches) for ev in events if isinstance(ev, MatchEvent)] == [2, 2]
+    assert block.total_duration() == 50
@@ -0,0 +1,108 @@
+import contextlib
+import io
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../src/')))
+
+from core import Category, Team, MatchEvent
+from utils.scheduler.category_run import CategoryRun
+from utils.scheduler.scheduler import create_schedule, prepare_category
+from utils.scheduler.swiss import iter_swiss_rounds, create_swiss_rounds, max_swiss_rounds
+from model.model import Model
+
+
+def test_iter_swiss_rounds():
+    for num_teams, num_rounds in [(2, 1), (7, 3), (16, 4), (61, 7), (100, 9)]:
+        rounds = list(iter_swiss_rounds(num_teams, num_rounds))
+        assert len(rounds) == num_rounds
+        pairs = set()
+        byes = []
+        for rr_matches in rounds:
+            assert len(rr_matches) == num_teams // 2
+            teams = [team for match in rr_matches for team in match]
+            assert len(set(teams)) == len(teams)    # Every team plays at most once per round
+            byes.extend(set(range(num_teams)) - set(teams))
+            pairs.update(frozenset(match) for match in rr_matches)
+        assert len(pairs) == num_rounds * (num_teams // 2)  # No rematches
+        assert len(set(byes)) == len(byes)          # No team has two byes
+
+    # First round: top half against bottom half
+    assert [sorted(match) for match in next(iter_swiss_rounds(8, 1))] == [[0, 4], [1, 5], [2, 6], [3, 7]]
+
+def test_swiss_rounds_without_rematches_up_to_max_rounds():
+    for num_teams in list(range(2, 41)) + [64, 99]:
+        pairs = set()
+        num_matches = 0
+        for rr_matches in iter_swiss_rounds(num_teams, max_swiss_rounds(num_teams)):
+            pairs.update(frozenset(match) for match in rr_matches)
+            num_matches += len(rr_matches)
+        assert len(pairs) == num_matches
+
+def test_create_swiss_rounds():
+    teams = [Team(f"t{i}", "#FFFFFF", None) for i in range(6)]
+    rounds = create_swiss_rounds(Category("A", "1", "3", teams, mode="swiss"))
+    assert len(rounds) == 3
+    assert all(match.team1 in teams and match.team2 in teams for rr in rounds for match in rr)
+
+    # More rounds than max_swiss_rounds are limited
+    rounds = create_swiss_rounds(Category("A", "1", "5", teams[:4], mode="swiss"))
+    assert len(rounds) == 2
+
+def test_model_reports_swiss_categories_with_too_many_rounds():
+    test_model = Model()
+    test_model.set_categories([
+        Category("A", "1", 4, [Team(f"a{i}", "#FFFFFF", None) for i in range(8)], mode="swiss"),
+        Category("B", "1", 5, [Team(f"b{i}", "#FFFFFF", None) for i in range(8)], mode="swiss"),
+        Category("C", "1", 5, [Team(f"c{i}", "#FFFFFF", None) for i in range(8)])
+    ])
+    assert test_model.get_swiss_categories_with_too_many_rounds() == ["B"]
+
+def test_create_schedule_swiss():
+    test_model = Model()
+    test_model.set_days([0, 1])
+    test_model.set_categories([
+        Category("Open", "1", 5, [Team(f"o{i}", "#FFFFFF", None) for i in range(64)], mode="swiss"),
+        Category("A", "1", 1, [Team(f"a{i}", "#FFFFFF", None) for i in range(4)])
+    ])
+    test_model.set_group_info({"1": {"match_dur": 10, "num_fields": 6, "double_missions": "empty_field"}})
+    test_model.set_other_events({})
+    with contextlib.redirect_stdout(io.StringIO()):
+        tournament = create_schedule(test_model)
+
+    open_matches = [m for day in tournament for ev in day.get_all_valid_events() if isinstance(ev, MatchEvent)
+                    for m in ev.matches if m.team1.name.startswith("o")]
+    assert len(open_matches) == 5 * 32
+    for team in test_model.get_categories()[0].teams:
+        assert sum(1 for m in open_matches if team in (m.team1, m.team2)) == 5
+    assert len({frozenset((m.team1.name, m.team2.name)) for m in open_matches}) == len(open_matches)
+
+def test_category_mode_round_trip():
+    cat = Category("Open", "1", "5", [Team("a", "#FFFFFF", None)], mode="swiss")
+    assert Category.from_dict(cat.to_dict()) == cat
+    assert Category.from_dict({"name": "A", "group": "1", "runs": "1"}).mode == "round_robin"
+
+def test_swiss_rounds_are_not_rotated_across_days(create_teams):
+    teams = create_teams(10)
+    cat = CategoryRun.from_category(Category("Open", "1", "4", teams, mode="swiss"))
+    prepare_category(cat, 2, True)
+
+    assert len(cat.matches) == 20
+    assert len({frozenset((m.team1.id, m.team2.id)) for m in cat.matches}) == 20
+    assert cat.rr_runs == create_swiss_rounds(cat)
+
+def test_create_schedule_swiss_with_fewer_rounds_than_days():
+    test_model = Model()
+    test_model.set_days([0, 1, 2, 3])
+    test_model.set_categories([
+        Category("Open", "1", 3, [Team(f"o{i}", "#FFFFFF", None) for i in range(20)], mode="swiss"),
+        Category("A", "1", 2, [Team(f"a{i}", "#FFFFFF", None) for i in range(6)])
+    ])
+    test_model.set_group_info({"1": {"match_dur": 10, "num_fields": 4, "double_missions": "empty_field"}})
+    test_model.set_other_events({})
+    with contextlib.redirect_stdout(io.StringIO()):
+        tournament = create_schedule(test_model)
+
+    names = [m.team1.name[0] for day in tournament for ev in day.get_all_valid_events() if isinstance(ev, MatchEvent)
+             for m in ev.matches]
+    assert names.count("o") == 3 * 10
+    assert names.count("a") == 30
@@ -0,0 +1,77 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../src/')))
+
+import numpy as np
+
+from core import Category, Team, Match, MatchEvent, OtherEvent, EventBlock, EventDay
+from model.model import Model
+from utils.scheduler.scheduler import create_schedule
+from utils.tourn_stats.schedule_metrics import compute_schedule_metrics
+
+
+def test_compute_schedule_metrics(create_teams):
+    a, b, c, d = create_teams(4)
+    pause = OtherEvent(5, "Pause", False, None, 0, None, None)
+    lunch = OtherEvent(30, "Lunch", False, None, 0, "after", 1)
+    day1 = EventDay([
+        EventBlock([MatchEvent(10, [Match(a, b), Match(c, d)]),
+                    MatchEvent(10, [Match(a, c)]),              # a back-to-back
+                    pause,
+                    MatchEvent(10, [Match(d, a)])]),
+        EventBlock([MatchEvent(10, []), lunch, MatchEvent(10, [Match(b, d)])])
+    ])
+    day2 = EventDay([EventBlock([MatchEvent(12, [Match(b, c)])])])
+    metrics = compute_schedule_metrics([day1, day2])
+
+    assert metrics.num_teams == 4
+    assert list(metrics.home) == [2, 2, 1, 1]
+    assert list(metrics.away) == [1, 1, 2, 2]
+    # a: 0-10, 10-20, 25-35. d: 0-10, 25-35, 75-85
+    assert list(metrics.num_gaps) == [2, 1, 1, 2]
+    assert list(metrics.back_to_backs) == [1, 0, 1, 0]
+    assert list(metrics.min_rest) == [0, 65, 0, 15]
+    assert list(metrics.longest_idle) == [5, 65, 0, 40]
+    assert list(metrics.min_rest_slots) == [0, 5, 0, 2]
+    assert metrics.mean_rest[a.id] == 2.5
+    assert metrics.field_counts.tolist() == [[3, 0], [3, 0], [2, 1], [2, 1]]
+    assert list(metrics.day_durations) == [85, 12]
+    assert np.allclose(metrics.block_utilisation[0], [4 / 6, 1 / 2])
+    assert metrics.num_pauses == 1
+    assert metrics.num_empty_events == 1
+
+    summary = metrics.summarize([a.id, b.id])
+    assert summary.num_teams == 2
+    assert summary.num_matches == 6
+    assert summary.min_rest == 0
+    assert summary.mean_rest == 70 / 3
+    assert summary.longest_idle == 65
+    assert summary.back_to_backs == 1
+    assert summary.home_away_imbalance == 2
+
+    groups = metrics.summarize_groups([Category("A", "1", 1, [a, b]), Category("B", "2", 1, [c, d])])
+    assert groups["1"] == summary
+    assert groups["2"].back_to_backs == 1
+
+def test_compute_schedule_metrics_empty():
+    metrics = compute_schedule_metrics([])
+    assert metrics.num_teams == 0
+    summary = metrics.summarize([])
+    assert summary.min_rest is None and summary.mean_rest is None
+    assert summary.longest_idle == 0
+
+def test_schedule_metrics_after_category_edit():
+    test_model = Model()
+    test_model.set_days([0])
+    teams = [Team(f"a{i}", "#FFFFFF", None) for i in range(4)]
+    test_model.set_categories([Category("A", "1", 1, teams)])
+    test_model.set_group_info({"1": {"match_dur": 10, "num_fields": 1}})
+    test_model.set_tournament_generated(create_schedule(test_model))
+    before = compute_schedule_metrics(test_model.get_tournament_generated()).summarize(team.id for team in teams)
+
+    new_team = Team("new", "#FFFFFF", None)
+    test_model.set_categories([Category("A", "1", 1, [new_team, *teams])])
+    metrics = compute_schedule_metrics(test_model.get_tournament_generated())
+    assert metrics.summarize(team.id for team in teams) == before
+    assert metrics.plays_all(team.id for team in teams)
+    assert not metrics.plays_all(team.id for team in [new_team, *teams])